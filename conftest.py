@@ -0,0 +1,2 @@
+# Berada di root repositori agar pytest menambahkan folder ini ke sys.path,
+# sehingga paket `diabetes` dapat diimpor tanpa instalasi.
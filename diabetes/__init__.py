@@ -0,0 +1 @@
+"""Utilitas pipeline klasifikasi diabetes (BRFSS2015)."""
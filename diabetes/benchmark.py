@@ -0,0 +1,267 @@
+"""Benchmark per tahap pipeline `main.py` pada data sintetis berbentuk BRFSS.
+
+Setiap ukuran data (`--rows 250k 1M 10M`) dijalankan dengan urutan tahap yang
+sama seperti `main.py`: muat CSV, hapus duplikat, statistik IQR, Isolation
+Forest, `StandardScaler`, SMOTE, fit dan predict (diukur terpisah) setiap
+model baseline dari `diabetes.modeling`, satu trial `XGBoostCVObjective`,
+serta fit dan skoring model akhir. Waktu dinding dan puncak RSS setiap tahap
+dicatat.
+
+Data dibangkitkan oleh `diabetes.synthetic` dan disimpan di `--workdir`
+(dipakai ulang bila sudah ada), sehingga benchmark berjalan tanpa internet
+dan hanya memakai CPU. Setiap hasil ditambahkan ke file riwayat JSON beserta
+commit git, versi pustaka, dan jumlah core; hasil dibandingkan dengan entri
+terakhir untuk ukuran yang sama dan tahap yang melambat lebih dari
+`--threshold` ditandai sebagai regresi.
+
+    python -m diabetes.benchmark --rows 250k 1M
+    python -m diabetes.benchmark --rows 10M --skip K-Nearest_Neighbour
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+import sklearn
+import xgboost as xgb
+from sklearn.model_selection import train_test_split
+
+from diabetes import modeling, preprocessing
+from diabetes.dedup import deduplicate
+from diabetes.loader import load_brfss
+from diabetes.memory import MemoryReport
+from diabetes.stats import iqr_summary
+from diabetes.synthetic import TARGET, parse_rows, write_synthetic_csv
+from diabetes.training import is_single_core
+
+DEFAULT_HISTORY = os.path.join("benchmarks", "history.json")
+
+# Parameter tetap pengganti hasil tuning agar waktu antar versi sebanding.
+BENCHMARK_PARAMS = {
+    "n_estimators": 200,
+    "max_depth": 7,
+    "learning_rate": 0.15,
+    "subsample": 0.85,
+    "colsample_bytree": 0.85,
+}
+
+
+class StageTimer:
+    """Catat waktu dinding dan puncak RSS setiap tahap ke dict `stages`."""
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.stages = {}
+        self.memory = MemoryReport(verbose=False)
+
+    def run(self, stage, fn, *args, **kwargs):
+        self.memory.checkpoint("sebelum " + stage)
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.record(stage, time.perf_counter() - start)
+        return result
+
+    def record(self, stage, seconds):
+        peak = self.memory.checkpoint(stage)["peak_rss_mb"]
+        self.stages[stage] = {"seconds": seconds, "peak_rss_mb": peak}
+        if self.verbose:
+            print(f"  {stage:<34} {seconds:>9.2f} s   puncak {peak:>9,.1f} MB")
+
+
+def dataset_path(workdir, n_rows, random_state=0):
+    """CSV sintetis untuk `n_rows` baris; dibangkitkan sekali lalu dipakai ulang."""
+    os.makedirs(workdir, exist_ok=True)
+    path = os.path.join(workdir, f"synthetic_{n_rows}_{random_state}.csv")
+    if not os.path.exists(path):
+        write_synthetic_csv(path + ".tmp", n_rows, random_state)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def run_benchmark(csv_path, skip=(), random_state=42, verbose=True):
+    """Jalankan seluruh tahap pada `csv_path` dan kembalikan dict waktu per tahap."""
+    timer = StageTimer(verbose)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        df = timer.run("csv_load", load_brfss, csv_path, cache_dir=cache_dir)
+        dedup = timer.run("dedup", deduplicate, df, target=TARGET)
+        timer.run("iqr_stats", iqr_summary, dedup.frame)
+
+        X = dedup.frame.drop(columns=[TARGET])
+        y = dedup.frame[TARGET]
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=random_state)
+
+        scores = timer.run("isolation_forest", preprocessing.score_outliers, X_train, random_state=random_state)
+        clean = preprocessing.remove_outliers(X_train, y_train, scores["anomaly_scores"], contamination=0.075)
+        scaled = timer.run("standard_scaler", preprocessing.scale_features, clean["X_train_clean"], X_test)
+        balanced = timer.run(
+            "smote", preprocessing.oversample, scaled["X_train_scaled"], clean["y_train_clean"], random_state=random_state
+        )
+        X_train_final = balanced["X_train_final"]
+        y_train_final = balanced["y_train_final"]
+        X_test_scaled = scaled["X_test_scaled"]
+
+        n_cpus = os.cpu_count() or 1
+        for name, model in modeling.baseline_models().items():
+            if name in skip:
+                continue
+            if not is_single_core(model):
+                model.set_params(n_jobs=n_cpus)
+            timer.run(f"fit:{name}", model.fit, X_train_final, y_train_final)
+            timer.run(f"predict:{name}", model.predict, X_test_scaled)
+
+        if "xgb_cv" not in skip:
+            objective = modeling.tuning_objective(X_train_final, y_train_final, random_state, n_jobs=n_cpus)
+            timer.run("xgb_cv", objective.evaluate, BENCHMARK_PARAMS)
+
+        best_model = modeling.final_model(BENCHMARK_PARAMS).set_params(n_jobs=n_cpus)
+        timer.run("best_model_fit", best_model.fit, X_train_final, y_train_final)
+        timer.run("best_model_scoring", best_model.predict_proba, X_test_scaled)
+
+    return {
+        "n_rows_raw": int(len(df)),
+        "n_rows_train": int(len(X_train_final)),
+        "stages": timer.stages,
+        "total_seconds": sum(stage["seconds"] for stage in timer.stages.values()),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "xgboost": xgb.__version__,
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def append_history(path, record):
+    history = load_history(path)
+    history.append(record)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump(history, f, indent=2)
+    os.replace(path + ".tmp", path)
+    return history
+
+
+def previous_run(history, n_rows):
+    """Entri riwayat terakhir dengan ukuran data yang sama, atau `None`."""
+    for record in reversed(history):
+        if record["n_rows"] == n_rows:
+            return record
+    return None
+
+
+def compare_runs(current, previous, threshold=0.1, min_seconds=0.05):
+    """Rasio waktu per tahap terhadap run sebelumnya.
+
+    Tahap dianggap regresi bila rasionya > `1 + threshold` dan selisihnya
+    lebih dari `min_seconds`, agar tahap yang sangat singkat tidak berisik.
+    """
+    rows = []
+    for stage, result in current["stages"].items():
+        before = previous["stages"].get(stage) if previous else None
+        ratio = result["seconds"] / before["seconds"] if before and before["seconds"] > 0 else None
+        rows.append(
+            {
+                "stage": stage,
+                "seconds": result["seconds"],
+                "previous": before["seconds"] if before else None,
+                "ratio": ratio,
+                "regression": ratio is not None
+                and ratio > 1 + threshold
+                and result["seconds"] - before["seconds"] > min_seconds,
+            }
+        )
+    return rows
+
+
+def print_comparison(rows):
+    for row in rows:
+        if row["ratio"] is None:
+            print(f"  {row['stage']:<34} {row['seconds']:>9.2f} s")
+            continue
+        flag = "  REGRESI" if row["regression"] else ""
+        print(
+            f"  {row['stage']:<34} {row['seconds']:>9.2f} s   sebelumnya {row['previous']:>9.2f} s"
+            f"   x{row['ratio']:.2f}{flag}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark per tahap pipeline pada data sintetis BRFSS.")
+    parser.add_argument("--rows", nargs="+", default=["250k", "1M", "10M"], help="ukuran data, mis. 250k 1M 10M")
+    parser.add_argument("--workdir", default=os.path.join(".cache", "benchmark"), help="folder CSV sintetis")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="file riwayat JSON")
+    parser.add_argument("--skip", nargs="*", default=[], help="tahap yang dilewati (nama model atau xgb_cv)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="perlambatan relatif yang dianggap regresi")
+    parser.add_argument("--random-state", type=int, default=42)
+    parser.add_argument("--no-history", action="store_true", help="jangan tulis ke file riwayat")
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    env = environment()
+    regressions = 0
+    for rows in args.rows:
+        n_rows = parse_rows(rows)
+        print(f"== {n_rows:,} baris ==")
+        start = time.perf_counter()
+        csv_path = dataset_path(args.workdir, n_rows)
+        print(f"  {'(bangkitkan/temukan data)':<34} {time.perf_counter() - start:>9.2f} s")
+
+        result = run_benchmark(csv_path, skip=set(args.skip), random_state=args.random_state)
+        record = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "n_rows": n_rows,
+            **env,
+            **result,
+        }
+        previous = previous_run(history, n_rows)
+        comparison = compare_runs(record, previous, args.threshold)
+        if previous:
+            print(f"-- dibandingkan dengan {previous['timestamp']} (commit {previous.get('commit')}) --")
+            print_comparison(comparison)
+        print(f"  {'total':<34} {result['total_seconds']:>9.2f} s")
+        regressions += sum(row["regression"] for row in comparison)
+
+        if not args.no_history:
+            history = append_history(args.history, record)
+        else:
+            history.append(record)
+
+    if regressions:
+        print(f"{regressions} tahap melambat lebih dari {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Bundle model satu file dengan waktu muat dingin yang cepat.
+
+Tata letak file (semua bagian disejajarkan ke 64 byte):
+
+    magic "DIABBNDL" | versi (uint32) | panjang header (uint32)
+    header JSON      : fitur, threshold, offset array & booster, sha256
+    array numerik    : mean/scale/var StandardScaler, pohon yang diratakan
+                       (`diabetes.forest`) dengan threshold di ruang fitur
+                       mentah (`diabetes.folding`), dsb. (little-endian)
+    booster XGBoost  : model dalam format UBJSON
+
+Array numerik dibaca langsung dari `mmap` tanpa menyalin, booster dimuat dari
+buffer memori, dan checksum sha256 dihitung atas seluruh bagian setelah
+header. Modul ini tidak mengimpor xgboost kecuali booster benar-benar dipakai,
+sehingga proses skoring yang memakai `bundle.forest` tidak memerlukannya.
+
+    python -m diabetes.bundle models/diabetes_xgb.bundle   # verifikasi & ukur waktu muat
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import statistics
+import struct
+import time
+
+import numpy as np
+
+from diabetes.folding import fold_forest
+from diabetes.forest import ARRAY_PREFIX, FlatForest
+
+MAGIC = b"DIABBNDL"
+# Versi 2: array `forest_*` berada di ruang fitur mentah (scaler sudah dilipat).
+FORMAT_VERSION = 2
+PREAMBLE = struct.Struct("<8sII")
+ALIGN = 64
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+class BundleError(ValueError):
+    pass
+
+
+class ModelBundle:
+    """Booster XGBoost, parameter preprocessing, urutan fitur, dan threshold."""
+
+    def __init__(self, booster_raw, arrays, features, threshold=0.5, meta=None, version=FORMAT_VERSION):
+        self.booster_raw = booster_raw
+        self.arrays = arrays
+        self.features = list(features)
+        self.threshold = threshold
+        self.meta = meta or {}
+        self.version = version
+        self._booster = None
+
+    @classmethod
+    def from_model(cls, booster, scaler, features, threshold=0.5, **meta):
+        arrays = {
+            "scaler_mean": scaler.mean_,
+            "scaler_scale": scaler.scale_,
+            "scaler_var": scaler.var_,
+            "scaler_n_samples_seen": np.atleast_1d(scaler.n_samples_seen_),
+            **fold_forest(FlatForest.from_booster(booster), scaler.mean_, scaler.scale_, features).to_arrays(),
+        }
+        import xgboost as xgb
+
+        meta = {"xgboost_version": xgb.__version__, **meta}
+        return cls(booster.save_raw(raw_format="ubj"), arrays, features, threshold, meta)
+
+    @property
+    def booster(self):
+        if self._booster is None:
+            import xgboost as xgb
+
+            self._booster = xgb.Booster()
+            self._booster.load_model(bytearray(self.booster_raw))
+        return self._booster
+
+    @property
+    def forest(self):
+        """`FlatForest` yang menerima fitur mentah (tanpa normalisasi)."""
+        if self.version < 2 or ARRAY_PREFIX + "roots" not in self.arrays:
+            return fold_forest(FlatForest.from_booster(self.booster), self.mean, self.scale, self.features)
+        return FlatForest.from_arrays(self.arrays)
+
+    @property
+    def mean(self):
+        return self.arrays["scaler_mean"]
+
+    @property
+    def scale(self):
+        return self.arrays["scaler_scale"]
+
+    @property
+    def scaler(self):
+        """`StandardScaler` dengan statistik berjalan, siap untuk `partial_fit`."""
+        from sklearn.preprocessing import StandardScaler
+
+        scaler = StandardScaler()
+        scaler.mean_ = np.array(self.mean, dtype=np.float64)
+        scaler.scale_ = np.array(self.scale, dtype=np.float64)
+        scaler.var_ = np.array(self.arrays["scaler_var"], dtype=np.float64)
+        scaler.n_samples_seen_ = np.int64(self.arrays["scaler_n_samples_seen"][0])
+        scaler.n_features_in_ = len(self.features)
+        return scaler
+
+    def save(self, path):
+        arrays = {}
+        for name, values in self.arrays.items():
+            values = np.asarray(values)
+            arrays[name] = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+
+        layout = {}
+        offset = 0
+        for name, values in arrays.items():
+            layout[name] = {
+                "dtype": values.dtype.str,
+                "shape": list(values.shape),
+                "offset": offset,
+                "nbytes": values.nbytes,
+            }
+            offset = _aligned(offset + values.nbytes)
+        booster_offset = offset
+
+        payload = bytearray(booster_offset + len(self.booster_raw))
+        for name, values in arrays.items():
+            entry = layout[name]
+            payload[entry["offset"] : entry["offset"] + entry["nbytes"]] = values.tobytes()
+        payload[booster_offset:] = self.booster_raw
+
+        header = {
+            "features": self.features,
+            "threshold": self.threshold,
+            "arrays": layout,
+            "booster": {"format": "ubj", "offset": booster_offset, "nbytes": len(self.booster_raw)},
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "meta": self.meta,
+        }
+        header_bytes = json.dumps(header).encode()
+        payload_start = _aligned(PREAMBLE.size + len(header_bytes))
+        header_bytes = header_bytes.ljust(payload_start - PREAMBLE.size, b" ")
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, verify=True):
+        """Muat bundle; array numerik dibuka memory-mapped (read-only)."""
+        with open(path, "rb") as f:
+            magic, version, header_len = PREAMBLE.unpack(f.read(PREAMBLE.size))
+            if magic != MAGIC:
+                raise BundleError(f"'{path}' bukan bundle model diabetes")
+            if version > FORMAT_VERSION:
+                raise BundleError(f"Versi bundle {version} tidak didukung (maks {FORMAT_VERSION})")
+            header = json.loads(f.read(header_len))
+            payload_start = PREAMBLE.size + header_len
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        payload = memoryview(buffer)[payload_start:]
+        if verify and hashlib.sha256(payload).hexdigest() != header["sha256"]:
+            raise BundleError(f"Checksum bundle '{path}' tidak cocok")
+
+        arrays = {
+            name: np.ndarray(
+                tuple(entry["shape"]),
+                dtype=np.dtype(entry["dtype"]),
+                buffer=buffer,
+                offset=payload_start + entry["offset"],
+            )
+            for name, entry in header["arrays"].items()
+        }
+        booster = header["booster"]
+        booster_raw = payload[booster["offset"] : booster["offset"] + booster["nbytes"]]
+        return cls(booster_raw, arrays, header["features"], header["threshold"], header["meta"], version)
+
+
+def save_bundle(path, booster, scaler, features, threshold=0.5, **meta):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    ModelBundle.from_model(booster, scaler, features, threshold, **meta).save(path)
+
+
+def load_bundle(path, verify=True):
+    return ModelBundle.load(path, verify=verify)
+
+
+def measure_load_time(path, repeat=20, verify=True):
+    """Waktu muat dingin bundle hingga booster siap dipakai (milidetik)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        bundle = load_bundle(path, verify=verify)
+        bundle.booster
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifikasi bundle dan ukur waktu muatnya.")
+    parser.add_argument("path")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.path)
+    print(f"Fitur      : {len(bundle.features)}")
+    print(f"Threshold  : {bundle.threshold}")
+    print(f"Pohon      : {bundle.forest.n_trees} (kedalaman maks {bundle.forest.depth})")
+    for verify in (True, False):
+        timing = measure_load_time(args.path, repeat=args.repeat, verify=verify)
+        label = "dengan checksum" if verify else "tanpa checksum"
+        print(
+            f"Waktu muat ({label}): median {timing['median_ms']:.2f} ms, "
+            f"min {timing['min_ms']:.2f} ms, maks {timing['max_ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Cache artefak tahap preprocessing yang dialamatkan berdasarkan konten.
+
+Kunci cache setiap tahap adalah fingerprint dari kode fungsi tahap beserta
+modul-modul paket yang dipakainya (`hashing.code_sources`), seluruh
+masukannya, parameternya, dan versi pustaka yang relevan. Keluaran tahap
+(dict nama -> objek) disimpan di `<root>/<stage>/<key>/`:
+
+- `np.ndarray`, `pd.DataFrame`, dan `pd.Series` disimpan sebagai `.npy` dan
+  dibuka kembali secara memory-mapped (read-only);
+- objek lain (mis. transformer yang sudah di-fit) disimpan dengan joblib.
+
+Cache dapat dimatikan dengan variabel lingkungan `DIABETES_CACHE=0`.
+"""
+
+import json
+import os
+import shutil
+
+import imblearn
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+import xgboost
+
+from diabetes.hashing import code_sources, fingerprint
+
+CACHE_VERSION = 2
+
+
+def _save_array(path, name, values):
+    np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(values), allow_pickle=False)
+    return f"{name}.npy"
+
+
+def _load_array(path, file_name):
+    return np.load(os.path.join(path, file_name), mmap_mode="r")
+
+
+def _save_output(path, name, value):
+    if isinstance(value, pd.DataFrame) and len(set(value.dtypes)) <= 1:
+        return {
+            "type": "DataFrame",
+            "values": _save_array(path, name, value.to_numpy()),
+            "index": _save_array(path, f"{name}.index", value.index.to_numpy()),
+            "index_name": value.index.name,
+            "columns": [str(col) for col in value.columns],
+        }
+    if isinstance(value, pd.Series):
+        return {
+            "type": "Series",
+            "values": _save_array(path, name, value.to_numpy()),
+            "index": _save_array(path, f"{name}.index", value.index.to_numpy()),
+            "index_name": value.index.name,
+            "name": value.name,
+        }
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        return {"type": "ndarray", "values": _save_array(path, name, value)}
+    joblib.dump(value, os.path.join(path, f"{name}.joblib"))
+    return {"type": "joblib", "file": f"{name}.joblib"}
+
+
+def _load_output(path, entry):
+    kind = entry["type"]
+    if kind == "DataFrame":
+        index = pd.Index(_load_array(path, entry["index"]), name=entry["index_name"])
+        return pd.DataFrame(
+            _load_array(path, entry["values"]),
+            index=index,
+            columns=entry["columns"],
+            copy=False,
+        )
+    if kind == "Series":
+        index = pd.Index(_load_array(path, entry["index"]), name=entry["index_name"])
+        return pd.Series(
+            _load_array(path, entry["values"]), index=index, name=entry["name"], copy=False
+        )
+    if kind == "ndarray":
+        return _load_array(path, entry["values"])
+    return joblib.load(os.path.join(path, entry["file"]))
+
+
+class ArtifactCache:
+    """Simpan dan muat ulang keluaran tahap pipeline berdasarkan hash masukannya."""
+
+    def __init__(self, root=os.path.join(".cache", "artifacts"), enabled=None):
+        self.root = root
+        if enabled is None:
+            enabled = os.environ.get("DIABETES_CACHE", "1") not in ("", "0")
+        self.enabled = enabled
+        self.hits = []
+        self.misses = []
+
+    def key(self, stage_fn, args, params):
+        return fingerprint(
+            CACHE_VERSION,
+            sklearn.__version__,
+            imblearn.__version__,
+            xgboost.__version__,
+            stage_fn,
+            code_sources(stage_fn),
+            args,
+            params,
+        )
+
+    def _path(self, stage, key):
+        return os.path.join(self.root, stage, key)
+
+    def contains(self, stage, key):
+        return os.path.exists(os.path.join(self._path(stage, key), "manifest.json"))
+
+    def load(self, stage, key):
+        path = self._path(stage, key)
+        try:
+            with open(os.path.join(path, "manifest.json")) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return {name: _load_output(path, entry) for name, entry in manifest.items()}
+
+    def save(self, stage, key, outputs):
+        path = self._path(stage, key)
+        tmp_path = path + ".tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        manifest = {name: _save_output(tmp_path, name, value) for name, value in outputs.items()}
+        with open(os.path.join(tmp_path, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+
+    def run(self, stage, stage_fn, *args, **params):
+        """Jalankan `stage_fn(*args, **params)` atau ambil hasilnya dari cache.
+
+        `stage_fn` harus mengembalikan dict nama -> keluaran. Keluaran yang
+        diambil dari cache berupa array memory-mapped (read-only).
+        """
+        if not self.enabled:
+            return stage_fn(*args, **params)
+        key = self.key(stage_fn, args, params)
+        outputs = self.load(stage, key)
+        if outputs is not None:
+            self.hits.append(stage)
+            return outputs
+        self.misses.append(stage)
+        self.save(stage, key, stage_fn(*args, **params))
+        return self.load(stage, key)
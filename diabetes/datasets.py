@@ -0,0 +1,173 @@
+"""Penyimpanan dataset lokal yang dialamatkan berdasarkan hash konten.
+
+File CSV disimpan sekali di `<root>/objects/<sha256>.csv` dan dicatat di
+`<root>/manifest.json` (nama file -> sha256, ukuran, waktu modifikasi).
+Selama file tercatat dan lolos verifikasi, tidak ada unduhan ulang maupun
+pemindahan file, sehingga pipeline juga dapat berjalan di host tanpa akses
+internet (air-gapped) setelah dataset diimpor sekali.
+
+Penggunaan dari command line:
+
+    python -m diabetes.datasets                  # unduh bila perlu
+    python -m diabetes.datasets --import DIR     # impor CSV dari folder lokal
+    python -m diabetes.datasets --verify         # verifikasi sha256 penuh
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+KAGGLE_HANDLE = "alexteboul/diabetes-health-indicators-dataset"
+
+VARIANTS = {
+    "binary": "diabetes_binary_health_indicators_BRFSS2015.csv",
+    "binary_5050": "diabetes_binary_5050split_health_indicators_BRFSS2015.csv",
+    "012": "diabetes_012_health_indicators_BRFSS2015.csv",
+}
+
+MANIFEST = "manifest.json"
+CHUNK_SIZE = 1 << 20
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DatasetStore:
+    """Registry dataset lokal dengan verifikasi checksum.
+
+    `offline=True` (atau variabel lingkungan `DIABETES_OFFLINE=1`) melarang
+    unduhan; file yang hilang atau rusak akan menghasilkan `FileNotFoundError`.
+    """
+
+    def __init__(self, root="diabetes_dataset", handle=KAGGLE_HANDLE, offline=None):
+        self.root = root
+        self.handle = handle
+        if offline is None:
+            offline = os.environ.get("DIABETES_OFFLINE", "") not in ("", "0")
+        self.offline = offline
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.root, MANIFEST)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"handle": self.handle, "files": {}}
+
+    def _write_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = os.path.join(self.root, MANIFEST + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, os.path.join(self.root, MANIFEST))
+
+    def _object_path(self, sha):
+        return os.path.join(self.objects_dir, f"{sha}.csv")
+
+    def verify(self, file_name, full=False):
+        """Periksa apakah `file_name` tersedia dan isinya sesuai manifest.
+
+        Pemeriksaan cepat hanya membandingkan ukuran dan waktu modifikasi;
+        sha256 dihitung ulang bila keduanya berbeda atau `full=True`.
+        """
+        entry = self.manifest["files"].get(file_name)
+        if entry is None:
+            return False
+        path = self._object_path(entry["sha256"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        if not full and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if sha256_file(path) != entry["sha256"]:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def add(self, src_path, file_name=None):
+        """Salin satu file ke penyimpanan dan catat hash kontennya."""
+        file_name = file_name or os.path.basename(src_path)
+        sha = sha256_file(src_path)
+        dst_path = self._object_path(sha)
+        if not os.path.exists(dst_path):
+            os.makedirs(self.objects_dir, exist_ok=True)
+            tmp_path = dst_path + ".tmp"
+            shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+        stat = os.stat(dst_path)
+        self.manifest["files"][file_name] = {
+            "sha256": sha,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        return dst_path
+
+    def import_dir(self, src_dir):
+        """Impor seluruh varian CSV BRFSS yang ada di `src_dir`."""
+        for file_name in sorted(os.listdir(src_dir)):
+            if file_name.endswith(".csv"):
+                self.add(os.path.join(src_dir, file_name), file_name)
+        self._write_manifest()
+
+    def missing(self, full=False):
+        return [name for name in VARIANTS.values() if not self.verify(name, full=full)]
+
+    def ensure(self, full=False):
+        """Pastikan ketiga varian CSV tersedia; unduh hanya jika perlu."""
+        missing = self.missing(full=full)
+        if missing:
+            if self.offline:
+                raise FileNotFoundError(
+                    f"Dataset tidak tersedia secara offline di '{self.root}': {missing}"
+                )
+            import kagglehub
+
+            self.import_dir(kagglehub.dataset_download(self.handle))
+            missing = self.missing(full=True)
+            if missing:
+                raise FileNotFoundError(f"Unduhan tidak memuat file: {missing}")
+        self._write_manifest()
+        return self.objects_dir
+
+    def recorded_sha256(self, variant="binary"):
+        """sha256 varian yang tercatat di manifest, tanpa verifikasi maupun unduhan (`None` bila belum ada)."""
+        entry = self.manifest["files"].get(VARIANTS.get(variant, variant))
+        return entry["sha256"] if entry else None
+
+    def path(self, variant="binary"):
+        """Path file CSV untuk varian `binary`, `binary_5050`, atau `012`."""
+        file_name = VARIANTS.get(variant, variant)
+        if not self.verify(file_name):
+            self.ensure()
+        return self._object_path(self.manifest["files"][file_name]["sha256"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default="diabetes_dataset")
+    parser.add_argument("--import", dest="import_dir", metavar="DIR")
+    parser.add_argument("--verify", action="store_true", help="verifikasi sha256 penuh")
+    parser.add_argument("--offline", action="store_true")
+    args = parser.parse_args(argv)
+
+    store = DatasetStore(args.root, offline=args.offline or None)
+    if args.import_dir:
+        store.import_dir(args.import_dir)
+    store.ensure(full=args.verify)
+    for variant, file_name in VARIANTS.items():
+        print(f"{variant:<12} {store.manifest['files'][file_name]['sha256']}  {store.path(variant)}")
+
+
+if __name__ == "__main__":
+    main()
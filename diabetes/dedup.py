@@ -0,0 +1,101 @@
+"""Deduplikasi baris berbasis kunci integer hasil packing mixed-radix.
+
+Karena setiap kolom BRFSS berupa integer kecil dengan domain terbatas, satu
+baris dapat dikodekan menjadi satu kunci `uint64`:
+
+    key = sum((x_j - min_j) * prod(radix_0 .. radix_{j-1}))
+
+dengan `radix_j = max_j - min_j + 1`. Deduplikasi kemudian cukup dilakukan
+dengan satu `np.unique` atas vektor kunci, bukan hashing tuple 22 kolom.
+"""
+
+import numpy as np
+import pandas as pd
+
+MAX_KEY = 2**64
+
+
+def radix_layout(values):
+    """Offset (nilai minimum) dan radix setiap kolom, atau `None` bila tidak muat.
+
+    `None` dikembalikan jika ada kolom non-integer atau perkalian seluruh
+    radix melebihi rentang `uint64`.
+    """
+    if values.dtype.kind not in "ui" or values.size == 0:
+        return None
+    offsets = values.min(axis=0).astype(np.int64)
+    radices = values.max(axis=0).astype(np.int64) - offsets + 1
+    capacity = 1
+    for radix in radices.tolist():
+        capacity *= radix
+    if capacity > MAX_KEY:
+        return None
+    return offsets, radices
+
+
+def pack_rows(values, offsets, radices):
+    """Kodekan setiap baris matriks integer menjadi satu kunci `uint64`."""
+    keys = np.zeros(len(values), dtype=np.uint64)
+    multiplier = 1
+    for j in range(values.shape[1]):
+        digit = (values[:, j].astype(np.int64) - offsets[j]).astype(np.uint64)
+        keys += digit * np.uint64(multiplier)
+        multiplier *= int(radices[j])
+    return keys
+
+
+def row_keys(values):
+    """Kunci per baris yang dapat diurutkan dan dibandingkan oleh `np.unique`.
+
+    Menggunakan packing mixed-radix bila memungkinkan; jika tidak, setiap
+    baris dipandang sebagai satu blok byte (`np.void`).
+    """
+    layout = radix_layout(values)
+    if layout is not None:
+        return pack_rows(values, *layout)
+    values = np.ascontiguousarray(values)
+    return values.view(np.dtype((np.void, values.dtype.itemsize * values.shape[1]))).ravel()
+
+
+class Deduplicated:
+    """Hasil `deduplicate`.
+
+    - `frame`: baris unik dalam urutan kemunculan pertama (setara dengan
+      `df.drop_duplicates()`, termasuk label indeksnya).
+    - `counts`: multiplisitas setiap baris unik, siap dipakai sebagai
+      `sample_weight` agar distribusi data asli tetap terwakili.
+    - `class_counts`: untuk setiap baris unik, jumlah baris asli dengan
+      nilai fitur yang sama pada tiap kelas target (hanya bila `target`
+      diberikan).
+    """
+
+    def __init__(self, frame, counts, class_counts=None):
+        self.frame = frame
+        self.counts = counts
+        self.class_counts = class_counts
+
+    @property
+    def n_duplicates(self):
+        return int(self.counts.sum() - len(self.counts))
+
+
+def deduplicate(df, target=None):
+    """Hapus baris duplikat pada `df` dengan satu `np.unique` atas kunci baris."""
+    values = df.to_numpy()
+    _, first, counts = np.unique(row_keys(values), return_index=True, return_counts=True)
+    order = np.argsort(first)
+    first = first[order]
+
+    frame = df.iloc[first]
+    weights = pd.Series(counts[order], index=frame.index, name="weight")
+    if target is None:
+        return Deduplicated(frame, weights)
+
+    classes, y = np.unique(df[target].to_numpy(), return_inverse=True)
+    features = df.drop(columns=[target]).to_numpy()
+    _, profile = np.unique(row_keys(features), return_inverse=True)
+    table = np.bincount(
+        profile * len(classes) + y, minlength=(profile.max() + 1) * len(classes)
+    ).reshape(-1, len(classes))
+    class_counts = pd.DataFrame(table[profile[first]], index=frame.index, columns=classes)
+    return Deduplicated(frame, weights, class_counts)
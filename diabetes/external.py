@@ -0,0 +1,399 @@
+"""Pelatihan XGBoost out-of-core dari shard Parquet/NPY di disk.
+
+Jalur `main.py` menyimpan seluruh data di pandas dan array NumPy padat,
+sehingga ukuran data dibatasi RAM. Modul ini melatih model setara
+`best_model` dari folder berisi shard tanpa pernah memuat seluruh data:
+
+- shard berupa file Parquet (`shard-00000.parquet`, kolom fitur + target)
+  atau pasangan NPY (`shard-00000.X.npy` uint8 dan `shard-00000.y.npy`);
+  Parquet dibaca per batch lewat `pyarrow`, NPY lewat memmap;
+- pembagian latih/uji ditentukan per baris oleh bilangan acak yang
+  diturunkan dari `(random_state, nomor shard)`, sehingga setiap lintasan
+  melihat pembagian yang sama tanpa menyimpan indeks;
+- lintasan pertama mengisi statistik `StandardScaler` dengan `partial_fit`;
+- `ShardIter` (turunan `xgboost.DataIter`) menormalisasi setiap batch ke
+  float32 dan meng-oversample-nya dengan `ChunkedSMOTE` (tetangga dicari di
+  dalam batch itu saja) tepat sebelum diserahkan ke XGBoost;
+- `xgboost.ExtMemQuantileDMatrix` menyimpan halaman histogram di
+  `cache_dir`, sehingga puncak memori ditentukan oleh `--batch-rows`, bukan
+  oleh jumlah baris.
+
+Penghapusan duplikat dan Isolation Forest memerlukan seluruh data sekaligus
+dan tidak dilakukan di jalur ini.
+
+    python -m diabetes.external shard shards/ --csv diabetes_dataset/diabetes_binary_health_indicators_BRFSS2015.csv
+    python -m diabetes.external shard shards_10M/ --synthetic 10M --format npy
+    python -m diabetes.external train shards/ --output models/diabetes_xgb_external.bundle
+    python -m diabetes.external benchmark shards/   # bandingkan dengan jalur in-memory
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import xgboost as xgb
+from sklearn.preprocessing import StandardScaler
+
+from diabetes import preprocessing
+from diabetes.bundle import save_bundle
+from diabetes.memory import PeakWatcher, rss_mb
+from diabetes.oversampling import ChunkedSMOTE
+from diabetes.schema import FEATURES, column_dtypes
+from diabetes.synthetic import iter_synthetic, parse_rows
+
+TARGET = "Diabetes_binary"
+
+DEFAULT_PARAMS = {
+    "n_estimators": 200,
+    "max_depth": 7,
+    "learning_rate": 0.15,
+    "subsample": 0.85,
+    "colsample_bytree": 0.85,
+}
+
+
+def shard_name(directory, index, fmt):
+    stem = os.path.join(directory, f"shard-{index:05d}")
+    return stem + ".parquet" if fmt == "parquet" else stem + ".X.npy"
+
+
+def write_shards(frames, directory, fmt="parquet", features=FEATURES, row_group_size=131_072):
+    """Tulis setiap DataFrame di `frames` sebagai satu shard; kembalikan daftar path."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, frame in enumerate(frames):
+        path = shard_name(directory, index, fmt)
+        if fmt == "parquet":
+            frame[features + [TARGET]].to_parquet(path, index=False, row_group_size=row_group_size)
+        else:
+            np.save(path, frame[features].to_numpy())
+            np.save(path[: -len(".X.npy")] + ".y.npy", frame[TARGET].to_numpy())
+        paths.append(path)
+    return paths
+
+
+def iter_csv(csv_path, rows_per_shard):
+    """Potongan CSV BRFSS dengan tipe kolom ringkas (lihat `diabetes.loader`)."""
+    for chunk in pd.read_csv(csv_path, dtype=np.float32, chunksize=rows_per_shard):
+        yield chunk.astype(column_dtypes(chunk.columns))
+
+
+def list_shards(directory):
+    """Path shard di `directory`, urut nama; Parquet diutamakan bila keduanya ada."""
+    paths = sorted(glob.glob(os.path.join(directory, "shard-*.parquet")))
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(directory, "shard-*.X.npy")))
+    if not paths:
+        raise FileNotFoundError(f"Tidak ada shard Parquet/NPY di {directory}")
+    return paths
+
+
+def shard_rows(path):
+    if path.endswith(".parquet"):
+        return pq.ParquetFile(path).metadata.num_rows
+    return np.load(path, mmap_mode="r").shape[0]
+
+
+def iter_shard(path, features=FEATURES, batch_rows=262_144):
+    """Batch `(X, y)` dari satu shard tanpa membaca shard sekaligus."""
+    if path.endswith(".parquet"):
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=batch_rows, columns=features + [TARGET]):
+            frame = batch.to_pandas()
+            yield frame[features].to_numpy(), frame[TARGET].to_numpy()
+        return
+    X = np.load(path, mmap_mode="r")
+    y = np.load(path[: -len(".X.npy")] + ".y.npy", mmap_mode="r")
+    for start in range(0, len(X), batch_rows):
+        yield np.asarray(X[start : start + batch_rows]), np.asarray(y[start : start + batch_rows])
+
+
+def test_mask(n_rows, shard_index, test_size=0.2, random_state=42):
+    """Penanda baris uji satu shard; sama di setiap lintasan dan untuk setiap `batch_rows`."""
+    return np.random.default_rng([random_state, shard_index]).random(n_rows) < test_size
+
+
+def iter_split(shards, subset="train", features=FEATURES, batch_rows=262_144, test_size=0.2, random_state=42):
+    """Batch `(X, y)` bagian `subset` (`"train"`/`"test"`) dari seluruh shard."""
+    for shard_index, path in enumerate(shards):
+        mask = test_mask(shard_rows(path), shard_index, test_size, random_state)
+        if subset == "train":
+            mask = ~mask
+        start = 0
+        for X, y in iter_shard(path, features, batch_rows):
+            keep = mask[start : start + len(X)]
+            start += len(X)
+            if keep.any():
+                yield X[keep], y[keep]
+
+
+def fit_scaler(shards, **split):
+    """`StandardScaler` atas seluruh baris latih, satu batch per `partial_fit`."""
+    scaler = StandardScaler()
+    for X, _ in iter_split(shards, "train", **split):
+        scaler.partial_fit(X)
+    return scaler
+
+
+def oversample_batch(X, y, random_state, k_neighbors=5):
+    """SMOTE di dalam satu batch; batch dengan kelas minoritas terlalu kecil dilewati."""
+    _, counts = np.unique(y, return_counts=True)
+    if len(counts) < 2 or counts.min() <= k_neighbors:
+        return X, y
+    smote = ChunkedSMOTE(k_neighbors=k_neighbors, random_state=random_state, dtype=X.dtype)
+    return smote.fit_resample(X, y)
+
+
+class ShardIter(xgb.DataIter):
+    """Pemasok batch latih ter-normalisasi (dan ter-oversample) untuk XGBoost.
+
+    XGBoost membaca iterator beberapa kali (sketsa kuantil lalu penulisan
+    halaman), jadi seed SMOTE setiap batch diturunkan dari nomor batchnya
+    agar setiap lintasan menghasilkan baris yang sama.
+    """
+
+    def __init__(self, shards, scaler, cache_prefix, oversample=True, dtype=np.float32, random_state=42, **split):
+        self.shards = shards
+        self.scaler = scaler
+        self.oversample = oversample
+        self.dtype = dtype
+        self.random_state = random_state
+        self.split = {"random_state": random_state, **split}
+        self._batches = None
+        self._index = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data):
+        if self._batches is None:
+            self._batches = iter_split(self.shards, "train", **self.split)
+        try:
+            X, y = next(self._batches)
+        except StopIteration:
+            return False
+        X = ((X - self.scaler.mean_) / self.scaler.scale_).astype(self.dtype)
+        if self.oversample:
+            X, y = oversample_batch(X, y, self.random_state + self._index)
+        self._index += 1
+        input_data(data=X, label=y)
+        return True
+
+    def reset(self):
+        self._batches = None
+        self._index = 0
+
+
+def booster_params(params, random_state=42, n_jobs=None):
+    """Parameter `XGBClassifier` (`n_estimators`, ...) sebagai parameter `xgb.train`."""
+    booster = {key: value for key, value in params.items() if key != "n_estimators"}
+    booster.update(objective="binary:logistic", eval_metric="logloss", tree_method="hist", seed=random_state)
+    if n_jobs:
+        booster["nthread"] = n_jobs
+    return booster
+
+
+def train_external(
+    shards,
+    params=DEFAULT_PARAMS,
+    batch_rows=262_144,
+    test_size=0.2,
+    oversample=True,
+    cache_dir=None,
+    random_state=42,
+    n_jobs=None,
+):
+    """Latih booster dari shard; cache halaman XGBoost ditulis ke `cache_dir` (folder sementara bila `None`)."""
+    split = {"batch_rows": batch_rows, "test_size": test_size}
+    start = time.perf_counter()
+    scaler = fit_scaler(shards, random_state=random_state, **split)
+    scale_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory(dir=cache_dir) as workdir:
+        iterator = ShardIter(
+            shards, scaler, os.path.join(workdir, "dtrain"), oversample, random_state=random_state, **split
+        )
+        start = time.perf_counter()
+        dtrain = xgb.ExtMemQuantileDMatrix(iterator, nthread=n_jobs)
+        prepare_time = time.perf_counter() - start
+        n_rows = dtrain.num_row()
+
+        start = time.perf_counter()
+        booster = xgb.train(
+            booster_params(params, random_state, n_jobs), dtrain, num_boost_round=params["n_estimators"]
+        )
+        fit_time = time.perf_counter() - start
+        del dtrain, iterator
+
+    return {
+        "booster": booster,
+        "scaler": scaler,
+        "params": dict(params),
+        "n_rows": n_rows,
+        "scale_time": scale_time,
+        "prepare_time": prepare_time,
+        "fit_time": fit_time,
+    }
+
+
+def load_split(shards, **split):
+    """Seluruh bagian latih dan uji sebagai array di memori (untuk jalur pembanding)."""
+    parts = {}
+    for subset in ("train", "test"):
+        batches = list(iter_split(shards, subset, **split))
+        parts[subset] = (np.concatenate([X for X, _ in batches]), np.concatenate([y for _, y in batches]))
+    return parts
+
+
+def train_in_memory(shards, params=DEFAULT_PARAMS, batch_rows=262_144, test_size=0.2, random_state=42, n_jobs=None):
+    """Jalur `main.py`: muat semua baris latih, normalisasi, SMOTE global, lalu `XGBClassifier.fit`."""
+    parts = load_split(shards, batch_rows=batch_rows, test_size=test_size, random_state=random_state)
+    X_train, y_train = parts["train"]
+    scaled = preprocessing.scale_features(X_train, X_train[:0], dtype=np.float32)
+    balanced = preprocessing.oversample(scaled["X_train_scaled"], y_train, random_state=random_state)
+    model = xgb.XGBClassifier(**params, eval_metric="logloss", random_state=random_state, n_jobs=n_jobs)
+    start = time.perf_counter()
+    model.fit(balanced["X_train_final"], balanced["y_train_final"])
+    return {
+        "booster": model.get_booster(),
+        "scaler": scaled["scaler"],
+        "params": dict(params),
+        "n_rows": len(balanced["X_train_final"]),
+        "fit_time": time.perf_counter() - start,
+    }
+
+
+def confusion_metrics(confusion):
+    """Accuracy dan F1 berbobot (seperti `f1_score(average="weighted")`) dari matriks konfusi 2x2."""
+    total = confusion.sum()
+    f1 = 0.0
+    for label in (0, 1):
+        tp = confusion[label, label]
+        predicted = confusion[:, label].sum()
+        actual = confusion[label, :].sum()
+        if tp:
+            f1 += actual * 2 * tp / (predicted + actual)
+    return {"accuracy": np.trace(confusion) / total, "f1": f1 / total}
+
+
+def evaluate(run, shards, threshold=0.5, **split):
+    """Metrik pada baris uji, diprediksi per batch tanpa menyimpan prediksi."""
+    scaler = run["scaler"]
+    confusion = np.zeros((2, 2), dtype=np.int64)
+    for X, y in iter_split(shards, "test", **split):
+        X = ((X - scaler.mean_) / scaler.scale_).astype(np.float32)
+        y_pred = (run["booster"].inplace_predict(X) >= threshold).astype(np.int64)
+        np.add.at(confusion, (np.asarray(y, dtype=np.int64), y_pred), 1)
+    return confusion_metrics(confusion)
+
+
+def measure(fn, *args, **kwargs):
+    """Jalankan `fn`, kembalikan hasilnya beserta waktu dinding, puncak RSS, dan RSS awal (MB)."""
+    gc.collect()
+    baseline = rss_mb()
+    watcher = PeakWatcher()
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    seconds = time.perf_counter() - start
+    return result, {"seconds": seconds, "peak_rss_mb": watcher.stop(), "baseline_rss_mb": baseline}
+
+
+def benchmark(shards, params=DEFAULT_PARAMS, batch_rows=262_144, test_size=0.2, random_state=42, n_jobs=None):
+    """Bandingkan jalur out-of-core dengan jalur in-memory pada shard dan pembagian yang sama.
+
+    Jalur out-of-core dijalankan lebih dulu agar memori yang masih dipegang
+    alokator setelah jalur in-memory tidak ikut terhitung.
+    """
+    split = {"batch_rows": batch_rows, "test_size": test_size, "random_state": random_state}
+    results = {}
+    for name, fn in (("out-of-core", train_external), ("in-memory", train_in_memory)):
+        run, stats = measure(fn, shards, params, n_jobs=n_jobs, **split)
+        results[name] = {**stats, "n_rows": run["n_rows"], **evaluate(run, shards, **split)}
+        del run
+    return results
+
+
+def _parse_params(text):
+    return {**DEFAULT_PARAMS, **json.loads(text)} if text else dict(DEFAULT_PARAMS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pelatihan XGBoost out-of-core dari shard Parquet/NPY.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    shard = commands.add_parser("shard", help="pecah CSV BRFSS atau data sintetis menjadi shard")
+    shard.add_argument("directory")
+    source = shard.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", help="CSV BRFSS sumber")
+    source.add_argument("--synthetic", help="jumlah baris sintetis, mis. 10M")
+    shard.add_argument("--format", choices=("parquet", "npy"), default="parquet")
+    shard.add_argument("--rows-per-shard", default="1M")
+    shard.add_argument("--random-state", type=int, default=0)
+
+    for name, help_text in (("train", "latih model dari shard"), ("benchmark", "bandingkan dengan jalur in-memory")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("directory")
+        command.add_argument("--params", help='JSON parameter XGBoost, mis. \'{"max_depth": 5}\'')
+        command.add_argument("--batch-rows", type=int, default=262_144, help="baris per batch yang diserahkan ke XGBoost")
+        command.add_argument("--test-size", type=float, default=0.2)
+        command.add_argument("--n-jobs", type=int)
+        command.add_argument("--random-state", type=int, default=42)
+    train = commands.choices["train"]
+    train.add_argument("--no-oversample", action="store_true", help="jangan terapkan SMOTE per batch")
+    train.add_argument("--cache-dir", help="folder induk cache halaman XGBoost (bawaan: folder sementara sistem)")
+    train.add_argument("--output", help="path bundle model")
+    args = parser.parse_args(argv)
+
+    if args.command == "shard":
+        rows_per_shard = parse_rows(args.rows_per_shard)
+        if args.csv:
+            frames = iter_csv(args.csv, rows_per_shard)
+        else:
+            frames = iter_synthetic(parse_rows(args.synthetic), args.random_state, chunk_size=rows_per_shard)
+        paths = write_shards(frames, args.directory, args.format)
+        print(f"{len(paths)} shard {args.format} ditulis ke {os.path.abspath(args.directory)}")
+        return
+
+    shards = list_shards(args.directory)
+    params = _parse_params(args.params)
+    split = {"batch_rows": args.batch_rows, "test_size": args.test_size, "random_state": args.random_state}
+    print(f"{len(shards)} shard, {sum(shard_rows(path) for path in shards):,} baris")
+
+    if args.command == "train":
+        run, stats = measure(
+            train_external,
+            shards,
+            params,
+            oversample=not args.no_oversample,
+            cache_dir=args.cache_dir,
+            n_jobs=args.n_jobs,
+            **split,
+        )
+        print(
+            f"Scaler {run['scale_time']:.2f} s, DMatrix {run['prepare_time']:.2f} s, fit {run['fit_time']:.2f} s "
+            f"({run['n_rows']:,} baris latih), puncak RSS {stats['peak_rss_mb']:,.1f} MB"
+        )
+        metrics = evaluate(run, shards, **split)
+        print(f"accuracy {metrics['accuracy']:.4f}   F1 {metrics['f1']:.4f}")
+        if args.output:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            save_bundle(args.output, run["booster"], run["scaler"], FEATURES, params=params, out_of_core=True)
+            print(f"Bundle disimpan ke {os.path.abspath(args.output)}")
+        return
+
+    results = benchmark(shards, params, n_jobs=args.n_jobs, **split)
+    print(f"{'Jalur':<12} {'Wall (s)':>9} {'RSS awal (MB)':>14} {'Puncak RSS (MB)':>16} {'Baris latih':>12} {'Accuracy':>9} {'F1':>7}")
+    for name, row in results.items():
+        print(
+            f"{name:<12} {row['seconds']:>9.2f} {row['baseline_rss_mb']:>14,.1f} {row['peak_rss_mb']:>16,.1f} "
+            f"{row['n_rows']:>12,} {row['accuracy']:>9.4f} {row['f1']:>7.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
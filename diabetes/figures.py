@@ -0,0 +1,261 @@
+"""Fungsi pembuat figur untuk seluruh visualisasi pada `main.py`.
+
+Setiap fungsi membangun `matplotlib.figure.Figure` secara langsung (tanpa
+state global pyplot) dan mengembalikannya, sehingga aman dijalankan di
+worker `PlotRenderer` maupun di proses utama dengan backend apa pun.
+"""
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+
+AGE_CATEGORIES = {
+    1: "18-24",
+    2: "25-29",
+    3: "30-34",
+    4: "35-39",
+    5: "40-44",
+    6: "45-49",
+    7: "50-54",
+    8: "55-59",
+    9: "60-64",
+    10: "65-69",
+    11: "70-74",
+    12: "75-79",
+    13: "80 or older",
+}
+
+
+def _grid(n_plots, num_cols=3):
+    num_rows = int(np.ceil(n_plots / num_cols))
+    fig = Figure(figsize=(20, 5 * num_rows))
+    axes = fig.subplots(nrows=num_rows, ncols=num_cols).flatten()
+    # Hapus subplot kosong jika ada
+    for j in range(n_plots, len(axes)):
+        fig.delaxes(axes[j])
+    return fig, axes
+
+
+def univariate_histograms(df, iqr_stats):
+    fig, axes = _grid(len(df.columns))
+
+    for i, col in enumerate(df.columns):
+        outlier_count = iqr_stats.loc[col, "outliers"]
+
+        sns.histplot(data=df, x=col, ax=axes[i], kde=True)
+        axes[i].set_title(f"Histogram {col}\nOutliers: {outlier_count}")
+        axes[i].set_xlabel("")
+        axes[i].set_ylabel("")
+        axes[i].set_xlim(iqr_stats.loc[col, "min"], iqr_stats.loc[col, "max"])
+        axes[i].set_ylim(0, df[col].value_counts().max() * 1.1)
+
+    fig.tight_layout()
+    return fig
+
+
+def gender_distribution(df):
+    df_diabetes = df[df["Diabetes_binary"] == 1]
+    df_no_diabetes = df[df["Diabetes_binary"] == 0]
+
+    fig = Figure(figsize=(20, 10))
+    ax1, ax2 = fig.subplots(1, 2, sharey=True)
+    ax1 = sns.countplot(data=df_no_diabetes, x="Sex", ax=ax1, palette="pastel")
+    ax1.set(title="Gender distribution for no-diabetes")
+    ax1.set_xticks([0, 1], ["Female", "Male"])
+
+    ax2 = sns.countplot(data=df_diabetes, x="Sex", ax=ax2, palette="pastel")
+    ax2.set(title="Gender distribution for diabetics")
+    ax2.set_xticks([0, 1], ["Female", "Male"])
+    return fig
+
+
+def age_distribution(df):
+    df_age = df[["Diabetes_binary", "Age"]].copy()
+    df_age["Age_Category"] = df_age["Age"].map(AGE_CATEGORIES)
+
+    fig = Figure(figsize=(14, 6))
+    ax = fig.subplots()
+    sns.countplot(
+        data=df_age,
+        x="Age_Category",
+        hue="Diabetes_binary",  # 1: diabetes, 0: tidak
+        order=list(AGE_CATEGORIES.values()),
+        palette="Set2",
+        ax=ax,
+    )
+    ax.set_title("Distribusi Kategori Usia Berdasarkan Status Diabetes")
+    ax.set_xlabel("Kategori Usia")
+    ax.set_ylabel("Jumlah")
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.legend(title="Diabetes", labels=["Tidak", "Ya"])
+
+    for p in ax.patches:
+        height = p.get_height()
+        if height > 0:
+            ax.text(
+                p.get_x() + p.get_width() / 2,
+                height + 1,
+                int(height),
+                ha="center",
+                va="bottom",
+                fontsize=9,
+            )
+
+    fig.tight_layout()
+    return fig
+
+
+def _label(ax, x, y, text, color, va="center"):
+    ax.text(
+        x,
+        y,
+        text,
+        ha="center",
+        va=va,
+        fontweight="bold",
+        color=color,
+        bbox=dict(facecolor="white", edgecolor=color, boxstyle="round,pad=0.3"),
+    )
+
+
+def bmi_distribution(df):
+    fig = Figure(figsize=(12, 10))
+    ax = fig.subplots()
+
+    sns.boxplot(
+        data=df,
+        x="Diabetes_binary",
+        y="BMI",
+        hue="Diabetes_binary",
+        palette="pastel",
+        ax=ax,
+        legend=False,
+    )
+
+    quartiles = df.groupby("Diabetes_binary")["BMI"].quantile([0.25, 0.5, 0.75]).unstack()
+    for xtick in quartiles.index:
+        for q, label in zip([0.25, 0.5, 0.75], ["Q1", "Median (Q2)", "Q3"]):
+            value = quartiles.loc[xtick, q]
+            _label(ax, xtick, value, f"{label}: {value:.1f}", "black")
+
+    for xtick in quartiles.index:
+        Q1, Q3 = quartiles.loc[xtick, [0.25, 0.75]]
+        IQR = Q3 - Q1
+        lower_limit = Q1 - 1.5 * IQR
+        upper_limit = Q3 + 1.5 * IQR
+        _label(ax, xtick, lower_limit, f"Lower: {lower_limit:.1f}", "blue")
+        _label(ax, xtick, upper_limit, f"Upper: {upper_limit:.1f}", "blue")
+
+    max_bmi = df.groupby("Diabetes_binary")["BMI"].max()
+    min_bmi = df.groupby("Diabetes_binary")["BMI"].min()
+
+    if not max_bmi.empty and not min_bmi.empty:
+        ax.plot([0, 1], [max_bmi[0], max_bmi[1]], color="orange", linestyle="--", label="Max BMI")
+        ax.plot([0, 1], [min_bmi[0], min_bmi[1]], color="purple", linestyle="--", label="Min BMI")
+
+        for xtick in max_bmi.index:
+            _label(ax, xtick, max_bmi[xtick], f"Max: {max_bmi[xtick]:.1f}", "orange", va="bottom")
+            _label(ax, xtick, min_bmi[xtick], f"Min: {min_bmi[xtick]:.1f}", "purple", va="top")
+
+    ax.set_title("BMI Distribution for Diabetics vs. Non-Diabetics")
+    ax.set_xlabel("Diabetes Binary")
+    ax.set_ylabel("BMI")
+    ax.set_xticks([0, 1], ["Non-Diabetic", "Diabetic"])
+    ax.legend()
+    return fig
+
+
+def correlation_heatmap(df):
+    fig = Figure(figsize=(20, 20))
+    ax = fig.subplots()
+    correlation = df.corr(numeric_only=True)
+    sns.heatmap(correlation, annot=True, fmt=".2f", cmap="coolwarm", square=True, ax=ax)
+    ax.set_title("Heatmap Korelasi antar Variabel")
+    return fig
+
+
+def outlier_boxplots(df, iqr_stats):
+    fig, axes = _grid(len(df.columns))
+
+    for i, col in enumerate(df.columns):
+        sns.boxplot(data=df, x=col, ax=axes[i])
+        axes[i].set_title(f"Boxplot {col}")
+        axes[i].set_xlabel("")
+
+        for name in ["Q1", "Q2", "Q3"]:
+            value = iqr_stats.loc[col, name]
+            axes[i].annotate(
+                f"{name}: {value:.2f}",
+                xy=(value, 0.25),
+                xytext=(value, 0.35),
+                arrowprops=dict(facecolor="black", shrink=0.05),
+            )
+
+    fig.tight_layout()
+    return fig
+
+
+def classification_report_confusion_matrix(classification_report, confusion_matrix, model_name):
+    fig = Figure(figsize=(16, 5))
+    axes = fig.subplots(1, 2)
+
+    # === Heatmap Classification Report (Test) ===
+    cr_test_df = pd.DataFrame(classification_report).T
+    cr_test_df = cr_test_df.iloc[:-1, :]
+    sns.heatmap(
+        cr_test_df,
+        annot=True,
+        fmt=".2f",
+        cmap="coolwarm",
+        linewidths=0.5,
+        ax=axes[0],
+        cbar=False,
+    )
+    axes[0].set_title(f"Classification Report (Test) - {model_name}", fontsize=12)
+    axes[0].set_ylabel("Classes", fontsize=10)
+    axes[0].set_xlabel("Metrics", fontsize=10)
+
+    # === Heatmap Confusion Matrix (Test) ===
+    sns.heatmap(confusion_matrix, annot=True, fmt="d", cmap="Blues", linewidths=0.5, ax=axes[1])
+    axes[1].set_title(f"Confusion Matrix (Test) - {model_name}", fontsize=12)
+    axes[1].set_xlabel("Predicted Label", fontsize=10)
+    axes[1].set_ylabel("True Label", fontsize=10)
+
+    fig.tight_layout()
+    return fig
+
+
+def optimization_history(scores):
+    iterations = list(range(1, len(scores) + 1))
+
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.plot(iterations, scores, marker="o", linestyle="--", color="blue")
+    ax.set_title("Bayesian Optimization: F1 Score vs Iterasi")
+    ax.set_xlabel("Iterasi")
+    ax.set_ylabel("F1 Score (Weighted)")
+    ax.grid(True)
+    ax.set_xticks(iterations)
+    fig.tight_layout()
+    return fig
+
+
+def feature_importance(importance_df, model_name, top_n=15):
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.barplot(
+        data=importance_df.head(top_n),
+        x="Importance",
+        y="Feature",
+        hue="Feature",
+        palette="viridis",
+        dodge=False,
+        legend=False,
+        ax=ax,
+    )
+    ax.set_title(f"Top {top_n} Feature Importance - {model_name}", fontsize=14)
+    ax.set_xlabel("Importance Score")
+    ax.set_ylabel("Feature")
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,65 @@
+"""Lipat `StandardScaler` ke dalam model agar inferensi bekerja pada kode mentah.
+
+Split pohon tidak berubah oleh transformasi monoton per fitur, dan model
+linear dapat menyerap transformasi afine. Setelah dilipat, skoring tidak
+perlu menghitung `(X - mean) / scale` lagi dan dapat langsung menerima
+matriks kode fitur uint8 hasil `load_brfss`, tanpa salinan float64 per batch.
+"""
+
+import copy
+
+import numpy as np
+
+from diabetes.forest import FlatForest
+from diabetes.schema import FEATURE_DOMAINS
+
+
+def raw_thresholds(feature, threshold, mean, scale, domains):
+    """Threshold split dalam ruang fitur mentah.
+
+    Untuk fitur berdomain integer, threshold menjadi `k - 0.5` dengan `k` kode
+    terkecil yang nilai terskalanya (dibulatkan ke float32 seperti XGBoost)
+    tidak lebih kecil dari threshold asal, sehingga setiap kode dalam domain
+    mengikuti cabang yang persis sama. Fitur tanpa domain memakai
+    `threshold * scale + mean`.
+    """
+    raw = (threshold.astype(np.float64) * scale[feature] + mean[feature]).astype(np.float32)
+    raw[~np.isfinite(threshold)] = np.inf
+    for j, domain in enumerate(domains):
+        if domain is None:
+            continue
+        nodes = (feature == j) & np.isfinite(threshold)
+        codes = np.arange(domain[0], domain[1] + 1)
+        scaled = ((codes - mean[j]) / scale[j]).astype(np.float32)
+        k = np.searchsorted(scaled, threshold[nodes], side="left")
+        raw[nodes] = domain[0] + k - 0.5
+    return raw
+
+
+def fold_forest(forest, mean, scale, features=None):
+    """Salinan `FlatForest` yang threshold-nya berada di ruang fitur mentah."""
+    mean = np.asarray(mean, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    domains = [FEATURE_DOMAINS.get(name) for name in features] if features is not None else [None] * len(mean)
+    return FlatForest(
+        forest.feature,
+        raw_thresholds(forest.feature, forest.threshold, mean, scale, domains),
+        forest.left,
+        forest.default_left,
+        forest.value,
+        forest.roots,
+        forest.base_margin,
+        forest.depth,
+    )
+
+
+def fold_linear(model, mean, scale):
+    """Salinan model linear (mis. `LogisticRegression`) untuk fitur mentah.
+
+    `w · (x - mean) / scale + b` = `(w / scale) · x + (b - w · mean / scale)`.
+    """
+    folded = copy.deepcopy(model)
+    coef = model.coef_ / scale
+    folded.coef_ = coef
+    folded.intercept_ = model.intercept_ - coef @ mean
+    return folded
@@ -0,0 +1,185 @@
+"""Inferensi pohon XGBoost berbasis array NumPy tanpa dependensi xgboost.
+
+Seluruh pohon booster diratakan ke array kontigu: indeks fitur, threshold,
+anak kiri (anak kanan selalu `kiri + 1` pada XGBoost), arah default untuk
+nilai hilang, dan nilai daun. Node daun menunjuk ke dirinya sendiri dengan
+threshold +inf sehingga tetap di tempat. Satu batch dievaluasi untuk semua
+pohon sekaligus, level demi level, sebanyak kedalaman pohon terdalam; tidak
+ada loop Python per baris maupun per pohon.
+
+Overhead per panggilan jauh lebih kecil daripada booster sehingga unggul
+untuk batch kecil (skoring online); untuk batch ribuan baris booster
+XGBoost yang multi-thread tetap lebih cepat.
+
+Perbandingan fitur dilakukan dalam float32 (`x < threshold`), sama seperti
+XGBoost, sehingga jalur setiap baris identik dengan booster dan
+probabilitasnya hanya berbeda karena urutan penjumlahan daun (~1e-7).
+
+    python -m diabetes.forest models/diabetes_xgb.bundle   # cocokkan & bandingkan latensi
+
+Forest di dalam bundle menerima kode fitur mentah (normalisasi sudah dilipat
+ke threshold), sedangkan booster menerima fitur ter-normalisasi. CLI ini
+membangkitkan kode mentah sesuai domain BRFSS (`diabetes.synthetic`), lalu
+memberi forest matriks mentah dan booster `(X - mean) / scale`.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ARRAY_PREFIX = "forest_"
+FIELDS = ("feature", "threshold", "left", "default_left", "value", "roots")
+
+
+def _base_margin(learner):
+    base_score = float(learner["learner_model_param"]["base_score"].strip("[]"))
+    if learner["objective"]["name"] in ("binary:logistic", "reg:logistic"):
+        return np.log(base_score / (1 - base_score))
+    return base_score
+
+
+class FlatForest:
+    """Ensemble pohon XGBoost biner sebagai array datar."""
+
+    def __init__(self, feature, threshold, left, default_left, value, roots, base_margin, depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.base_margin = np.float32(base_margin)
+        self.depth = int(depth)
+
+    @classmethod
+    def from_booster(cls, booster):
+        """Ratakan model JSON booster (hanya objektif biner, tanpa split kategorikal)."""
+        learner = json.loads(booster.save_raw(raw_format="json"))["learner"]
+        trees = learner["gradient_booster"]["model"]["trees"]
+
+        columns = {name: [] for name in FIELDS}
+        depth = 0
+        offset = 0
+        for tree in trees:
+            left = np.asarray(tree["left_children"], dtype=np.int32)
+            right = np.asarray(tree["right_children"], dtype=np.int32)
+            parents = np.asarray(tree["parents"], dtype=np.int64)
+            is_leaf = left == -1
+            if np.any(right[~is_leaf] != left[~is_leaf] + 1):
+                raise ValueError("Anak kanan pohon XGBoost diharapkan tepat setelah anak kiri")
+            node = np.arange(len(left), dtype=np.int32)
+
+            node_depth = np.zeros(len(left), dtype=np.int32)
+            for i in range(1, len(left)):
+                node_depth[i] = node_depth[parents[i]] + 1
+            depth = max(depth, int(node_depth.max()))
+
+            columns["feature"].append(np.where(is_leaf, 0, tree["split_indices"]).astype(np.int32))
+            columns["threshold"].append(np.where(is_leaf, np.inf, tree["split_conditions"]).astype(np.float32))
+            columns["left"].append(np.where(is_leaf, node, left) + offset)
+            columns["default_left"].append(is_leaf | np.asarray(tree["default_left"], dtype=bool))
+            columns["value"].append(np.where(is_leaf, tree["split_conditions"], 0).astype(np.float32))
+            columns["roots"].append(np.array([offset], dtype=np.int32))
+            offset += len(left)
+
+        arrays = {name: np.concatenate(parts) for name, parts in columns.items()}
+        return cls(**arrays, base_margin=_base_margin(learner), depth=depth)
+
+    def to_arrays(self):
+        arrays = {ARRAY_PREFIX + name: getattr(self, name) for name in FIELDS}
+        arrays[ARRAY_PREFIX + "base_margin"] = np.array([self.base_margin], dtype=np.float32)
+        arrays[ARRAY_PREFIX + "depth"] = np.array([self.depth], dtype=np.int32)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        return cls(
+            **{name: arrays[ARRAY_PREFIX + name] for name in FIELDS},
+            base_margin=arrays[ARRAY_PREFIX + "base_margin"][0],
+            depth=arrays[ARRAY_PREFIX + "depth"][0],
+        )
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def leaf_indices(self, X):
+        """Indeks node daun (baris x pohon) untuk matriks fitur float32 `X`."""
+        n_rows = len(X)
+        # Fitur disusun kolom-mayor agar nilai (baris, fitur) dapat diambil
+        # dengan satu `take` pada indeks datar `fitur * n_rows + baris`.
+        columns = np.ascontiguousarray(X.T).ravel()
+        row_offset = np.arange(n_rows, dtype=np.int32)[:, None]
+        node = np.broadcast_to(self.roots, (n_rows, self.n_trees)).copy()
+        has_missing = np.isnan(columns).any()
+        for _ in range(self.depth):
+            x = columns.take(self.feature.take(node) * n_rows + row_offset)
+            go_right = x >= self.threshold.take(node)
+            if has_missing:
+                go_right = np.where(np.isnan(x), ~self.default_left.take(node), go_right)
+            node = self.left.take(node) + go_right
+        return node
+
+    def predict_margin(self, X, block_size=512):
+        X = np.asarray(X, dtype=np.float32)
+        margin = np.empty(len(X), dtype=np.float32)
+        for start in range(0, len(X), block_size):
+            leaves = self.leaf_indices(X[start : start + block_size])
+            margin[start : start + block_size] = self.value.take(leaves).sum(axis=1) + self.base_margin
+        return margin
+
+    def inplace_predict(self, X):
+        """Probabilitas kelas positif; antarmuka sama dengan `Booster.inplace_predict`."""
+        return 1 / (1 + np.exp(-self.predict_margin(X)))
+
+
+def _import_time(module):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return time.perf_counter() - start
+
+
+def _latency_ms(predict, X, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        predict(X)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def main(argv=None):
+    from diabetes.bundle import load_bundle
+    from diabetes.synthetic import synthetic_brfss
+
+    parser = argparse.ArgumentParser(description="Bandingkan FlatForest dengan booster XGBoost.")
+    parser.add_argument("path", help="file bundle model")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.path)
+    forest, booster = bundle.forest, bundle.booster
+    X_raw = synthetic_brfss(args.rows, random_state=0)[bundle.features].to_numpy(dtype=np.float32)
+    X_scaled = ((X_raw - bundle.mean) / bundle.scale).astype(np.float32)
+
+    diff = np.abs(forest.inplace_predict(X_raw) - booster.inplace_predict(X_scaled)).max()
+    print(f"Pohon: {forest.n_trees}, kedalaman: {forest.depth}, selisih maks: {diff:.2e}")
+    print(f"{'batch':>8} {'forest ms':>10} {'booster ms':>11}")
+    for batch in (1, 16, 256, 4096):
+        print(
+            f"{batch:>8} {_latency_ms(forest.inplace_predict, X_raw[:batch], args.repeat):>10.3f} "
+            f"{_latency_ms(booster.inplace_predict, X_scaled[:batch], args.repeat):>11.3f}"
+        )
+    print(
+        f"Waktu import: diabetes.forest {_import_time('diabetes.forest'):.2f} s, "
+        f"xgboost {_import_time('xgboost'):.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Fingerprint (hash konten) untuk data dan parameter pipeline."""
+
+import hashlib
+import inspect
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+def _update(digest, obj):
+    if isinstance(obj, pd.DataFrame):
+        digest.update(b"DataFrame")
+        _update(digest, list(map(str, obj.columns)))
+        _update(digest, [str(dtype) for dtype in obj.dtypes])
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        digest.update(b"Series")
+        _update(digest, (str(obj.name), str(obj.dtype)))
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Index):
+        _update(digest, obj.to_numpy())
+    elif isinstance(obj, np.ndarray):
+        digest.update(b"ndarray")
+        _update(digest, (str(obj.dtype), obj.shape))
+        if obj.dtype.hasobject:
+            digest.update(pickle.dumps(obj.tolist(), protocol=4))
+        else:
+            digest.update(np.ascontiguousarray(obj).view(np.uint8).data)
+    elif isinstance(obj, dict):
+        digest.update(b"dict")
+        for key in sorted(obj, key=repr):
+            _update(digest, key)
+            _update(digest, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        digest.update(type(obj).__name__.encode())
+        digest.update(str(len(obj)).encode())
+        for item in obj:
+            _update(digest, item)
+    elif callable(obj) and hasattr(obj, "__qualname__"):
+        digest.update(f"{obj.__module__}.{obj.__qualname__}".encode())
+    elif obj is None or isinstance(obj, (bool, int, float, str, bytes, np.generic)):
+        digest.update(repr(obj).encode())
+    else:
+        digest.update(pickle.dumps(obj, protocol=4))
+    digest.update(b"|")
+
+
+PACKAGE = __name__.split(".")[0]
+
+
+def _package_module(obj):
+    """Modul paket `diabetes` tempat `obj` didefinisikan (atau `obj` sendiri bila modul)."""
+    name = obj.__name__ if inspect.ismodule(obj) else getattr(obj, "__module__", None)
+    if isinstance(name, str) and name.split(".")[0] == PACKAGE:
+        return sys.modules.get(name)
+    return None
+
+
+def _source(obj):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return None
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+_CONSTANT_TYPES = (type(None), bool, int, float, str, bytes, tuple, list, dict, frozenset)
+
+
+def code_sources(fn):
+    """Sumber `fn` beserta sumber kode lain yang dipakainya, transitif.
+
+    Di modul tempat `fn` didefinisikan, hanya fungsi, kelas, dan konstanta
+    yang benar-benar dirujuk (langsung maupun lewat helper) yang di-hash,
+    sehingga mengubah satu tahap di `diabetes.pipeline` tidak mengubah kunci
+    tahap lain. Modul paket lain yang dirujuk di-hash utuh, beserta modul
+    paket yang diimpornya, dan seterusnya. Dengan begitu perubahan helper
+    seperti `ChunkedSMOTE` atau `BruteIndex` ikut mengubah kunci tahap yang
+    memakainya. Hasilnya dict `nama -> sumber` yang dapat di-`fingerprint`.
+    """
+    own = getattr(fn, "__module__", None)
+    sources = {}
+    pending = []
+    functions = [fn]
+    while functions:
+        obj = functions.pop()
+        name = f"{own}.{getattr(obj, '__qualname__', obj)}"
+        if name in sources:
+            continue
+        sources[name] = _source(obj)
+        if inspect.isclass(obj):
+            functions += [value for value in vars(obj).values() if inspect.isfunction(value)]
+            continue
+        namespace = getattr(obj, "__globals__", {})
+        code = getattr(obj, "__code__", None)
+        for ref in sorted(_code_names(code)) if code is not None else ():
+            if ref not in namespace:
+                continue
+            value = namespace[ref]
+            if inspect.ismodule(value) or getattr(value, "__module__", own) != own:
+                pending.append(_package_module(value))
+            elif inspect.isfunction(value) or inspect.isclass(value):
+                functions.append(value)
+            elif isinstance(value, _CONSTANT_TYPES):
+                sources[f"{own}.{ref}"] = repr(value)
+    while pending:
+        module = pending.pop()
+        if module is None or module.__name__ in sources:
+            continue
+        sources[module.__name__] = _source(module)
+        pending += [_package_module(value) for value in vars(module).values()]
+    return sources
+
+
+def fingerprint(*objs):
+    """Hash sha256 (hex) yang stabil untuk kombinasi data dan parameter.
+
+    DataFrame/Series di-hash per baris dengan `pd.util.hash_pandas_object`,
+    array NumPy berdasarkan isi buffer-nya, sedangkan objek lain melalui
+    representasi atau pickle-nya.
+    """
+    digest = hashlib.sha256()
+    for obj in objs:
+        _update(digest, obj)
+    return digest.hexdigest()
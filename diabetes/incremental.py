@@ -0,0 +1,199 @@
+"""Pelatihan ulang inkremental (warm start) saat data survei BRFSS baru tiba.
+
+Alih-alih tuning 30 trial dan melatih ulang dari nol, mode ini:
+
+- memuat bundle model sebelumnya (`diabetes.bundle`), termasuk statistik
+  berjalan `StandardScaler` (mean, var, `n_samples_seen_`);
+- memperbarui scaler dengan `partial_fit` atas baris baru saja;
+- memindahkan threshold split booster lama ke ruang normalisasi yang baru
+  (lewat ruang fitur mentah, lihat `diabetes.folding.raw_thresholds`),
+  sehingga pohon lama tetap merutekan setiap kode fitur persis seperti
+  sebelumnya;
+- melanjutkan boosting (`xgb_model=`) beberapa ronde pada baris baru yang
+  sudah dinormalisasi dan di-oversample dengan SMOTE.
+
+Bila data dasar (`--base`) diberikan, model yang dilatih ulang penuh dengan
+parameter yang sama dibandingkan pada data uji yang sama, dan selisih
+accuracy/F1-nya dilaporkan untuk menentukan kapan rebuild penuh diperlukan.
+
+    python -m diabetes.incremental models/diabetes_xgb.bundle brfss_baru.csv \\
+        --base diabetes_dataset/diabetes_binary_health_indicators_BRFSS2015.csv \\
+        --rounds 50 --output models/diabetes_xgb_baru.bundle
+"""
+
+import argparse
+import copy
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from diabetes.bundle import load_bundle, save_bundle
+from diabetes.folding import raw_thresholds
+from diabetes.loader import load_brfss
+from diabetes.preprocessing import oversample
+from diabetes.schema import FEATURE_DOMAINS
+
+TARGET = "Diabetes_binary"
+
+
+def update_scaler(scaler, X_new, chunk_size=65_536):
+    """Salinan `scaler` yang statistik berjalannya sudah mencakup `X_new`."""
+    scaler = copy.deepcopy(scaler)
+    X_new = np.asarray(X_new)
+    for start in range(0, len(X_new), chunk_size):
+        scaler.partial_fit(X_new[start : start + chunk_size])
+    return scaler
+
+
+def rescale_booster(booster, old_mean, old_scale, new_mean, new_scale, features):
+    """Salinan booster dengan threshold split di ruang normalisasi baru."""
+    new_mean = np.asarray(new_mean, dtype=np.float64)
+    new_scale = np.asarray(new_scale, dtype=np.float64)
+    old_mean = np.asarray(old_mean, dtype=np.float64)
+    old_scale = np.asarray(old_scale, dtype=np.float64)
+    domains = [FEATURE_DOMAINS.get(name) for name in features]
+
+    model = json.loads(bytes(booster.save_raw(raw_format="json")))
+    for tree in model["learner"]["gradient_booster"]["model"]["trees"]:
+        internal = np.asarray(tree["left_children"]) != -1
+        feature = np.asarray(tree["split_indices"])[internal]
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float32)
+        raw = raw_thresholds(feature, conditions[internal], old_mean, old_scale, domains)
+        conditions[internal] = (raw.astype(np.float64) - new_mean[feature]) / new_scale[feature]
+        tree["split_conditions"] = conditions.astype(np.float64).tolist()
+
+    rescaled = xgb.Booster()
+    rescaled.load_model(bytearray(json.dumps(model).encode()))
+    return rescaled
+
+
+def _prepare(scaler, X, y, random_state):
+    stage = oversample(scaler.transform(np.asarray(X)), np.asarray(y), random_state=random_state)
+    return stage["X_train_final"], stage["y_train_final"]
+
+
+def _classifier(params, **overrides):
+    return xgb.XGBClassifier(**{**params, **overrides}, eval_metric="logloss")
+
+
+def warm_start(bundle, X_new, y_new, n_rounds=50, random_state=42):
+    """Lanjutkan boosting model di `bundle` dengan baris baru (kode fitur mentah)."""
+    scaler = update_scaler(bundle.scaler, X_new)
+    booster = rescale_booster(bundle.booster, bundle.mean, bundle.scale, scaler.mean_, scaler.scale_, bundle.features)
+    X_fit, y_fit = _prepare(scaler, X_new, y_new, random_state)
+
+    params = dict(bundle.meta.get("params", {}))
+    model = _classifier(params, n_estimators=n_rounds)
+    start = time.perf_counter()
+    model.fit(X_fit, y_fit, xgb_model=booster)
+    return {
+        "model": model,
+        "scaler": scaler,
+        "params": params,
+        "fit_time": time.perf_counter() - start,
+        "n_rows": len(X_fit),
+    }
+
+
+def full_retrain(params, X_train, y_train, random_state=42):
+    """Latih ulang dari nol (scaler baru + SMOTE + XGBoost) dengan `params` yang sama."""
+    scaler = update_scaler(StandardScaler(), X_train)
+    X_fit, y_fit = _prepare(scaler, X_train, y_train, random_state)
+    model = _classifier(params)
+    start = time.perf_counter()
+    model.fit(X_fit, y_fit)
+    return {
+        "model": model,
+        "scaler": scaler,
+        "params": params,
+        "fit_time": time.perf_counter() - start,
+        "n_rows": len(X_fit),
+    }
+
+
+def evaluate(run, X_test, y_test):
+    y_pred = run["model"].predict(run["scaler"].transform(np.asarray(X_test)))
+    return {
+        "accuracy": accuracy_score(y_test, y_pred),
+        "f1": f1_score(y_test, y_pred, average="weighted"),
+    }
+
+
+def compare(warm, full, X_test, y_test):
+    """Metrik kedua model dan selisihnya (warm start - latih ulang penuh)."""
+    warm_metrics = evaluate(warm, X_test, y_test)
+    full_metrics = evaluate(full, X_test, y_test)
+    return {
+        "warm_start": {**warm_metrics, "fit_time": warm["fit_time"]},
+        "full_retrain": {**full_metrics, "fit_time": full["fit_time"]},
+        "accuracy_delta": warm_metrics["accuracy"] - full_metrics["accuracy"],
+        "f1_delta": warm_metrics["f1"] - full_metrics["f1"],
+    }
+
+
+def _read_frame(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return load_brfss(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm start model XGBoost dengan data survei baru.")
+    parser.add_argument("bundle")
+    parser.add_argument("new_data", help="CSV/Parquet baris baru (kolom fitur + Diabetes_binary)")
+    parser.add_argument("--base", help="data lama; bila ada, bandingkan dengan latih ulang penuh")
+    parser.add_argument("--rounds", type=int, default=50, help="jumlah ronde boosting tambahan")
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--tolerance", type=float, default=0.005, help="batas penurunan F1 sebelum rebuild penuh disarankan")
+    parser.add_argument("--output", help="path bundle hasil warm start")
+    parser.add_argument("--random-state", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    bundle = load_bundle(args.bundle)
+    new = _read_frame(args.new_data)
+    X_new, X_test, y_new, y_test = train_test_split(
+        new[bundle.features].to_numpy(),
+        new[TARGET].to_numpy(),
+        test_size=args.test_size,
+        random_state=args.random_state,
+    )
+    print(f"Baris baru: {len(X_new)} latih, {len(X_test)} uji")
+
+    warm = warm_start(bundle, X_new, y_new, args.rounds, args.random_state)
+    print(f"Warm start         : +{args.rounds} ronde, fit {warm['fit_time']:.2f} s")
+
+    if args.base:
+        base = _read_frame(args.base)
+        X_all = np.concatenate([base[bundle.features].to_numpy(), X_new])
+        y_all = np.concatenate([base[TARGET].to_numpy(), y_new])
+        full = full_retrain(warm["params"], X_all, y_all, args.random_state)
+        print(f"Latih ulang penuh  : {len(X_all)} baris, fit {full['fit_time']:.2f} s")
+        report = compare(warm, full, X_test, y_test)
+        for name in ("warm_start", "full_retrain"):
+            metrics = report[name]
+            print(f"{name:<13} accuracy {metrics['accuracy']:.4f}   F1 {metrics['f1']:.4f}")
+        print(f"Selisih (warm - penuh): accuracy {report['accuracy_delta']:+.4f}, F1 {report['f1_delta']:+.4f}")
+        if report["f1_delta"] < -args.tolerance:
+            print("F1 turun melebihi toleransi: rebuild penuh (termasuk tuning) disarankan.")
+        else:
+            print("Warm start masih setara dengan latih ulang penuh.")
+    else:
+        metrics = evaluate(warm, X_test, y_test)
+        print(f"warm_start    accuracy {metrics['accuracy']:.4f}   F1 {metrics['f1']:.4f}")
+
+    if args.output:
+        meta = {key: value for key, value in bundle.meta.items() if key != "xgboost_version"}
+        meta["warm_start_rounds"] = meta.get("warm_start_rounds", 0) + args.rounds
+        save_bundle(args.output, warm["model"].get_booster(), warm["scaler"], bundle.features, bundle.threshold, **meta)
+        print(f"Bundle disimpan ke {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
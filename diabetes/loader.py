@@ -0,0 +1,106 @@
+"""Loader CSV BRFSS yang hemat memori dengan cache kolom ter-memory-map.
+
+CSV asli menyimpan setiap nilai sebagai float (`1.0`, `30.0`, ...), sehingga
+`pd.read_csv` biasa menghasilkan 22 kolom float64. Loader ini mengubah setiap
+kolom ke tipe unsigned integer terkecil (umumnya uint8) lalu menulis cache
+berupa satu file `.npy` per kolom. Pada pemanggilan berikutnya cache dibuka
+dengan `np.load(..., mmap_mode="r")` sehingga tidak ada parsing ulang dan
+halaman data hanya dimuat ketika benar-benar dibaca.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from diabetes.schema import column_dtypes, smallest_uint
+
+CACHE_VERSION = 1
+
+
+def _source_signature(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _compact_column(values, declared=None):
+    """Ubah satu kolom float32 menjadi tipe integer terkecil bila memungkinkan."""
+    if values.size == 0 or np.isnan(values).any():
+        return values
+    if values.min() < 0 or not np.array_equal(values, np.floor(values)):
+        return values
+    dtype = smallest_uint(values.max())
+    if declared is not None and declared.itemsize >= dtype.itemsize:
+        dtype = declared
+    return values.astype(dtype)
+
+
+def read_compact_csv(csv_path):
+    """Baca CSV BRFSS dan kembalikan DataFrame dengan tipe kolom yang ringkas."""
+    raw = pd.read_csv(csv_path, dtype=np.float32)
+    declared = column_dtypes(raw.columns)
+    return pd.DataFrame(
+        {
+            col: _compact_column(raw[col].to_numpy(), declared.get(col))
+            for col in raw.columns
+        }
+    )
+
+
+def _cache_path(csv_path, cache_dir):
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), ".cache")
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, stem)
+
+
+def _read_meta(cache_path):
+    try:
+        with open(os.path.join(cache_path, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(df, cache_path, signature):
+    tmp_path = cache_path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    for i, col in enumerate(df.columns):
+        np.save(os.path.join(tmp_path, f"{i:03d}.npy"), df[col].to_numpy())
+    meta = {
+        "version": CACHE_VERSION,
+        "source": signature,
+        "columns": list(df.columns),
+        "rows": len(df),
+    }
+    with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    shutil.rmtree(cache_path, ignore_errors=True)
+    os.replace(tmp_path, cache_path)
+
+
+def _open_cache(cache_path, meta):
+    columns = {
+        col: np.load(os.path.join(cache_path, f"{i:03d}.npy"), mmap_mode="r")
+        for i, col in enumerate(meta["columns"])
+    }
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_brfss(csv_path, cache_dir=None, refresh=False):
+    """Muat CSV BRFSS sebagai DataFrame bertipe ringkas.
+
+    Cache ditulis ke `cache_dir` (default: folder `.cache` di samping CSV) dan
+    dianggap valid selama ukuran serta waktu modifikasi CSV tidak berubah.
+    Kolom yang dikembalikan dari cache bersifat read-only (memory-mapped).
+    """
+    cache_path = _cache_path(csv_path, cache_dir)
+    signature = _source_signature(csv_path)
+    meta = None if refresh else _read_meta(cache_path)
+    if meta is None or meta.get("version") != CACHE_VERSION or meta.get("source") != signature:
+        _write_cache(read_compact_csv(csv_path), cache_path, signature)
+        meta = _read_meta(cache_path)
+    return _open_cache(cache_path, meta)
@@ -0,0 +1,133 @@
+"""Generator beban lokal untuk `diabetes.server`.
+
+Membuka sejumlah koneksi keep-alive bersamaan; setiap koneksi mengirim
+`POST /predict` satu rekaman secara berurutan. Rekaman diambil dari CSV
+dataset (bila diberikan) atau dibangkitkan acak dari domain fitur di
+`diabetes.schema`. Di akhir dicetak throughput, latensi sisi klien, dan
+histogram ukuran batch dari `GET /metrics` server, sehingga trade-off
+throughput/latensi untuk berbagai `--max-wait-ms` dapat dibandingkan.
+
+    python -m diabetes.loadgen --url http://127.0.0.1:8000 --concurrency 64 --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from diabetes.schema import FEATURE_DOMAINS, FEATURES
+
+
+def random_records(n, random_state=0):
+    rng = np.random.default_rng(random_state)
+    columns = {
+        name: rng.integers(low, high + 1, size=n) for name, (low, high) in FEATURE_DOMAINS.items()
+    }
+    return pd.DataFrame(columns).to_dict("records")
+
+
+def dataset_records(csv_path, n, random_state=0):
+    df = pd.read_csv(csv_path, usecols=FEATURES)
+    return df.sample(n=min(n, len(df)), random_state=random_state).to_dict("records")
+
+
+async def request(reader, writer, host, method, path, payload=None):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def worker(host, port, records, counter, n_requests, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < n_requests:
+            record = records[counter[0] % len(records)]
+            counter[0] += 1
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, "POST", "/predict", record)
+            if status != 200:
+                raise RuntimeError(f"Server membalas status {status}")
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        writer.close()
+
+
+async def run_load(url, records, n_requests=10_000, concurrency=32):
+    """Kirim `n_requests` permintaan lewat `concurrency` koneksi; kembalikan ringkasan."""
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    counter = [0]
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(worker(host, port, records, counter, n_requests, latencies) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, server_metrics = await request(reader, writer, host, "GET", "/metrics")
+    writer.close()
+
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "client_p50_ms": float(np.percentile(latencies, 50)),
+        "client_p99_ms": float(np.percentile(latencies, 99)),
+        "server": server_metrics,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator beban untuk server prediksi diabetes.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--data", help="CSV dataset sebagai sumber rekaman (default: acak)")
+    args = parser.parse_args(argv)
+
+    if args.data:
+        records = dataset_records(args.data, args.requests)
+    else:
+        records = random_records(min(args.requests, 10_000))
+    result = asyncio.run(run_load(args.url, records, args.requests, args.concurrency))
+
+    server = result["server"]
+    print(f"Permintaan   : {result['requests']:,} ({result['concurrency']} koneksi)")
+    print(f"Throughput   : {result['throughput']:,.0f} permintaan/detik")
+    print(f"Latensi klien: p50 {result['client_p50_ms']:.2f} ms, p99 {result['client_p99_ms']:.2f} ms")
+    print(
+        f"Latensi server: p50 {server['latency_ms']['p50']:.2f} ms, "
+        f"p99 {server['latency_ms']['p99']:.2f} ms (max wait {server['max_wait_ms']:g} ms)"
+    )
+    print(
+        f"Ukuran batch : p50 {server['batch_size']['p50']:.0f}, p99 {server['batch_size']['p99']:.0f}"
+    )
+    for bucket, count in server["batch_size"]["buckets"].items():
+        if count:
+            print(f"  {bucket:>6} : {count:,}")
+    if server.get("cache"):
+        print(f"Cache hit rate: {server['cache']['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
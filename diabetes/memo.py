@@ -0,0 +1,135 @@
+"""Cache prediksi berkunci vektor fitur yang di-pack menjadi satu integer.
+
+Ke-21 fitur BRFSS berupa kode integer berdomain kecil, sehingga satu baris
+dapat dikodekan menjadi satu kunci `uint64` dengan packing mixed-radix
+(`diabetes.dedup.pack_rows`) memakai domain tetap dari `diabetes.schema`.
+Probabilitas yang sudah pernah dihitung disimpan di tabel hash
+*set-associative* berbasis array NumPy: setiap kunci dipetakan ke satu set
+berisi `ways` slot, sehingga lookup satu batch cukup berupa satu gather dan
+satu perbandingan vektor. Bila set penuh, slot yang paling lama tidak
+dipakai (LRU per set) ditimpa; memori tetap dibatasi `capacity` entri.
+
+Hanya baris yang belum ada di cache (dan sudah dideduplikasi dalam batch)
+yang dikirim ke model.
+"""
+
+import numpy as np
+
+from diabetes.dedup import pack_rows
+from diabetes.schema import FEATURE_DOMAINS
+
+EMPTY = np.uint64(2**64 - 1)
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+class PredictionCache:
+    """Memoisasi `predict_fn(X) -> probabilitas` untuk matriks fitur mentah."""
+
+    def __init__(self, predict_fn, features, capacity=2**20, ways=8):
+        self.predict_fn = predict_fn
+        self.features = list(features)
+        domains = np.array([FEATURE_DOMAINS[name] for name in self.features], dtype=np.int64)
+        self.low, self.high = domains[:, 0], domains[:, 1]
+        self.radices = self.high - self.low + 1
+
+        self.ways = ways
+        self.n_sets = 1 << max(int(np.ceil(np.log2(max(capacity // ways, 1)))), 0)
+        self.shift = np.uint64(64 - max(int(np.log2(self.n_sets)), 1))
+        self.keys = np.full((self.n_sets, ways), EMPTY, dtype=np.uint64)
+        self.values = np.zeros((self.n_sets, ways), dtype=np.float32)
+        self.last_used = np.zeros((self.n_sets, ways), dtype=np.int64)
+        self.clock = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.evaluated = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self):
+        return self.keys.size
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses + self.uncacheable
+        return self.hits / lookups if lookups else 0.0
+
+    def cacheable(self, X):
+        """Baris yang seluruh nilainya kode integer di dalam domain skema."""
+        valid = ((X >= self.low) & (X <= self.high)).all(axis=1)
+        if X.dtype.kind == "f":
+            valid &= (X == np.floor(X)).all(axis=1)
+        return valid
+
+    def set_index(self, keys):
+        if self.n_sets == 1:
+            return np.zeros(len(keys), dtype=np.intp)
+        return ((keys * GOLDEN) >> self.shift).astype(np.intp)
+
+    def lookup(self, keys):
+        """(hit, nilai) untuk setiap kunci; menandai slot yang kena sebagai baru dipakai."""
+        sets = self.set_index(keys)
+        match = self.keys[sets] == keys[:, None]
+        hit = match.any(axis=1)
+        way = match.argmax(axis=1)
+        self.last_used[sets[hit], way[hit]] = self.clock
+        return hit, self.values[sets, way]
+
+    def insert(self, keys, values):
+        """Sisipkan kunci unik; bentrok set dalam satu batch diselesaikan per putaran."""
+        sets = self.set_index(keys)
+        for _ in range(self.ways):
+            if not len(keys):
+                break
+            _, first = np.unique(sets, return_index=True)
+            victim = self.last_used[sets[first]].argmin(axis=1)
+            self.evictions += int(np.count_nonzero(self.keys[sets[first], victim] != EMPTY))
+            self.keys[sets[first], victim] = keys[first]
+            self.values[sets[first], victim] = values[first]
+            self.last_used[sets[first], victim] = self.clock
+            rest = np.ones(len(keys), dtype=bool)
+            rest[first] = False
+            keys, values, sets = keys[rest], values[rest], sets[rest]
+
+    def predict(self, X):
+        self.clock += 1
+        proba = np.empty(len(X), dtype=np.float32)
+        valid = self.cacheable(X)
+        n_uncacheable = len(X) - int(np.count_nonzero(valid))
+        if n_uncacheable:
+            proba[~valid] = self.predict_fn(X[~valid])
+            self.uncacheable += n_uncacheable
+            self.evaluated += n_uncacheable
+
+        rows = np.flatnonzero(valid)
+        keys = pack_rows(X[rows], self.low, self.radices)
+        hit, cached = self.lookup(keys)
+        proba[rows[hit]] = cached[hit]
+
+        miss = rows[~hit]
+        n_evaluated = 0
+        if len(miss):
+            miss_keys, first, inverse = np.unique(keys[~hit], return_index=True, return_inverse=True)
+            computed = np.asarray(self.predict_fn(X[miss[first]]), dtype=np.float32)
+            proba[miss] = computed[inverse]
+            self.insert(miss_keys, computed)
+            n_evaluated = len(first)
+        # Baris kembar dalam batch yang sama juga tidak dievaluasi ulang,
+        # sehingga ikut dihitung sebagai hit.
+        self.hits += len(rows) - n_evaluated
+        self.misses += n_evaluated
+        self.evaluated += n_evaluated
+        return proba
+
+    def report(self):
+        return {
+            "capacity": self.capacity,
+            "entries": int(np.count_nonzero(self.keys != EMPTY)),
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "evaluated": self.evaluated,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,112 @@
+"""Pelaporan penggunaan memori (RSS) per tahap pipeline.
+
+`MemoryReport.checkpoint(stage)` mencetak RSS saat ini dan puncak RSS sejak
+checkpoint sebelumnya. Di Linux puncak per tahap diukur dari `VmHWM` di
+`/proc/self/status`, yang di-reset setiap checkpoint lewat
+`/proc/self/clear_refs`; di platform lain dipakai `ru_maxrss` (puncak sejak
+proses dimulai).
+
+Mode hemat memori diaktifkan dengan `DIABETES_LEAN=1`: seluruh tahap
+memakai float32 (uint8 untuk data yang belum diskalakan) dan data antara
+dilepas segera setelah tahap berikutnya memakainya.
+"""
+
+import os
+import resource
+import sys
+
+
+def lean_mode():
+    return os.environ.get("DIABETES_LEAN", "0") not in ("", "0")
+
+
+def _status_mb(field):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _clear_peak():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Puncak RSS proses (MB) sejak dimulai."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def rss_mb():
+    """RSS proses saat ini (MB), atau puncak RSS bila tidak tersedia."""
+    current = _status_mb("VmRSS")
+    return current if current is not None else peak_rss_mb()
+
+
+# Pengamat puncak yang sedang aktif. `VmHWM` hanya satu per proses, jadi
+# sebelum di-reset nilainya dilipat ke setiap pengamat agar pengamat yang
+# bersarang (mis. tahap profiler di dalam checkpoint memori) tetap benar.
+_WATCHERS = []
+
+
+def _fold_peak():
+    current = _status_mb("VmHWM")
+    if current is not None:
+        for watcher in _WATCHERS:
+            watcher.peak = max(watcher.peak, current)
+    return current
+
+
+class PeakWatcher:
+    """Puncak RSS (MB) sejak pengamat dibuat hingga `stop()`.
+
+    Di Linux diukur dari `VmHWM` yang di-reset lewat `/proc/self/clear_refs`;
+    di platform lain dipakai `ru_maxrss` (puncak sejak proses dimulai).
+    """
+
+    def __init__(self):
+        self.peak = 0.0
+        _fold_peak()
+        self.per_stage = _clear_peak()
+        _WATCHERS.append(self)
+
+    def stop(self):
+        current = _fold_peak() if self.per_stage else None
+        if self in _WATCHERS:
+            _WATCHERS.remove(self)
+        if current is None:
+            self.peak = peak_rss_mb()
+        return self.peak
+
+
+class MemoryReport:
+    """Catat dan cetak RSS serta puncak RSS setiap tahap."""
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.stages = []
+        self._watcher = PeakWatcher()
+
+    def checkpoint(self, stage):
+        entry = {
+            "stage": stage,
+            "rss_mb": rss_mb(),
+            "peak_rss_mb": self._watcher.stop(),
+        }
+        self.stages.append(entry)
+        self._watcher = PeakWatcher()
+        if self.verbose:
+            print(
+                f"[memori] {stage:<24} RSS {entry['rss_mb']:>9,.1f} MB   "
+                f"puncak tahap {entry['peak_rss_mb']:>9,.1f} MB"
+            )
+        return entry
@@ -0,0 +1,85 @@
+"""Definisi model dan konfigurasi tuning yang dipakai bersama.
+
+`main.py`, `diabetes.pipeline`, dan `diabetes.benchmark` mengambil model
+baseline, ruang pencarian Bayesian Optimization, konfigurasi objektif
+cross-validation, dan model akhir dari modul ini, sehingga perubahan
+eksperimen cukup dilakukan di satu tempat.
+"""
+
+import os
+
+from sklearn.linear_model import LogisticRegression
+from xgboost import XGBClassifier
+
+from diabetes.neighbors import FastKNeighborsClassifier
+from diabetes.tuning import BatchBayesianOptimization, XGBoostCVObjective
+
+PBOUNDS = {
+    "n_estimators": (100, 300),
+    "max_depth": (3, 10),
+    "learning_rate": (0.01, 0.2),
+    "subsample": (0.6, 1.0),
+    "colsample_bytree": (0.6, 1.0),
+}
+
+TUNING_CONFIG = {
+    "cv": 3,
+    "scoring": "f1_weighted",
+    "early_stopping_rounds": 20,
+    "pruning": "median",
+}
+
+
+def baseline_models():
+    """Tiga model baseline yang dibandingkan sebelum tuning (instance baru setiap panggilan)."""
+    return {
+        "Logistic_Regression": LogisticRegression(C=1, solver="liblinear", max_iter=200),
+        "K-Nearest_Neighbour": FastKNeighborsClassifier(n_neighbors=10, weights="distance"),
+        "XGBoost": XGBClassifier(eval_metric="mlogloss"),
+    }
+
+
+def tuning_workers():
+    """Jumlah kandidat yang dievaluasi bersamaan (`DIABETES_TUNING_WORKERS`, default `min(4, core)`)."""
+    return int(os.environ.get("DIABETES_TUNING_WORKERS", min(4, os.cpu_count() or 1)))
+
+
+def xgb_threads(workers):
+    """Thread XGBoost per worker tuning agar total thread tidak melebihi jumlah core."""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def tuning_objective(X, y, random_state=42, n_jobs=None):
+    return XGBoostCVObjective(X, y, random_state=random_state, n_jobs=n_jobs, **TUNING_CONFIG)
+
+
+def tune_xgboost(X, y, init_points=5, n_iter=25, random_state=42, workers=None, verbose=2):
+    """Jalankan Bayesian Optimization atas `PBOUNDS` dan kembalikan optimizer-nya."""
+    workers = workers or tuning_workers()
+    optimizer = BatchBayesianOptimization(
+        f=tuning_objective(X, y, random_state, xgb_threads(workers)),
+        pbounds=PBOUNDS,
+        random_state=random_state,
+        n_workers=workers,
+        verbose=verbose,
+    )
+    return optimizer.maximize(init_points=init_points, n_iter=n_iter)
+
+
+def best_params(optimizer):
+    """Parameter trial terbaik untuk model akhir.
+
+    Skor CV setiap trial berasal dari booster yang berhenti di
+    `best_iteration` (early stopping), jadi `n_estimators` model akhir
+    adalah rata-rata `best_iteration + 1` antar fold trial tersebut, bukan
+    batas atas yang diusulkan optimizer.
+    """
+    trial = optimizer.best_trial()
+    params = {name: float(trial[name]) for name in PBOUNDS}
+    params["n_estimators"] = int(trial.get("best_n_estimators", params["n_estimators"]))
+    params["max_depth"] = int(params["max_depth"])
+    return params
+
+
+def final_model(params):
+    return XGBClassifier(**params, eval_metric="logloss")
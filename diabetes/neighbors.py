@@ -0,0 +1,209 @@
+"""Pencarian tetangga terdekat cepat untuk baseline K-Nearest Neighbour.
+
+`FastKNeighborsClassifier` adalah pengganti `KNeighborsClassifier` (jarak
+Euclidean) yang memanfaatkan sifat data BRFSS:
+
+- Titik latih kembar digabung menjadi satu titik unik beserta jumlah per
+  kelas (multiplisitas), begitu pula baris uji kembar, sehingga jarak hanya
+  dihitung antar titik unik.
+- Jarak dihitung per blok dengan satu GEMM float32 `[q, 1] @ [-2t; |t|^2]`.
+  Batas atas jarak tetangga ke-k diambil dari sampel acak titik latih, lalu
+  hanya kandidat di bawah batas tersebut yang dihitung ulang secara eksak
+  dalam float64. Pemilihan kandidat memakai minimum per grup kolom
+  (`group_size` kolom berjarak tetap) sehingga tidak ada `argpartition`
+  atas seluruh matriks jarak.
+- Blok kueri dijalankan paralel di thread pool (`n_jobs`) dengan ukuran
+  blok dibatasi `block_bytes` per thread.
+- Opsional, `n_cells` mengaktifkan indeks aproksimasi: titik latih
+  dikelompokkan dengan k-means, dan setiap kueri hanya dicari pada
+  `n_probe` sel terdekat dari sel tempatnya berada.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from threadpoolctl import threadpool_limits
+
+
+def _unique_rows(values):
+    """Baris unik, indeks kebalikan, dan jumlah kemunculan setiap baris unik."""
+    values = np.ascontiguousarray(values)
+    view = values.view(np.dtype((np.void, values.dtype.itemsize * values.shape[1]))).ravel()
+    _, first, inverse, counts = np.unique(view, return_index=True, return_inverse=True, return_counts=True)
+    return values[first], inverse.ravel(), counts
+
+
+class BruteIndex:
+    """Indeks brute-force berblok untuk `n_neighbors` tetangga eksak."""
+
+    def __init__(self, points, group_size=32, sample_size=16_384, random_state=0):
+        self.points = np.asarray(points)
+        n_points, n_features = self.points.shape
+        self.group_size = group_size
+        self.n_groups = -(-n_points // group_size)
+        padded = self.n_groups * group_size
+
+        # Kolom j, j + n_groups, j + 2 * n_groups, ... membentuk satu grup:
+        # minimum grup menjadi reduksi elemen-demi-elemen atas baris kontigu.
+        points32 = self.points.astype(np.float32)
+        self.augmented = np.zeros((n_features + 1, padded), dtype=np.float32)
+        self.augmented[:n_features, :n_points] = -2 * points32.T
+        self.augmented[n_features, :n_points] = (points32 * points32).sum(axis=1)
+        self.augmented[n_features, n_points:] = np.inf
+
+        rng = np.random.default_rng(random_state)
+        sample = np.arange(n_points)
+        if n_points > sample_size:
+            sample = np.sort(rng.choice(n_points, sample_size, replace=False))
+        self.sample = np.ascontiguousarray(self.augmented[:, sample])
+
+    def __len__(self):
+        return len(self.points)
+
+    def search(self, queries, n_neighbors):
+        """Jarak dan indeks `n_neighbors` titik terdekat, terurut naik."""
+        queries = np.asarray(queries, dtype=np.float64)
+        n_queries = len(queries)
+        augmented_queries = np.ones((n_queries, queries.shape[1] + 1), dtype=np.float32)
+        augmented_queries[:, :-1] = queries
+        query_norms = (queries * queries).sum(axis=1)
+
+        # Batas atas: tetangga ke-k di antara sampel tidak lebih dekat dari
+        # tetangga ke-k sebenarnya. Diberi kelonggaran untuk galat float32.
+        partial = augmented_queries @ self.sample
+        bound = np.partition(partial, n_neighbors - 1, axis=1)[:, n_neighbors - 1]
+        bound = (bound + 1e-3 * (np.abs(bound) + query_norms + 1))[:, None]
+
+        partial = augmented_queries @ self.augmented
+        group_min = partial.reshape(n_queries, self.group_size, self.n_groups).min(axis=1)
+        rows, groups = np.nonzero(group_min <= bound)
+        cols = (groups[:, None] + np.arange(self.group_size) * self.n_groups).ravel()
+        rows = np.repeat(rows, self.group_size)
+        keep = partial[rows, cols] <= bound[rows, 0]
+        rows, cols = rows[keep], cols[keep]
+
+        diff = self.points[cols].astype(np.float64) - queries[rows]
+        dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        order = np.lexsort((cols, dist, rows))
+        rows, cols, dist = rows[order], cols[order], dist[order]
+        take = np.searchsorted(rows, np.arange(n_queries))[:, None] + np.arange(n_neighbors)
+        return dist[take], cols[take]
+
+    def search_blocks(self, queries, n_neighbors, n_jobs=None, block_bytes=64 * 2**20):
+        """`search` per blok kueri (memori per blok <= `block_bytes`), paralel di thread pool."""
+        block = max(1, int(block_bytes // (4 * self.augmented.shape[1])))
+        blocks = [queries[start : start + block] for start in range(0, len(queries), block)]
+        n_jobs = n_jobs if n_jobs and n_jobs > 0 else os.cpu_count() or 1
+        if n_jobs == 1 or len(blocks) == 1:
+            results = [self.search(q, n_neighbors) for q in blocks]
+        else:
+            with threadpool_limits(limits=1, user_api="blas"), ThreadPoolExecutor(n_jobs) as executor:
+                results = list(executor.map(lambda q: self.search(q, n_neighbors), blocks))
+        return np.concatenate([d for d, _ in results]), np.concatenate([i for _, i in results])
+
+
+class FastKNeighborsClassifier(ClassifierMixin, BaseEstimator):
+    """KNN Euclidean atas titik unik dengan multiplisitas, berblok dan paralel."""
+
+    def __init__(
+        self,
+        n_neighbors=5,
+        weights="uniform",
+        n_jobs=None,
+        block_bytes=64 * 2**20,
+        group_size=32,
+        n_cells=None,
+        n_probe=8,
+        random_state=0,
+    ):
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.n_jobs = n_jobs
+        self.block_bytes = block_bytes
+        self.group_size = group_size
+        self.n_cells = n_cells
+        self.n_probe = n_probe
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        X = np.asarray(X)
+        if X.dtype != np.float32:
+            X = X.astype(np.float64)
+        self.classes_, y = np.unique(np.asarray(y), return_inverse=True)
+        points, inverse, counts = _unique_rows(X)
+        if counts.sum() < self.n_neighbors:
+            raise ValueError(f"n_neighbors={self.n_neighbors} melebihi jumlah sampel {counts.sum()}")
+        self.points_ = points
+        self.multiplicity_ = counts
+        self.class_counts_ = np.zeros((len(points), len(self.classes_)))
+        np.add.at(self.class_counts_, (inverse, y), 1)
+        self.n_features_in_ = X.shape[1]
+
+        if self.n_cells:
+            from sklearn.cluster import MiniBatchKMeans
+
+            kmeans = MiniBatchKMeans(self.n_cells, random_state=self.random_state, n_init=1)
+            cells = kmeans.fit_predict(points)
+            centers = kmeans.cluster_centers_
+            center_dist = ((centers[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+            self.kmeans_ = kmeans
+            self.probes_ = np.argsort(center_dist, axis=1)[:, : self.n_probe]
+            self.cell_members_ = [np.flatnonzero(cells == c) for c in range(self.n_cells)]
+        else:
+            self.index_ = BruteIndex(points, self.group_size, random_state=self.random_state)
+        return self
+
+    def _k_unique(self):
+        # k titik unik terdekat selalu mencukupi k titik asli (multiplisitas >= 1).
+        return min(self.n_neighbors, len(self.points_))
+
+    def _search_cells(self, queries):
+        k = self._k_unique()
+        dist = np.empty((len(queries), k))
+        ind = np.empty((len(queries), k), dtype=np.int64)
+        home = self.kmeans_.predict(queries)
+        for cell in np.unique(home):
+            members = np.concatenate([self.cell_members_[c] for c in self.probes_[cell]])
+            rows = np.flatnonzero(home == cell)
+            if len(members) < k:
+                members = np.arange(len(self.points_))
+            index = BruteIndex(self.points_[members], self.group_size, random_state=self.random_state)
+            d, i = index.search(queries[rows], k)
+            dist[rows], ind[rows] = d, members[i]
+        return dist, ind
+
+    def kneighbors_unique(self, X):
+        """Jarak dan indeks titik latih unik terdekat untuk setiap baris `X`."""
+        queries = np.asarray(X, dtype=np.float64)
+        if self.n_cells:
+            return self._search_cells(queries)
+        return self.index_.search_blocks(queries, self._k_unique(), self.n_jobs, self.block_bytes)
+
+    def predict_proba(self, X):
+        queries, inverse, _ = _unique_rows(np.asarray(X, dtype=np.float64))
+        dist, ind = self.kneighbors_unique(queries)
+
+        # Isi k slot tetangga secara berurutan dari titik unik terdekat; titik
+        # yang hanya sebagian masuk dibagi proporsional menurut kelasnya.
+        multiplicity = self.multiplicity_[ind]
+        before = np.cumsum(multiplicity, axis=1) - multiplicity
+        slots = np.clip(self.n_neighbors - before, 0, multiplicity)
+        share = slots / multiplicity
+
+        if self.weights == "distance":
+            with np.errstate(divide="ignore"):
+                weight = 1 / dist
+            exact = (dist == 0) & (slots > 0)
+            has_exact = exact.any(axis=1)
+            weight[has_exact] = exact[has_exact]
+        else:
+            weight = np.ones_like(dist)
+
+        votes = np.einsum("qk,qkc->qc", weight * share, self.class_counts_[ind])
+        proba = votes / votes.sum(axis=1, keepdims=True)
+        return proba[inverse]
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
@@ -0,0 +1,156 @@
+"""SMOTE berpotongan dan paralel sebagai pengganti `imblearn.SMOTE`.
+
+`ChunkedSMOTE` mengikuti algoritma dan urutan pengambilan bilangan acak
+`imblearn.over_sampling.SMOTE` (strategi `"auto"`): untuk setiap kelas
+non-mayoritas, `k_neighbors` tetangga dicari di antara baris kelas itu,
+lalu titik sintetis dibuat di antara sebuah baris dan salah satu
+tetangganya. Perbedaannya:
+
+- pencarian tetangga memakai `BruteIndex.search_blocks` (`diabetes.neighbors`)
+  yang berblok dan paralel;
+- baris sintetis dibangkitkan per potongan `chunk_size` baris dan langsung
+  ditulis ke buffer yang sudah dialokasikan, atau ke file `.npy`
+  memory-mapped bila `out` berupa path. Seperti `imblearn`, hasil bertipe
+  sama dengan `X` kecuali `dtype` diberikan (mis. float32 pada mode hemat
+  memori, lewat data ter-normalisasi yang sudah float32);
+- `iter_resample` menghasilkan batch secara malas tanpa pernah membentuk
+  matriks hasil utuh, sehingga puncak memori tidak bergantung pada jumlah
+  baris sintetis.
+
+Indeks sampel dan langkah interpolasi diambil sekaligus di awal dari
+`np.random.RandomState(random_state)` (16 byte per baris sintetis), sehingga
+hasilnya deterministik dan tidak bergantung pada `chunk_size` maupun `n_jobs`.
+
+Pada data tanpa jarak seri hasilnya identik dengan `imblearn`. Bila beberapa
+tetangga berjarak sama (umum pada kode BRFSS mentah yang banyak baris
+kembarnya), `BruteIndex` mengurutkannya menurut indeks baris, sedangkan
+pencarian tetangga scikit-learn (kd-tree) mengikuti urutan kunjungan
+pohonnya, sehingga tetangga yang terpilih, dan baris sintetisnya, dapat
+berbeda walaupun jaraknya sama.
+"""
+
+import numpy as np
+
+from diabetes.neighbors import BruteIndex
+
+
+class ChunkedSMOTE:
+    """Oversampling SMOTE dengan algoritma dan urutan bilangan acak `imblearn.SMOTE(k_neighbors, random_state)`.
+
+    Tetangga berjarak sama diurutkan menurut indeks baris, sehingga baris
+    sintetis dapat berbeda dari `imblearn` bila jarak tetangga seri.
+
+    `block_bytes` membatasi memori matriks jarak per blok pencarian tetangga,
+    `chunk_size` membatasi jumlah baris sintetis yang dibentuk sekaligus, dan
+    `dtype=None` mempertahankan tipe data `X`.
+    """
+
+    def __init__(
+        self,
+        k_neighbors=5,
+        random_state=None,
+        chunk_size=65_536,
+        n_jobs=None,
+        block_bytes=64 * 2**20,
+        dtype=None,
+    ):
+        self.k_neighbors = k_neighbors
+        self.random_state = random_state
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.block_bytes = block_bytes
+        self.dtype = dtype
+
+    def plan(self, X, y):
+        """Tetangga dan bilangan acak setiap kelas yang perlu di-oversample."""
+        y = np.asarray(y)
+        classes, counts = np.unique(y, return_counts=True)
+        n_majority = counts.max()
+        random_state = np.random.RandomState(self.random_state)
+
+        plans = []
+        for label, count in zip(classes, counts):
+            n_samples = n_majority - count
+            if n_samples == 0:
+                continue
+            indices = np.flatnonzero(y == label)
+            X_class = np.asarray(X[indices])
+            index = BruteIndex(X_class)
+            _, neighbors = index.search_blocks(X_class, self.k_neighbors + 1, self.n_jobs, self.block_bytes)
+            neighbors = neighbors[:, 1:]
+            sample_indices = random_state.randint(low=0, high=neighbors.size, size=n_samples)
+            steps = random_state.uniform(size=n_samples)
+            plans.append(
+                {
+                    "label": label,
+                    "indices": indices,
+                    "neighbors": neighbors,
+                    "rows": sample_indices // neighbors.shape[1],
+                    "cols": sample_indices % neighbors.shape[1],
+                    "steps": steps,
+                }
+            )
+        return plans
+
+    def output_dtype(self, X):
+        return np.dtype(self.dtype) if self.dtype is not None else np.asarray(X).dtype
+
+    def n_synthetic(self, plans):
+        return sum(len(plan["steps"]) for plan in plans)
+
+    def iter_synthetic(self, X, plans):
+        """Batch `(X_baru, y_baru)` sintetis berukuran paling banyak `chunk_size`."""
+        dtype = self.output_dtype(X)
+        for plan in plans:
+            for start in range(0, len(plan["steps"]), self.chunk_size):
+                stop = start + self.chunk_size
+                rows = plan["rows"][start:stop]
+                base = plan["indices"][rows]
+                other = plan["indices"][plan["neighbors"][rows, plan["cols"][start:stop]]]
+                origin = np.asarray(X[base], dtype=np.float64)
+                diffs = np.asarray(X[other], dtype=np.float64) - origin
+                X_new = origin + plan["steps"][start:stop, None] * diffs
+                yield X_new.astype(dtype), np.full(len(rows), plan["label"])
+
+    def fit_resample(self, X, y, out=None):
+        """Data asli diikuti baris sintetis, ditulis ke `out`.
+
+        `out` dapat berupa `None` (buffer baru), array yang sudah dialokasikan
+        berbentuk `(n_baris + n_sintetis, n_fitur)`, atau path file `.npy`
+        yang akan dibuat sebagai memmap.
+        """
+        X = np.asarray(X)
+        y = np.asarray(y)
+        plans = self.plan(X, y)
+        shape = (len(X) + self.n_synthetic(plans), X.shape[1])
+        dtype = self.output_dtype(X)
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif isinstance(out, str):
+            out = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=shape)
+        elif out.shape != shape:
+            raise ValueError(f"Buffer keluaran berbentuk {out.shape}, seharusnya {shape}")
+
+        y_out = np.empty(shape[0], dtype=y.dtype)
+        for start in range(0, len(X), self.chunk_size):
+            stop = min(start + self.chunk_size, len(X))
+            out[start:stop] = X[start:stop]
+        y_out[: len(y)] = y
+        position = len(X)
+        for X_new, y_new in self.iter_synthetic(X, plans):
+            out[position : position + len(X_new)] = X_new
+            y_out[position : position + len(X_new)] = y_new
+            position += len(X_new)
+        return out, y_out
+
+    def iter_resample(self, X, y):
+        """Hasil `fit_resample` sebagai batch malas `(X_batch, y_batch)` per `chunk_size` baris."""
+        X = np.asarray(X)
+        y = np.asarray(y)
+        plans = self.plan(X, y)
+        dtype = self.output_dtype(X)
+        for start in range(0, len(X), self.chunk_size):
+            stop = start + self.chunk_size
+            yield X[start:stop].astype(dtype), y[start:stop]
+        for X_new, y_new in self.iter_synthetic(X, plans):
+            yield X_new, y_new.astype(y.dtype)
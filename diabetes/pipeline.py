@@ -0,0 +1,443 @@
+"""Runner pipeline berbentuk DAG untuk tahap-tahap `main.py`.
+
+`main.py` adalah ekspor notebook yang berjalan lurus dari atas ke bawah.
+Modul ini menyusun tahap yang sama sebagai graf dependensi:
+
+    data -> dedup -> split -> outliers -> scale -> smote -> train
+                \\                                     \\-> tune -> final -> score
+                 \\-> eda (plot EDA, tidak bergantung pada cabang modeling)
+
+- Tahap yang semua dependensinya selesai dijalankan bersamaan di process
+  pool (`--jobs`), sehingga cabang EDA berjalan paralel dengan cabang
+  modeling setelah `dedup`.
+- Hanya tahap yang dibutuhkan oleh target yang diminta yang dijalankan,
+  mis. `python -m diabetes.pipeline tune` berhenti setelah tuning.
+- Model baseline, ruang pencarian, dan konfigurasi tuning diambil dari
+  `diabetes.modeling`, definisi yang sama dengan yang dipakai `main.py`.
+- Keluaran setiap tahap disimpan di `ArtifactCache`. Kuncinya adalah hash
+  dari kode tahap (fungsi tahap, helper dan konstanta modul ini yang
+  dirujuknya, serta sumber setiap modul `diabetes` yang dipakainya, mis.
+  `preprocessing`, `oversampling`, `neighbors`, `tuning`), parameternya, dan
+  kunci tahap-tahap hulunya (tahap `data` memakai sha256 file CSV yang
+  tercatat di manifest `DatasetStore`; `--list` tidak pernah mengunduh), sehingga
+  hanya tahap yang kode atau masukannya berubah yang dijalankan ulang;
+  sisanya dimuat dari cache (memory-mapped).
+
+    python -m diabetes.pipeline                       # eda, train, score
+    python -m diabetes.pipeline tune --jobs 2
+    python -m diabetes.pipeline score --set outliers.contamination=0.05
+    python -m diabetes.pipeline --list                # status setiap tahap
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, f1_score
+from sklearn.model_selection import train_test_split
+
+from diabetes import figures, modeling, preprocessing
+from diabetes.bundle import save_bundle
+from diabetes.cache import ArtifactCache
+from diabetes.datasets import DatasetStore
+from diabetes.dedup import deduplicate
+from diabetes.loader import load_brfss
+from diabetes.memory import lean_mode
+from diabetes.plots import PlotRenderer
+from diabetes.stats import iqr_summary
+from diabetes.training import train_models
+
+DEFAULT_TARGETS = ("eda", "train", "score")
+TARGET = "Diabetes_binary"
+
+# Runner dibagikan ke worker lewat fork, bukan dipickle per tahap.
+_SHARED = {}
+
+
+class Stage:
+    def __init__(self, name, fn, deps=(), params=None, products=None, external=None, prepare=None):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+        self.params = dict(params or {})
+        # File yang harus ada agar hasil cache dianggap masih berlaku.
+        self.products = products or (lambda params: [])
+        # Fingerprint masukan dari luar pipeline (mis. file dataset). Dipanggil
+        # juga oleh `--list`, jadi tidak boleh mengunduh atau menulis apa pun.
+        self.external = external or (lambda params: None)
+        # Persiapan sebelum kunci dihitung saat pipeline benar-benar dijalankan
+        # (mis. mengunduh dataset yang belum ada di penyimpanan lokal).
+        self.prepare = prepare or (lambda params: None)
+
+
+STAGES = {}
+
+
+def stage(name, deps=(), products=None, external=None, prepare=None, **params):
+    """Daftarkan fungsi `fn(inputs, **params) -> dict keluaran` sebagai tahap."""
+
+    def register(fn):
+        STAGES[name] = Stage(name, fn, deps, params, products, external, prepare)
+        return fn
+
+    return register
+
+
+def _plot_paths(plot_dir, *file_names):
+    return [os.path.join(plot_dir, name) for name in file_names]
+
+
+EDA_PLOTS = (
+    "1.univariate_analysis_histogram.png",
+    "2.bivariate_analysis_gender_diabetes_distribution.png",
+    "3.bivariate_analysis_age_diabetes_distribution.png",
+    "4.bivariate_analysis_bmi_diabetes_distribution.png",
+    "5.multivariate_analysis_correlation_heatmap.png",
+    "6.Outlier_analysis_boxplot.png",
+)
+
+
+@stage(
+    "data",
+    external=lambda params: DatasetStore(params["dataset_dir"]).recorded_sha256(params["variant"]),
+    prepare=lambda params: DatasetStore(params["dataset_dir"]).path(params["variant"]),
+    dataset_dir="diabetes_dataset",
+    variant="binary",
+)
+def load_data(inputs, dataset_dir, variant):
+    return {"df": load_brfss(DatasetStore(dataset_dir).path(variant))}
+
+
+@stage("dedup", deps=("data",), target=TARGET)
+def dedup_data(inputs, target):
+    dedup = deduplicate(inputs["data"]["df"], target=target)
+    return {"frame": dedup.frame, "counts": dedup.counts}
+
+
+@stage("eda", deps=("data", "dedup"), products=lambda params: _plot_paths(params["plot_dir"], *EDA_PLOTS), plot_dir="plots")
+def exploratory_plots(inputs, plot_dir):
+    df = inputs["data"]["df"]
+    frame = inputs["dedup"]["frame"]
+    os.makedirs(plot_dir, exist_ok=True)
+    plots = PlotRenderer(plot_dir)
+    iqr_raw = iqr_summary(df)
+    iqr_dedup = iqr_summary(frame)
+    plots.submit(EDA_PLOTS[0], figures.univariate_histograms, df, iqr_raw)
+    plots.submit(EDA_PLOTS[1], figures.gender_distribution, df)
+    plots.submit(EDA_PLOTS[2], figures.age_distribution, df)
+    plots.submit(EDA_PLOTS[3], figures.bmi_distribution, df)
+    plots.submit(EDA_PLOTS[4], figures.correlation_heatmap, df)
+    plots.submit(EDA_PLOTS[5], figures.outlier_boxplots, frame, iqr_dedup)
+    plots.wait()
+    return {"iqr_stats": iqr_raw, "iqr_stats_dedup": iqr_dedup}
+
+
+@stage("split", deps=("dedup",), target=TARGET, test_size=0.2, random_state=42)
+def split_data(inputs, target, test_size, random_state):
+    frame = inputs["dedup"]["frame"]
+    X = frame.drop(columns=[target])
+    y = frame[target]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    return {
+        "X_train": X_train,
+        "X_test": X_test,
+        "y_train": y_train,
+        "y_test": y_test,
+        "features": list(X.columns),
+    }
+
+
+@stage("outliers", deps=("split",), contamination=0.075, random_state=42)
+def remove_outliers(inputs, contamination, random_state):
+    split = inputs["split"]
+    scores = preprocessing.score_outliers(split["X_train"], random_state=random_state)
+    clean = preprocessing.remove_outliers(split["X_train"], split["y_train"], scores["anomaly_scores"], contamination)
+    return {**scores, **clean}
+
+
+@stage("scale", deps=("split", "outliers"), dtype="float32" if lean_mode() else "float64")
+def scale_features(inputs, dtype):
+    return preprocessing.scale_features(inputs["outliers"]["X_train_clean"], inputs["split"]["X_test"], dtype=np.dtype(dtype))
+
+
+@stage("smote", deps=("outliers", "scale"), random_state=42)
+def oversample(inputs, random_state):
+    return preprocessing.oversample(inputs["scale"]["X_train_scaled"], inputs["outliers"]["y_train_clean"], random_state=random_state)
+
+
+def _evaluate(y_test, y_pred):
+    return {
+        "test_accuracy": accuracy_score(y_test, y_pred),
+        "test_f1": f1_score(y_test, y_pred, average="weighted"),
+        "classification_report_test": classification_report(y_test, y_pred, output_dict=True),
+        "confusion_matrix_test": confusion_matrix(y_test, y_pred),
+    }
+
+
+@stage("train", deps=("split", "scale", "smote"), plot_dir="plots")
+def train_baselines(inputs, plot_dir):
+    models = modeling.baseline_models()
+    smote = inputs["smote"]
+    trained = train_models(models, smote["X_train_final"], smote["y_train_final"], inputs["scale"]["X_test_scaled"])
+
+    os.makedirs(plot_dir, exist_ok=True)
+    plots = PlotRenderer(plot_dir)
+    results = {}
+    for model_name, run in trained.items():
+        models[model_name] = run["model"]
+        results[model_name] = {
+            **_evaluate(inputs["split"]["y_test"], run["y_pred"]),
+            "fit_time": run["fit_time"],
+            "predict_time": run["predict_time"],
+        }
+        print(f"[train] {model_name:<20} F1 {results[model_name]['test_f1']:.4f}  fit {run['fit_time']:.2f} s")
+        plots.submit(
+            f"7.{model_name}_classification_report_confusion_matrix.png",
+            figures.classification_report_confusion_matrix,
+            results[model_name]["classification_report_test"],
+            results[model_name]["confusion_matrix_test"],
+            model_name,
+        )
+    plots.wait()
+    return {"models": models, "results": results}
+
+
+@stage("tune", deps=("smote",), init_points=5, n_iter=25, random_state=42, plot_dir="plots")
+def tune_xgboost(inputs, init_points, n_iter, random_state, plot_dir):
+    optimizer = modeling.tune_xgboost(
+        inputs["smote"]["X_train_final"],
+        inputs["smote"]["y_train_final"],
+        init_points=init_points,
+        n_iter=n_iter,
+        random_state=random_state,
+        verbose=0,
+    )
+    best_params = modeling.best_params(optimizer)
+    print(f"[tune] F1 terbaik {optimizer.max['target']:.4f}: {best_params}")
+
+    os.makedirs(plot_dir, exist_ok=True)
+    plots = PlotRenderer(plot_dir)
+    plots.submit(
+        "8.bayesian_optimization_f1_score_vs_iterations.png",
+        figures.optimization_history,
+        [res["target"] for res in optimizer.res],
+    )
+    plots.wait()
+    return {"best_params": best_params, "report": optimizer.report()}
+
+
+@stage(
+    "final",
+    deps=("split", "scale", "smote", "tune"),
+    products=lambda params: [params["bundle_path"]],
+    bundle_path=os.path.join("models", "diabetes_xgb.bundle"),
+    threshold=0.5,
+)
+def fit_final_model(inputs, bundle_path, threshold):
+    best_params = inputs["tune"]["best_params"]
+    best_model = modeling.final_model(best_params)
+    best_model.fit(inputs["smote"]["X_train_final"], inputs["smote"]["y_train_final"])
+    save_bundle(
+        bundle_path,
+        best_model.get_booster(),
+        inputs["scale"]["scaler"],
+        inputs["split"]["features"],
+        threshold=threshold,
+        params=best_params,
+    )
+    return {"model": best_model, "bundle_path": bundle_path}
+
+
+@stage("score", deps=("split", "scale", "final"), plot_dir="plots")
+def score_test(inputs, plot_dir):
+    best_model = inputs["final"]["model"]
+    y_pred = best_model.predict(inputs["scale"]["X_test_scaled"])
+    metrics = _evaluate(inputs["split"]["y_test"], y_pred)
+    print(f"[score] XGBoost_BayesianOpt accuracy {metrics['test_accuracy']:.4f}  F1 {metrics['test_f1']:.4f}")
+
+    importance_df = pd.DataFrame(
+        {"Feature": inputs["split"]["features"], "Importance": best_model.feature_importances_}
+    ).sort_values(by="Importance", ascending=False)
+    os.makedirs(plot_dir, exist_ok=True)
+    plots = PlotRenderer(plot_dir)
+    plots.submit(
+        "9.XGBoost_BayesianOpt_classification_report_confusion_matrix.png",
+        figures.classification_report_confusion_matrix,
+        metrics["classification_report_test"],
+        metrics["confusion_matrix_test"],
+        "XGBoost_BayesianOpt",
+    )
+    plots.submit("10.XGBoost_BayesianOpt_feature_importance.png", figures.feature_importance, importance_df, "XGBoost_BayesianOpt")
+    plots.wait()
+    return {"metrics": metrics, "y_pred": y_pred, "importance": importance_df}
+
+
+class PipelineRunner:
+    """Jadwalkan tahap-tahap `stages` untuk target tertentu dengan cache per tahap."""
+
+    def __init__(self, stages=None, cache=None, overrides=None):
+        self.stages = stages if stages is not None else STAGES
+        self.cache = cache or ArtifactCache(os.path.join(".cache", "pipeline"), enabled=True)
+        self.overrides = overrides or {}
+
+    def params(self, name):
+        return {**self.stages[name].params, **self.overrides.get(name, {})}
+
+    def plan(self, targets):
+        """Tahap yang dibutuhkan `targets`, terurut topologis."""
+        order = []
+        visiting = set()
+
+        def visit(name):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependensi melingkar pada tahap '{name}'")
+            if name not in self.stages:
+                raise ValueError(f"Tahap '{name}' tidak dikenal; pilihan: {', '.join(self.stages)}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def keys(self, order):
+        keys = {}
+        for name in order:
+            stage = self.stages[name]
+            params = self.params(name)
+            upstream = tuple(keys[dep] for dep in stage.deps)
+            keys[name] = self.cache.key(stage.fn, (upstream, stage.external(params)), params)
+        return keys
+
+    def is_fresh(self, name, key):
+        products = self.stages[name].products(self.params(name))
+        return self.cache.contains(name, key) and all(os.path.exists(path) for path in products)
+
+    def status(self, targets, force=()):
+        order = self.plan(targets)
+        keys = self.keys(order)
+        return order, keys, {
+            name: "run" if name in force or not self.is_fresh(name, keys[name]) else "cached" for name in order
+        }
+
+    def execute(self, name, keys):
+        """Muat keluaran hulu dari cache, jalankan tahap, dan simpan keluarannya."""
+        stage = self.stages[name]
+        inputs = {dep: self.cache.load(dep, keys[dep]) for dep in stage.deps}
+        start = time.perf_counter()
+        outputs = stage.fn(inputs, **self.params(name))
+        self.cache.save(name, keys[name], outputs)
+        return time.perf_counter() - start
+
+    def run(self, targets, jobs=2, force=(), verbose=True):
+        """Jalankan `targets`; tahap yang siap dijalankan paralel hingga `jobs` proses."""
+        for name in self.plan(targets):
+            self.stages[name].prepare(self.params(name))
+        order, keys, status = self.status(targets, force)
+        done = {name for name in order if status[name] == "cached"}
+        pending = [name for name in order if status[name] == "run"]
+        timings = {}
+        if verbose:
+            for name in order:
+                if name in done:
+                    print(f"[pipeline] {name:<9} cache {keys[name][:12]}")
+
+        if "fork" not in multiprocessing.get_all_start_methods() or jobs <= 1:
+            for name in pending:
+                timings[name] = self.execute(name, keys)
+                if verbose:
+                    print(f"[pipeline] {name:<9} selesai {timings[name]:8.2f} s")
+            return timings
+
+        running = {}
+        _SHARED["runner"] = self
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork")) as executor:
+                while pending or running:
+                    for name in list(pending):
+                        if len(running) < jobs and all(dep in done for dep in self.stages[name].deps):
+                            pending.remove(name)
+                            running[executor.submit(_execute, name, keys)] = name
+                            if verbose:
+                                print(f"[pipeline] {name:<9} mulai")
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        try:
+                            timings[name] = future.result()
+                        except Exception as exc:
+                            for other in running:
+                                other.cancel()
+                            raise RuntimeError(f"Tahap '{name}' gagal: {exc}") from exc
+                        done.add(name)
+                        if verbose:
+                            print(f"[pipeline] {name:<9} selesai {timings[name]:8.2f} s")
+        finally:
+            _SHARED.clear()
+        return timings
+
+    def outputs(self, name, targets=None):
+        """Keluaran tahap `name` dari cache (setelah `run`)."""
+        keys = self.keys(self.plan(targets or [name]))
+        return self.cache.load(name, keys[name])
+
+
+def _execute(name, keys):
+    return _SHARED["runner"].execute(name, keys)
+
+
+def parse_overrides(items):
+    """`["outliers.contamination=0.05"]` -> `{"outliers": {"contamination": 0.05}}`."""
+    overrides = {}
+    for item in items:
+        key, equals, value = item.partition("=")
+        stage_name, dot, param = key.partition(".")
+        if not equals or not dot:
+            raise ValueError(f"Format --set harus <tahap>.<parameter>=<nilai>, bukan '{item}'")
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        overrides.setdefault(stage_name, {})[param] = value
+    return overrides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan pipeline diabetes sebagai DAG tahap.")
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_TARGETS), help=f"pilihan: {', '.join(STAGES)}")
+    parser.add_argument("--jobs", type=int, default=2, help="jumlah tahap yang boleh berjalan bersamaan")
+    parser.add_argument("--force", nargs="*", default=[], help="tahap yang dijalankan ulang walaupun ada di cache ('all' = semua)")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], help="ubah parameter, mis. outliers.contamination=0.05")
+    parser.add_argument("--list", action="store_true", help="tampilkan rencana dan status cache tanpa menjalankan")
+    parser.add_argument("--cache-dir", default=os.path.join(".cache", "pipeline"))
+    args = parser.parse_args(argv)
+
+    runner = PipelineRunner(cache=ArtifactCache(args.cache_dir, enabled=True), overrides=parse_overrides(args.overrides))
+    force = set(args.force)
+    if "all" in force or os.environ.get("DIABETES_CACHE", "1") in ("", "0"):
+        force = set(runner.plan(args.targets))
+
+    if args.list:
+        order, keys, status = runner.status(args.targets, force)
+        for name in order:
+            deps = ", ".join(runner.stages[name].deps) or "-"
+            print(f"{name:<9} {status[name]:<7} {keys[name][:12]}  <- {deps}")
+        return
+
+    start = time.perf_counter()
+    timings = runner.run(args.targets, jobs=args.jobs, force=force)
+    print(f"[pipeline] {len(timings)} tahap dijalankan, total {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Render plot secara paralel di proses terpisah dengan cache lewati-jika-sama.
+
+Setiap figur didefinisikan sebagai fungsi di `diabetes.figures` yang
+mengembalikan objek `matplotlib.figure.Figure`. `PlotRenderer.submit(...)`
+menghitung fingerprint dari kode fungsi (beserta helper yang dipanggilnya,
+lihat `hashing.code_sources`), data masukan, dan parameter plot; jika
+sama dengan render sebelumnya dan file PNG masih ada, render dilewati.
+Figur selalu disimpan ke file sebelum (opsional) ditampilkan, sehingga
+eksekusi headless tidak lagi menghasilkan file kosong.
+"""
+
+import json
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+from diabetes.hashing import code_sources, fingerprint
+
+RENDER_CACHE = ".render_cache.json"
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render(path, payload, dpi):
+    plot_fn, args, params = pickle.loads(payload)
+    fig = plot_fn(*args, **params)
+    fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    return path
+
+
+class PlotRenderer:
+    """Antrian render figur ke `plot_dir` menggunakan process pool.
+
+    Pool menggunakan start method `fork` agar skrip utama tidak dieksekusi
+    ulang di worker; pada platform tanpa `fork` figur dirender secara serial
+    di proses utama (backend tetap non-interaktif karena figur dibuat tanpa
+    pyplot).
+    """
+
+    def __init__(self, plot_dir, max_workers=None, dpi=300):
+        self.plot_dir = plot_dir
+        self.dpi = dpi
+        self.max_workers = max_workers
+        self.cache_path = os.path.join(plot_dir, RENDER_CACHE)
+        self.cache = self._read_cache()
+        self.pending = {}
+        self.skipped = []
+        self._executor = None
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self):
+        # Gabungkan dengan isi file saat ini: beberapa proses (mis. tahap
+        # `diabetes.pipeline` yang berjalan paralel) dapat merender ke folder yang sama.
+        self.cache = {**self._read_cache(), **self.cache}
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    @property
+    def executor(self):
+        if self._executor is None and "fork" in multiprocessing.get_all_start_methods():
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    def submit(self, file_name, plot_fn, *args, **params):
+        """Jadwalkan render `plot_fn(*args, **params)` ke `plot_dir/file_name`."""
+        path = os.path.join(self.plot_dir, file_name)
+        key = fingerprint(plot_fn, code_sources(plot_fn), args, params, self.dpi)
+        if self.cache.get(file_name) == key and os.path.exists(path):
+            self.skipped.append(file_name)
+            return None
+        # Data dipickle saat submit agar perubahan in-place setelahnya
+        # (mis. penghapusan duplikat) tidak ikut terbawa ke worker.
+        payload = pickle.dumps((plot_fn, args, params), protocol=pickle.HIGHEST_PROTOCOL)
+        if self.executor is None:
+            _init_worker()
+            _render(path, payload, self.dpi)
+            self.cache[file_name] = key
+            self._write_cache()
+            return None
+        future = self.executor.submit(_render, path, payload, self.dpi)
+        self.pending[file_name] = (future, key)
+        return future
+
+    def wait(self):
+        """Tunggu seluruh render selesai dan perbarui cache fingerprint."""
+        for file_name, (future, key) in self.pending.items():
+            future.result()
+            self.cache[file_name] = key
+        self.pending.clear()
+        self._write_cache()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def display(self, *file_names):
+        """Tampilkan PNG yang sudah disimpan bila berjalan di IPython/Jupyter."""
+        try:
+            from IPython import get_ipython
+            from IPython.display import Image, display
+        except ImportError:
+            return
+        if get_ipython() is None:
+            return
+        for file_name in file_names or sorted(self.cache):
+            display(Image(filename=os.path.join(self.plot_dir, file_name)))
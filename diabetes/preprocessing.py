@@ -0,0 +1,85 @@
+"""Tahap preprocessing data latih: pembersihan outlier, normalisasi, dan SMOTE.
+
+Setiap fungsi menerima data masukan beserta parameternya dan mengembalikan
+dict keluaran, sehingga dapat dijalankan melalui `ArtifactCache.run(...)`.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from diabetes.oversampling import ChunkedSMOTE
+
+
+def score_outliers(X_train, random_state=42, n_estimators=100, n_jobs=None, chunk_size=16_384):
+    """Fit `IsolationForest` lalu hitung `score_samples` setiap baris latih.
+
+    Pohon dibangun paralel (`n_jobs` milik IsolationForest) dan skor dihitung
+    per potongan `chunk_size` baris di thread pool. Skor mentah ini tidak
+    bergantung pada `contamination`, sehingga cukup dihitung sekali.
+    """
+    n_jobs = n_jobs if n_jobs and n_jobs > 0 else os.cpu_count() or 1
+    IF = IsolationForest(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs)
+    values = np.asarray(X_train)
+    IF.fit(values)
+    chunks = [values[start : start + chunk_size] for start in range(0, len(values), chunk_size)]
+    with ThreadPoolExecutor(n_jobs) as executor:
+        scores = np.concatenate(list(executor.map(IF.score_samples, chunks)))
+    return {
+        "isolation_forest": IF,
+        "anomaly_scores": scores,
+    }
+
+
+def outlier_labels(scores, contamination=0.075):
+    """Label -1/1 untuk `contamination` tertentu sebagai potongan kuantil skor.
+
+    Sama dengan `IsolationForest(contamination=...).fit_predict`: baris dengan
+    skor di bawah persentil ke-`100 * contamination` ditandai outlier.
+    """
+    offset = np.percentile(scores, 100.0 * contamination)
+    return np.where(scores < offset, -1, 1)
+
+
+def remove_outliers(X_train, y_train, scores, contamination=0.075):
+    labels = outlier_labels(scores, contamination)
+    return {
+        "outlier_labels": labels,
+        "X_train_clean": X_train[labels != -1],
+        "y_train_clean": y_train[labels != -1],
+    }
+
+
+def _transform_chunked(scaler, X, dtype, chunk_size):
+    X = np.asarray(X)
+    out = np.empty(X.shape, dtype=dtype)
+    for start in range(0, len(X), chunk_size):
+        stop = start + chunk_size
+        out[start:stop] = (X[start:stop] - scaler.mean_) / scaler.scale_
+    return out
+
+
+def scale_features(X_train, X_test, dtype=np.float64, chunk_size=65_536):
+    """Fit `StandardScaler` per potongan (statistik float64) lalu tulis hasil
+    normalisasi langsung ke array `dtype`, tanpa salinan float64 utuh."""
+    scaler = StandardScaler()
+    for start in range(0, len(X_train), chunk_size):
+        scaler.partial_fit(X_train[start : start + chunk_size])
+    return {
+        "scaler": scaler,
+        "X_train_scaled": _transform_chunked(scaler, X_train, dtype, chunk_size),
+        "X_test_scaled": _transform_chunked(scaler, X_test, dtype, chunk_size),
+    }
+
+
+def oversample(X_train, y_train, random_state=42):
+    smote = ChunkedSMOTE(random_state=random_state)
+    X_train_final, y_train_final = smote.fit_resample(X_train, y_train)
+    return {
+        "smote": smote,
+        "X_train_final": X_train_final,
+        "y_train_final": y_train_final,
+    }
@@ -0,0 +1,225 @@
+"""Instrumentasi per tahap pipeline: waktu dinding, waktu CPU, puncak RSS, jumlah baris.
+
+Diaktifkan dengan variabel lingkungan `DIABETES_PROFILE`:
+
+- tidak diset / `0`: `profiler_from_env()` mengembalikan `NullProfiler` yang
+  semua metodenya kosong, sehingga tidak ada pengukuran sama sekali;
+- `1`: hasil ditulis ke folder `profiles/`;
+- nilai lain: dipakai sebagai folder keluaran.
+
+Tahap dapat bersarang (`start`/`stop` atau `with profiler.stage(...)`).
+Setelah `profiler.report()`, ringkasan dicetak dan dua file ditulis:
+
+- `trace.json`: format Chrome Trace Event, dapat dibuka di
+  `chrome://tracing`, Perfetto, atau speedscope;
+- `speedscope.json`: format *evented* speedscope untuk flame graph.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+from diabetes.memory import PeakWatcher
+
+DEFAULT_DIR = "profiles"
+
+
+class Span:
+    def __init__(self, name, parent, rows=None):
+        self.name = name
+        self.parent = parent
+        self.rows = rows
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.tid = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.cpu_start = time.process_time()
+        self.watcher = PeakWatcher()
+        self.wall = None
+        self.cpu = None
+        self.peak_rss_mb = None
+
+    def finish(self, rows=None):
+        self.wall = (time.perf_counter_ns() - self.start_ns) / 1e9
+        self.cpu = time.process_time() - self.cpu_start
+        self.peak_rss_mb = self.watcher.stop()
+        if rows is not None:
+            self.rows = rows
+
+
+class Profiler:
+    """Pencatat tahap; satu instance per proses pipeline."""
+
+    enabled = True
+
+    def __init__(self, output_dir=DEFAULT_DIR):
+        self.output_dir = output_dir
+        self.origin_ns = time.perf_counter_ns()
+        self.spans = []
+        self._open = []
+
+    def start(self, name, rows=None):
+        span = Span(name, self._open[-1] if self._open else None, rows)
+        self._open.append(span)
+        return span
+
+    def stop(self, rows=None):
+        """Tutup tahap yang terakhir dibuka; `rows` = jumlah baris yang diproses."""
+        span = self._open.pop()
+        span.finish(rows)
+        self.spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        span = self.start(name, rows)
+        try:
+            yield span
+        finally:
+            self.stop(span.rows)
+
+    def summary(self):
+        """Baris ringkasan per tahap, urut sesuai waktu mulai."""
+        return [
+            {
+                "stage": "  " * span.depth + span.name,
+                "wall_s": span.wall,
+                "cpu_s": span.cpu,
+                "cpu_util": span.cpu / span.wall if span.wall else 0.0,
+                "peak_rss_mb": span.peak_rss_mb,
+                "rows": span.rows,
+            }
+            for span in sorted(self.spans, key=lambda span: span.start_ns)
+        ]
+
+    def format_summary(self):
+        lines = [f"{'Tahap':<32} {'Wall (s)':>9} {'CPU (s)':>9} {'CPU/Wall':>8} {'Puncak RSS (MB)':>16} {'Baris':>12}"]
+        for row in self.summary():
+            rows = f"{row['rows']:,}" if row["rows"] is not None else "-"
+            lines.append(
+                f"{row['stage']:<32} {row['wall_s']:>9.2f} {row['cpu_s']:>9.2f} {row['cpu_util']:>8.2f} "
+                f"{row['peak_rss_mb']:>16,.1f} {rows:>12}"
+            )
+        return "\n".join(lines)
+
+    def _microseconds(self, ns):
+        return (ns - self.origin_ns) / 1e3
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = {"cpu_s": span.cpu, "peak_rss_mb": span.peak_rss_mb}
+            if span.rows is not None:
+                args["rows"] = span.rows
+            events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": self._microseconds(span.start_ns),
+                    "dur": span.wall * 1e6,
+                    "pid": pid,
+                    "tid": span.tid,
+                    "args": args,
+                }
+            )
+            events.append(
+                {
+                    "name": "peak_rss_mb",
+                    "ph": "C",
+                    "ts": self._microseconds(span.start_ns),
+                    "pid": pid,
+                    "args": {"peak_rss_mb": span.peak_rss_mb},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def speedscope(self, name="diabetes pipeline"):
+        frames = []
+        index = {}
+        events = []
+        stack = []
+
+        def close(span):
+            events.append({"type": "C", "frame": index[span.name], "at": self._microseconds(span.start_ns) + span.wall * 1e6})
+
+        for span in sorted(self.spans, key=lambda span: (span.start_ns, span.depth)):
+            if span.name not in index:
+                index[span.name] = len(frames)
+                frames.append({"name": span.name})
+            while stack and stack[-1].depth >= span.depth:
+                close(stack.pop())
+            events.append({"type": "O", "frame": index[span.name], "at": self._microseconds(span.start_ns)})
+            stack.append(span)
+        while stack:
+            close(stack.pop())
+        end_value = max((event["at"] for event in events), default=0)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "microseconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "events": events,
+                }
+            ],
+            "name": name,
+        }
+
+    def report(self):
+        """Tutup tahap yang masih terbuka, cetak ringkasan, dan tulis file trace."""
+        while self._open:
+            self.stop()
+        print(self.format_summary())
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = {
+            "chrome": os.path.join(self.output_dir, "trace.json"),
+            "speedscope": os.path.join(self.output_dir, "speedscope.json"),
+        }
+        with open(paths["chrome"], "w") as f:
+            json.dump(self.chrome_trace(), f)
+        with open(paths["speedscope"], "w") as f:
+            json.dump(self.speedscope(), f)
+        print(f"Trace: {paths['chrome']} (chrome://tracing), {paths['speedscope']} (speedscope.app)")
+        return paths
+
+
+class _NullStage:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Pengganti `Profiler` saat profiling nonaktif: semua metode tidak melakukan apa-apa."""
+
+    enabled = False
+    _stage = _NullStage()
+
+    def start(self, name, rows=None):
+        return self._stage
+
+    def stop(self, rows=None):
+        return None
+
+    def stage(self, name, rows=None):
+        return self._stage
+
+    def report(self):
+        return None
+
+
+def profiler_from_env():
+    value = os.environ.get("DIABETES_PROFILE", "0")
+    if value in ("", "0"):
+        return NullProfiler()
+    return Profiler(DEFAULT_DIR if value == "1" else value)
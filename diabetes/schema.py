@@ -0,0 +1,58 @@
+"""Skema kolom dataset Diabetes Health Indicators (BRFSS2015).
+
+Seluruh kolom pada ketiga varian CSV berupa kode integer kecil, sehingga
+domain (nilai minimum, nilai maksimum) setiap kolom dicatat di sini dan
+digunakan bersama oleh loader, dedup, maupun generator data sintetis.
+"""
+
+import numpy as np
+
+TARGET_DOMAINS = {
+    "Diabetes_binary": (0, 1),
+    "Diabetes_012": (0, 2),
+}
+
+FEATURE_DOMAINS = {
+    "HighBP": (0, 1),
+    "HighChol": (0, 1),
+    "CholCheck": (0, 1),
+    "BMI": (12, 98),
+    "Smoker": (0, 1),
+    "Stroke": (0, 1),
+    "HeartDiseaseorAttack": (0, 1),
+    "PhysActivity": (0, 1),
+    "Fruits": (0, 1),
+    "Veggies": (0, 1),
+    "HvyAlcoholConsump": (0, 1),
+    "AnyHealthcare": (0, 1),
+    "NoDocbcCost": (0, 1),
+    "GenHlth": (1, 5),
+    "MentHlth": (0, 30),
+    "PhysHlth": (0, 30),
+    "DiffWalk": (0, 1),
+    "Sex": (0, 1),
+    "Age": (1, 13),
+    "Education": (1, 6),
+    "Income": (1, 8),
+}
+
+FEATURES = list(FEATURE_DOMAINS)
+
+COLUMN_DOMAINS = {**TARGET_DOMAINS, **FEATURE_DOMAINS}
+
+
+def smallest_uint(max_value):
+    """Tipe unsigned integer terkecil yang dapat menampung `max_value`."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def column_dtypes(columns):
+    """Tipe data yang dideklarasikan untuk kolom-kolom yang dikenal skema."""
+    return {
+        col: smallest_uint(COLUMN_DOMAINS[col][1])
+        for col in columns
+        if col in COLUMN_DOMAINS
+    }
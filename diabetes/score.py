@@ -0,0 +1,197 @@
+"""Skoring batch berbasis streaming untuk model XGBoost hasil tuning.
+
+File masukan (CSV atau Parquet) dibaca per potongan berukuran tetap oleh
+thread pembaca terpisah, sementara thread utama menormalisasi dan
+memprediksi potongan sebelumnya. Probabilitas ditulis bertahap ke file
+keluaran sehingga penggunaan memori tetap datar berapa pun ukuran masukan.
+
+Secara default prediksi memakai booster XGBoost yang multi-thread dan paling
+cepat untuk potongan besar; `--engine forest` memakai `FlatForest` (pohon
+yang diratakan ke array NumPy, lihat `diabetes.forest`) sehingga xgboost
+tidak perlu terpasang. Threshold `FlatForest` di dalam bundle sudah berada di
+ruang fitur mentah, sehingga engine ini melewati normalisasi dan membaca kode
+fitur apa adanya (float32 dari CSV, uint8 dari `load_brfss`).
+
+Probabilitas per profil fitur dimemoisasi oleh `PredictionCache`
+(`diabetes.memo`) sehingga profil yang berulang tidak dievaluasi ulang;
+`--cache-size 0` menonaktifkannya.
+
+    python -m diabetes.score models/diabetes_xgb.bundle input.csv output.csv --chunk-size 100000
+"""
+
+import argparse
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from diabetes.bundle import load_bundle
+from diabetes.memo import PredictionCache
+
+_END = object()
+
+
+class Scorer:
+    """Model yang sudah di-fit beserta preprocessing-nya untuk prediksi batch.
+
+    `mean`/`scale` bernilai `None` bila model sudah menerima fitur mentah.
+    """
+
+    def __init__(self, model, mean, scale, features, threshold=0.5):
+        self.model = model
+        self.mean = mean
+        self.scale = scale
+        self.features = list(features)
+        self.threshold = threshold
+        self.cache = None
+
+    @classmethod
+    def from_bundle(cls, bundle, engine="booster"):
+        if engine == "forest":
+            return cls(bundle.forest, None, None, bundle.features, bundle.threshold)
+        return cls(bundle.booster, bundle.mean, bundle.scale, bundle.features, bundle.threshold)
+
+    def enable_cache(self, capacity=2**20):
+        self.cache = PredictionCache(self._predict, self.features, capacity) if capacity else None
+        return self
+
+    def predict_matrix(self, X):
+        """Probabilitas kelas positif untuk matriks fitur mentah berurutan `features`."""
+        if self.cache is not None:
+            return self.cache.predict(X)
+        return self._predict(X)
+
+    def _predict(self, X):
+        if self.mean is None:
+            return self.model.inplace_predict(X)
+        return self.model.inplace_predict((X - self.mean) / self.scale)
+
+    def predict_proba(self, frame):
+        X = frame[self.features].to_numpy()
+        return self.predict_matrix(X if self.mean is None else X.astype(np.float64))
+
+
+def load_scorer(path, engine="booster", cache_size=0):
+    return Scorer.from_bundle(load_bundle(path), engine=engine).enable_cache(cache_size)
+
+
+def iter_chunks(path, chunk_size, columns=None):
+    """Baca CSV/Parquet per potongan `chunk_size` baris sebagai DataFrame."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=columns, dtype=np.float32)
+
+
+def prefetch(iterator, depth=2):
+    """Jalankan `iterator` di thread pembaca dengan antrean sedalam `depth`."""
+    buffer = queue.Queue(maxsize=depth)
+
+    def reader():
+        try:
+            for item in iterator:
+                buffer.put(item)
+        except BaseException as exc:
+            buffer.put(exc)
+        else:
+            buffer.put(_END)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    while True:
+        item = buffer.get()
+        if item is _END:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+    thread.join()
+
+
+class ResultWriter:
+    """Tulis probabilitas dan prediksi secara bertahap ke CSV atau Parquet."""
+
+    def __init__(self, path):
+        self.path = path
+        self.parquet_writer = None
+        self.header = True
+
+    def write(self, frame):
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.header else "a", header=self.header, index=False)
+            self.header = False
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def score_file(scorer, input_path, output_path, chunk_size=100_000, log=sys.stderr):
+    """Skor seluruh `input_path` ke `output_path`; kembalikan (baris, detik)."""
+    writer = ResultWriter(output_path)
+    n_rows = 0
+    start = time.perf_counter()
+    try:
+        for chunk in prefetch(iter_chunks(input_path, chunk_size, scorer.features)):
+            proba = scorer.predict_proba(chunk)
+            writer.write(
+                pd.DataFrame(
+                    {
+                        "probability": proba,
+                        "prediction": (proba >= scorer.threshold).astype(np.uint8),
+                    }
+                )
+            )
+            n_rows += len(chunk)
+            if log is not None:
+                elapsed = time.perf_counter() - start
+                print(f"{n_rows:>12,} baris  {n_rows / elapsed:>12,.0f} baris/detik", file=log)
+    finally:
+        writer.close()
+    return n_rows, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skoring batch model diabetes.")
+    parser.add_argument("model", help="file bundle model hasil main.py")
+    parser.add_argument("input", help="file masukan .csv atau .parquet")
+    parser.add_argument("output", help="file keluaran .csv atau .parquet")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--engine", choices=("booster", "forest"), default="booster")
+    parser.add_argument("--cache-size", type=int, default=2**20, help="jumlah entri cache prediksi (0 = nonaktif)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    scorer = load_scorer(args.model, engine=args.engine, cache_size=args.cache_size)
+    n_rows, elapsed = score_file(
+        scorer,
+        args.input,
+        args.output,
+        chunk_size=args.chunk_size,
+        log=None if args.quiet else sys.stderr,
+    )
+    print(f"{n_rows:,} baris diskor dalam {elapsed:.2f} detik ({n_rows / max(elapsed, 1e-9):,.0f} baris/detik)")
+    if scorer.cache is not None:
+        report = scorer.cache.report()
+        print(
+            f"Cache prediksi: hit rate {report['hit_rate']:.1%}, "
+            f"{report['evaluated']:,} baris dievaluasi model, {report['entries']:,}/{report['capacity']:,} entri"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Server HTTP asyncio untuk prediksi online dengan micro-batching.
+
+Setiap permintaan `POST /predict` berisi satu rekaman pasien (objek JSON
+nama fitur -> nilai). Permintaan yang datang bersamaan dikumpulkan oleh
+`MicroBatcher` menjadi satu batch: batch dikirim begitu mencapai
+`max_batch_size` rekaman atau setelah `max_wait_ms` sejak rekaman pertama
+masuk, lalu diprediksi sekaligus dengan satu panggilan `inplace_predict`
+di thread terpisah sehingga event loop tetap menerima permintaan baru.
+Secara default model dievaluasi dengan `FlatForest` (`diabetes.forest`)
+yang overhead-nya kecil untuk batch kecil dan tidak memerlukan xgboost.
+
+`GET /metrics` mengembalikan p50/p99 latensi serta histogram latensi dan
+ukuran batch; `GET /health` untuk pemeriksaan kesiapan.
+
+    python -m diabetes.server models/diabetes_xgb.bundle --port 8000 --max-wait-ms 2
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from diabetes.score import load_scorer
+
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class Histogram:
+    """Histogram dengan batas bucket tetap plus sampel terakhir untuk persentil."""
+
+    def __init__(self, bounds, window=100_000):
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.counts = np.zeros(len(bounds) + 1, dtype=np.int64)
+        self.samples = collections.deque(maxlen=window)
+        self.total = 0
+
+    def observe(self, value):
+        self.counts[np.searchsorted(self.bounds, value)] += 1
+        self.samples.append(value)
+        self.total += 1
+
+    def percentile(self, q):
+        return float(np.percentile(self.samples, q)) if self.samples else None
+
+    def summary(self):
+        labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+        return {
+            "count": self.total,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(labels, self.counts.tolist())),
+        }
+
+
+class MicroBatcher:
+    """Kumpulkan rekaman tunggal menjadi batch lalu prediksi sekaligus."""
+
+    def __init__(self, scorer, max_batch_size=256, max_wait_ms=2.0):
+        self.scorer = scorer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue = None
+        self.task = None
+        # Satu thread prediksi: batch berikutnya dikumpulkan selama batch
+        # sebelumnya masih dihitung.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        self.executor.shutdown(wait=True)
+
+    def vectorize(self, record):
+        return [float(record[name]) for name in self.scorer.features]
+
+    async def predict(self, record):
+        """Probabilitas satu rekaman; menunggu hingga batch-nya selesai."""
+        start = time.perf_counter()
+        row = self.vectorize(record)
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((row, future))
+        proba = await future
+        self.latency_ms.observe((time.perf_counter() - start) * 1000)
+        return proba
+
+    async def _collect(self):
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            remaining = deadline - time.perf_counter()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            X = np.array([row for row, _ in batch], dtype=np.float64)
+            self.batch_size.observe(len(batch))
+            try:
+                proba = await loop.run_in_executor(self.executor, self.scorer.predict_matrix, X)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), p in zip(batch, proba.tolist()):
+                if not future.done():
+                    future.set_result(p)
+
+    def metrics(self):
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "latency_ms": self.latency_ms.summary(),
+            "batch_size": self.batch_size.summary(),
+            "cache": self.scorer.cache.report() if self.scorer.cache is not None else None,
+        }
+
+
+class ScoringServer:
+    """Server HTTP/1.1 minimal (keep-alive) di atas `asyncio.start_server`."""
+
+    def __init__(self, scorer, host="127.0.0.1", port=8000, max_batch_size=256, max_wait_ms=2.0):
+        self.scorer = scorer
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(scorer, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    async def handle_request(self, method, path, body):
+        if path == "/predict":
+            if method != "POST":
+                return 405, {"error": "gunakan POST"}
+            try:
+                record = json.loads(body)
+                proba = await self.batcher.predict(record)
+            except KeyError as exc:
+                return 400, {"error": f"fitur {exc} tidak ada"}
+            except (TypeError, ValueError) as exc:
+                return 400, {"error": str(exc)}
+            return 200, {"probability": proba, "prediction": int(proba >= self.scorer.threshold)}
+        if path == "/metrics":
+            return 200, self.batcher.metrics()
+        if path == "/health":
+            return 200, {"status": "ok", "features": self.scorer.features}
+        return 404, {"error": f"path {path} tidak dikenal"}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                try:
+                    status, payload = await self.handle_request(method, path, body)
+                    data = json.dumps(payload).encode()
+                except Exception as exc:
+                    # Galat tak terduga (mis. dari model) tetap dijawab, bukan memutus koneksi.
+                    status = 500
+                    data = json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        self.batcher.start()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        print(f"Melayani di http://{self.host}:{self.port} (max wait {self.batcher.max_wait * 1000:g} ms)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server prediksi online model diabetes.")
+    parser.add_argument("model", help="file bundle model hasil main.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--engine", choices=("forest", "booster"), default="forest")
+    parser.add_argument("--cache-size", type=int, default=2**20, help="jumlah entri cache prediksi (0 = nonaktif)")
+    args = parser.parse_args(argv)
+
+    server = ScoringServer(
+        load_scorer(args.model, engine=args.engine, cache_size=args.cache_size),
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Statistik deskriptif vektorisasi yang dipakai bersama oleh bagian EDA."""
+
+import numpy as np
+import pandas as pd
+
+
+def iqr_summary(df, k=1.5):
+    """Ringkasan kuartil, batas IQR, dan jumlah outlier untuk semua kolom.
+
+    Seluruh kuartil dihitung dengan satu pemanggilan `df.quantile([...])` dan
+    jumlah outlier diperoleh dari satu reduksi boolean atas seluruh matriks,
+    tanpa membuat salinan DataFrame per kolom. Hasilnya berupa DataFrame
+    dengan indeks nama kolom dan kolom `Q1`, `Q2`, `Q3`, `IQR`, `lower`,
+    `upper`, `min`, `max`, serta `outliers`.
+    """
+    quartiles = df.quantile([0.25, 0.5, 0.75])
+    summary = pd.DataFrame(
+        {
+            "Q1": quartiles.loc[0.25],
+            "Q2": quartiles.loc[0.5],
+            "Q3": quartiles.loc[0.75],
+        }
+    )
+    summary["IQR"] = summary["Q3"] - summary["Q1"]
+    summary["lower"] = summary["Q1"] - k * summary["IQR"]
+    summary["upper"] = summary["Q3"] + k * summary["IQR"]
+
+    values = df.to_numpy()
+    lower = summary["lower"].to_numpy()
+    upper = summary["upper"].to_numpy()
+    summary["min"] = values.min(axis=0)
+    summary["max"] = values.max(axis=0)
+    summary["outliers"] = np.count_nonzero((values < lower) | (values > upper), axis=0)
+    return summary
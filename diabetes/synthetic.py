@@ -0,0 +1,118 @@
+"""Generator data sintetis berbentuk BRFSS untuk benchmark dan uji skala.
+
+Setiap baris memiliki 21 fitur dengan domain persis seperti `diabetes.schema`
+dan target `Diabetes_binary` dengan proporsi kelas positif ~13.9% seperti
+BRFSS2015. Fitur dibangkitkan dari satu variabel risiko laten yang bergeser
+untuk kelas positif, sehingga fitur berkorelasi dengan target (dan satu sama
+lain) dan model tetap punya pola untuk dipelajari:
+
+- fitur biner: ambang pada variabel laten sesuai prevalensinya;
+- fitur ordinal (`BMI`, `GenHlth`, `Age`, ...): pembulatan `mean + sd * u`
+  yang dipotong ke domain;
+- `MentHlth`/`PhysHlth`: sebagian besar 0 (zero-inflated), sisanya 1..30.
+
+Hanya memakai NumPy/SciPy dan tidak memerlukan akses jaringan.
+
+    python -m diabetes.synthetic synthetic_1M.csv --rows 1M
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from diabetes.schema import FEATURE_DOMAINS, column_dtypes
+
+TARGET = "Diabetes_binary"
+POSITIVE_RATE = 0.139
+RISK_SHIFT = 1.5
+
+# (jenis, parameter marginal, korelasi dengan risiko laten)
+FEATURE_MODELS = {
+    "HighBP": ("binary", 0.43, 0.55),
+    "HighChol": ("binary", 0.42, 0.45),
+    "CholCheck": ("binary", 0.96, 0.2),
+    "BMI": ("ordinal", (28.4, 6.6), 0.4),
+    "Smoker": ("binary", 0.44, 0.15),
+    "Stroke": ("binary", 0.04, 0.25),
+    "HeartDiseaseorAttack": ("binary", 0.09, 0.35),
+    "PhysActivity": ("binary", 0.76, -0.25),
+    "Fruits": ("binary", 0.63, -0.1),
+    "Veggies": ("binary", 0.81, -0.1),
+    "HvyAlcoholConsump": ("binary", 0.06, -0.15),
+    "AnyHealthcare": ("binary", 0.95, 0.05),
+    "NoDocbcCost": ("binary", 0.08, 0.1),
+    "GenHlth": ("ordinal", (2.5, 1.07), 0.6),
+    "MentHlth": ("inflated", 0.69, 0.15),
+    "PhysHlth": ("inflated", 0.63, 0.35),
+    "DiffWalk": ("binary", 0.17, 0.45),
+    "Sex": ("binary", 0.44, 0.05),
+    "Age": ("ordinal", (8.0, 3.0), 0.45),
+    "Education": ("ordinal", (5.05, 0.99), -0.2),
+    "Income": ("ordinal", (6.05, 2.07), -0.3),
+}
+
+
+def _feature(kind, marginal, latent, domain):
+    low, high = domain
+    if kind == "binary":
+        return latent > ndtri(1 - marginal)
+    if kind == "ordinal":
+        mean, sd = marginal
+        return np.clip(np.rint(mean + sd * latent), low, high)
+    # Zero-inflated: proporsi `marginal` bernilai 0, sisanya tersebar di 1..high.
+    p = ndtr(latent)
+    return np.where(p < marginal, 0, np.minimum(1 + (p - marginal) / (1 - marginal) * high, high).astype(np.int64))
+
+
+def synthetic_chunk(n_rows, rng, positive_rate=POSITIVE_RATE):
+    """Satu DataFrame sintetis berisi `n_rows` baris dengan tipe kolom ringkas."""
+    y = rng.random(n_rows) < positive_rate
+    risk = rng.standard_normal(n_rows) + RISK_SHIFT * y
+    risk = (risk - RISK_SHIFT * positive_rate) / np.sqrt(1 + RISK_SHIFT**2 * positive_rate * (1 - positive_rate))
+
+    columns = {TARGET: y}
+    for name, (kind, marginal, rho) in FEATURE_MODELS.items():
+        latent = rho * risk + np.sqrt(1 - rho**2) * rng.standard_normal(n_rows)
+        columns[name] = _feature(kind, marginal, latent, FEATURE_DOMAINS[name])
+    dtypes = column_dtypes(columns)
+    return pd.DataFrame({name: values.astype(dtypes[name]) for name, values in columns.items()})
+
+
+def iter_synthetic(n_rows, random_state=0, chunk_size=1_000_000, positive_rate=POSITIVE_RATE):
+    """Potongan DataFrame sintetis dengan total `n_rows` baris (deterministik per `random_state`)."""
+    rng = np.random.default_rng(random_state)
+    for start in range(0, n_rows, chunk_size):
+        yield synthetic_chunk(min(chunk_size, n_rows - start), rng, positive_rate)
+
+
+def synthetic_brfss(n_rows, random_state=0, chunk_size=1_000_000, positive_rate=POSITIVE_RATE):
+    return pd.concat(list(iter_synthetic(n_rows, random_state, chunk_size, positive_rate)), ignore_index=True)
+
+
+def write_synthetic_csv(path, n_rows, random_state=0, chunk_size=1_000_000, positive_rate=POSITIVE_RATE):
+    """Tulis CSV sintetis dengan urutan kolom seperti `diabetes_binary_health_indicators_BRFSS2015.csv`."""
+    for i, chunk in enumerate(iter_synthetic(n_rows, random_state, chunk_size, positive_rate)):
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    return path
+
+
+def parse_rows(text):
+    """`"250k"` -> 250000, `"1M"` -> 1000000, `"10M"` -> 10000000."""
+    text = str(text).strip()
+    multiplier = {"k": 10**3, "m": 10**6}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bangkitkan CSV sintetis berbentuk BRFSS.")
+    parser.add_argument("path")
+    parser.add_argument("--rows", default="250k", help="jumlah baris, mis. 250k, 1M, 10M")
+    parser.add_argument("--random-state", type=int, default=0)
+    args = parser.parse_args(argv)
+    write_synthetic_csv(args.path, parse_rows(args.rows), args.random_state)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Pelatihan beberapa model baseline secara bersamaan di process pool.
+
+Setiap model mendapat jatah core CPU sendiri: model yang hanya memakai satu
+core (mis. `LogisticRegression` dengan solver `liblinear`) diberi 1 core,
+sisa core dibagi rata ke model lain melalui parameter `n_jobs` (XGBoost,
+paralelisme query KNN) serta batas thread BLAS/OpenMP. Dengan demikian
+total waktu mendekati waktu model paling lambat, bukan jumlah ketiganya.
+Bila core lebih sedikit daripada model, hanya `n_cpus` model yang berjalan
+bersamaan sehingga core tidak pernah dipakai berlebihan.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from threadpoolctl import threadpool_limits
+
+# Data latih/uji dibagikan ke worker lewat fork, bukan dipickle per model.
+_SHARED = {}
+
+
+def is_single_core(model):
+    params = model.get_params()
+    return "n_jobs" not in params or params.get("solver") == "liblinear"
+
+
+def cpu_budgets(models, n_cpus=None):
+    """Jumlah core untuk setiap model yang berjalan bersamaan.
+
+    Bila `n_cpus >= len(models)`, total jatah tidak melebihi `n_cpus`. Bila
+    lebih sedikit, setiap model mendapat 1 core dan `train_models` hanya
+    menjalankan `n_cpus` model sekaligus, jadi core yang terpakai pada satu
+    waktu tetap tidak melebihi `n_cpus`.
+    """
+    n_cpus = n_cpus or os.cpu_count() or 1
+    if n_cpus < len(models):
+        return {name: 1 for name in models}
+    budgets = {name: 1 for name, model in models.items() if is_single_core(model)}
+    parallel = [name for name in models if name not in budgets]
+    if parallel:
+        spare = n_cpus - len(budgets)
+        share, extra = divmod(spare, len(parallel))
+        for i, name in enumerate(parallel):
+            budgets[name] = share + (1 if i < extra else 0)
+    return budgets
+
+
+def fit_predict(model_name, model, n_jobs, X_train=None, y_train=None, X_test=None):
+    """Latih satu model dan prediksi data uji dengan `n_jobs` core.
+
+    Mengembalikan dict berisi model yang sudah di-fit, prediksi data uji,
+    serta waktu fit/predict (detik).
+    """
+    if X_train is None:
+        X_train, y_train, X_test = _SHARED["data"]
+    if not is_single_core(model):
+        model.set_params(n_jobs=n_jobs)
+
+    with threadpool_limits(limits=n_jobs):
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        y_pred = model.predict(X_test)
+        predict_time = time.perf_counter() - start
+
+    return {
+        "model_name": model_name,
+        "model": model,
+        "y_pred": y_pred,
+        "n_jobs": n_jobs,
+        "fit_time": fit_time,
+        "predict_time": predict_time,
+    }
+
+
+def train_models(models, X_train, y_train, X_test, n_cpus=None):
+    """Latih semua model dalam `models` secara bersamaan.
+
+    Hasil dikembalikan sebagai dict nama model -> hasil `fit_predict`, dengan
+    urutan yang sama seperti `models`. Paling banyak `n_cpus` model berjalan
+    bersamaan. Dengan satu core, atau pada platform tanpa start method
+    `fork`, model dilatih berurutan di proses utama dengan seluruh core.
+    """
+    n_cpus = n_cpus or os.cpu_count() or 1
+    budgets = cpu_budgets(models, n_cpus)
+    workers = min(len(models), n_cpus)
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return {
+            name: fit_predict(name, model, 1 if is_single_core(model) else n_cpus, X_train, y_train, X_test)
+            for name, model in models.items()
+        }
+
+    _SHARED["data"] = (X_train, y_train, X_test)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            futures = {
+                name: executor.submit(fit_predict, name, model, budgets[name])
+                for name, model in models.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    finally:
+        _SHARED.clear()
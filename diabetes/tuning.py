@@ -0,0 +1,342 @@
+"""Bayesian Optimization paralel dengan strategi batch *constant liar*.
+
+`BayesianOptimization.maximize` bawaan mengevaluasi kandidat satu per satu.
+`BatchBayesianOptimization` menjaga hingga `batch_size` kandidat tetap
+berjalan di process pool. Kandidat baru diusulkan dengan menganggap setiap
+kandidat yang masih berjalan sudah bernilai "bohong" konstan (nilai target
+terburuk sejauh ini), sehingga GP tidak mengusulkan titik yang sama dua kali.
+Begitu satu evaluasi selesai, nilainya yang sebenarnya didaftarkan ke
+optimizer utama dan slot kosong langsung diisi kandidat berikutnya.
+
+`XGBoostCVObjective` adalah fungsi objektif cross-validation XGBoost dengan
+early stopping per fold dan *pruning* trial setelah fold pertama bila skornya
+jelas tertinggal dari trial-trial sebelumnya. Pembagian fold dan matriks
+`QuantileDMatrix` (histogram kuantil) setiap fold dibangun sekali per proses
+lalu dipakai ulang oleh semua trial melalui `xgb.train`.
+"""
+
+import functools
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from bayes_opt import BayesianOptimization
+import xgboost as xgb
+from sklearn.metrics import f1_score, get_scorer
+from sklearn.model_selection import StratifiedKFold, train_test_split
+
+# Objektif dibagikan ke worker lewat fork agar data latih tidak dipickle
+# pada setiap evaluasi kandidat.
+_SHARED = {}
+
+
+def f1_weighted(y_true, y_pred):
+    return f1_score(y_true, y_pred, average="weighted")
+
+
+SCORERS = {"f1_weighted": f1_weighted}
+
+
+def _sklearn_score(scorer, y_true, y_output):
+    return scorer._sign * scorer._score_func(y_true, y_output, **scorer._kwargs)
+
+
+def resolve_scoring(scoring):
+    """`(fungsi skor, butuh probabilitas?)` untuk `scoring`.
+
+    `scoring` dapat berupa nama di `SCORERS`, nama scorer sklearn (mis.
+    `"roc_auc"`, `"neg_log_loss"`), atau callable `(y_true, y_pred)` yang
+    menerima label. Scorer sklearn berbasis skor/probabilitas menerima
+    probabilitas kelas positif, dan scorer `neg_*` tetap dimaksimalkan.
+    """
+    if callable(scoring):
+        return scoring, False
+    if scoring in SCORERS:
+        return SCORERS[scoring], False
+    try:
+        scorer = get_scorer(scoring)
+    except ValueError:
+        raise ValueError(f"scoring tidak dikenal: {scoring!r}") from None
+    methods = (scorer._response_method,) if isinstance(scorer._response_method, str) else scorer._response_method
+    return functools.partial(_sklearn_score, scorer), "predict" not in methods
+
+
+class FoldMatrices:
+    """Matriks XGBoost satu fold yang sudah dikuantisasi: data fit, data
+    validasi early stopping, dan data validasi CV (berbagi cut kuantil)."""
+
+    def __init__(self, X, y, train_idx, valid_idx, validation_fraction, max_bin, random_state, n_jobs):
+        fit_idx, es_idx = train_test_split(
+            train_idx,
+            test_size=validation_fraction,
+            stratify=y[train_idx],
+            random_state=random_state,
+        )
+        self.fit = xgb.QuantileDMatrix(X[fit_idx], y[fit_idx], max_bin=max_bin, nthread=n_jobs)
+        self.early_stopping = xgb.QuantileDMatrix(X[es_idx], y[es_idx], ref=self.fit, nthread=n_jobs)
+        self.valid = xgb.QuantileDMatrix(X[valid_idx], ref=self.fit, nthread=n_jobs)
+        self.y_valid = y[valid_idx]
+
+
+class XGBoostCVObjective:
+    """Skor cross-validation XGBoost untuk satu kombinasi parameter.
+
+    Setiap fold menyisihkan `validation_fraction` data latihnya untuk early
+    stopping, sehingga `n_estimators` berperan sebagai batas atas jumlah
+    boosting round. Setelah fold pertama, trial dihentikan (*pruned*) jika:
+
+    - `pruning="median"`: skor fold pertama di bawah median skor fold pertama
+      trial sebelumnya (minimal `min_trials` trial), dikurangi `prune_margin`;
+    - `pruning="margin"`: skor fold pertama lebih rendah dari skor terbaik
+      sejauh ini dikurangi `prune_margin`.
+
+    Trial yang di-prune bernilai rata-rata skor fold yang sempat dijalankan;
+    `BatchBayesianOptimization` mendaftarkannya ke GP dengan nilai penalti.
+    Laporan setiap trial memuat `best_n_estimators`, rata-rata
+    `best_iteration + 1` antar fold, yaitu jumlah pohon yang benar-benar
+    menghasilkan skor CV tersebut.
+    Matriks fold dibangun saat trial pertama di setiap proses (`prepare`),
+    sehingga sketsa kuantil dan salinan data tidak diulang per trial.
+    """
+
+    def __init__(
+        self,
+        X,
+        y,
+        cv=3,
+        scoring="f1_weighted",
+        early_stopping_rounds=20,
+        validation_fraction=0.1,
+        pruning="median",
+        prune_margin=0.0,
+        min_trials=5,
+        random_state=42,
+        n_jobs=None,
+        max_bin=256,
+    ):
+        self.X = np.asarray(X)
+        self.y = np.asarray(y)
+        self.cv = cv
+        self.scoring = scoring
+        self.early_stopping_rounds = early_stopping_rounds
+        self.validation_fraction = validation_fraction
+        self.pruning = pruning
+        self.prune_margin = prune_margin
+        self.min_trials = min_trials
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.max_bin = max_bin
+        self.score_fn, self.needs_proba = resolve_scoring(scoring)
+        self.folds = list(StratifiedKFold(n_splits=cv).split(self.X, self.y))
+        self.matrices = None
+        self._pid = None
+
+    def prepare(self):
+        """Bangun `FoldMatrices` untuk semua fold (sekali per proses)."""
+        if self.matrices is None or self._pid != os.getpid():
+            self.matrices = [
+                FoldMatrices(
+                    self.X,
+                    self.y,
+                    train_idx,
+                    valid_idx,
+                    self.validation_fraction,
+                    self.max_bin,
+                    self.random_state,
+                    self.n_jobs,
+                )
+                for train_idx, valid_idx in self.folds
+            ]
+            self._pid = os.getpid()
+        return self.matrices
+
+    def should_prune(self, fold_score, context):
+        if not self.pruning or not context:
+            return False
+        if self.pruning == "margin":
+            return context["best"] is not None and fold_score < context["best"] - self.prune_margin
+        first_scores = context["first_fold_scores"]
+        if len(first_scores) < self.min_trials:
+            return False
+        return fold_score < np.median(first_scores) - self.prune_margin
+
+    def booster_params(self, params):
+        return {
+            "objective": "binary:logistic",
+            "eval_metric": "logloss",
+            "tree_method": "hist",
+            "max_bin": self.max_bin,
+            "max_depth": int(params["max_depth"]),
+            "learning_rate": params["learning_rate"],
+            "subsample": params["subsample"],
+            "colsample_bytree": params["colsample_bytree"],
+            "seed": self.random_state,
+            "nthread": self.n_jobs or 0,
+        }
+
+    def fit_fold(self, params, fold):
+        booster = xgb.train(
+            self.booster_params(params),
+            fold.fit,
+            num_boost_round=int(params["n_estimators"]),
+            evals=[(fold.early_stopping, "valid")],
+            early_stopping_rounds=self.early_stopping_rounds,
+            verbose_eval=False,
+        )
+        proba = booster.predict(fold.valid, iteration_range=(0, booster.best_iteration + 1))
+        score = self.score_fn(fold.y_valid, proba if self.needs_proba else (proba > 0.5).astype(self.y.dtype))
+        return score, booster.num_boosted_rounds(), booster.best_iteration + 1
+
+    def evaluate(self, params, context=None):
+        """Jalankan trial dan kembalikan laporan (skor, fold, round, pruned)."""
+        scores = []
+        best_rounds = []
+        rounds = 0
+        pruned = False
+        for i, fold in enumerate(self.prepare()):
+            score, n_rounds, best_round = self.fit_fold(params, fold)
+            scores.append(score)
+            best_rounds.append(best_round)
+            rounds += n_rounds
+            if i == 0 and len(self.matrices) > 1 and self.should_prune(score, context):
+                pruned = True
+                break
+        return {
+            "score": float(np.mean(scores)),
+            "first_fold_score": float(scores[0]),
+            "folds": len(scores),
+            "boosting_rounds": rounds,
+            "best_n_estimators": int(round(np.mean(best_rounds))),
+            "pruned": pruned,
+        }
+
+    def __call__(self, **params):
+        return self.evaluate(params)["score"]
+
+
+def _evaluate(params, context):
+    f = _SHARED["objective"]
+    if hasattr(f, "evaluate"):
+        return f.evaluate(params, context)
+    return {"score": f(**params)}
+
+
+class BatchBayesianOptimization:
+    """Pembungkus `BayesianOptimization` untuk evaluasi paralel asinkron.
+
+    `f` dapat berupa fungsi biasa atau objek dengan metode
+    `evaluate(params, context)` (mis. `XGBoostCVObjective`); yang kedua
+    menerima skor terbaik dan skor fold pertama trial sebelumnya untuk
+    keperluan pruning. Atribut `res` dan `max` sama dengan milik
+    `BayesianOptimization` sehingga kode pelaporan yang ada tidak perlu
+    diubah; laporan per trial tersedia di `trials`.
+
+    Skor trial yang di-prune hanya berasal dari fold pertama, sehingga tidak
+    sebanding dengan rata-rata CV penuh. Trial tersebut didaftarkan ke GP
+    dengan nilai penalti `min(skor, target terburuk sejauh ini)`: GP tetap
+    menjauhi daerah itu, tetapi trial yang di-prune tidak pernah menjadi `max`.
+    """
+
+    def __init__(self, f, pbounds, random_state=None, n_workers=None, batch_size=None, verbose=2):
+        self.f = f
+        self.pbounds = pbounds
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.batch_size = batch_size or self.n_workers
+        self.random_state = np.random.RandomState(random_state)
+        self.trials = []
+        self.optimizer = BayesianOptimization(
+            f=None,
+            pbounds=pbounds,
+            random_state=random_state,
+            verbose=verbose,
+            allow_duplicate_points=True,
+        )
+
+    @property
+    def res(self):
+        return self.optimizer.res
+
+    @property
+    def max(self):
+        return self.optimizer.max
+
+    def register(self, params, report):
+        target = report["score"]
+        if report.get("pruned"):
+            target = min(target, self.liar_value())
+        self.trials.append({**params, **report, "target": target})
+        self.optimizer.register(params=params, target=target)
+
+    def best_trial(self):
+        """Laporan trial dengan target tertinggi (trial yang di-prune hanya bila semuanya di-prune)."""
+        complete = [trial for trial in self.trials if not trial.get("pruned")]
+        return max(complete or self.trials, key=lambda trial: trial["target"])
+
+    def context(self):
+        targets = [res["target"] for res in self.optimizer.res]
+        return {
+            "best": max(targets) if targets else None,
+            "first_fold_scores": [
+                trial["first_fold_score"] for trial in self.trials if "first_fold_score" in trial
+            ],
+        }
+
+    def report(self):
+        """Laporan per trial sebagai DataFrame."""
+        return pd.DataFrame(self.trials)
+
+    def liar_value(self):
+        targets = [res["target"] for res in self.optimizer.res]
+        return min(targets) if targets else 0.0
+
+    def suggest(self, pending):
+        """Usulkan kandidat berikutnya dengan memperhitungkan kandidat `pending`."""
+        if not self.optimizer.res:
+            return self.optimizer.random_sample(1)[0]
+        if not pending:
+            return self.optimizer.suggest()
+        ghost = BayesianOptimization(
+            f=None,
+            pbounds=self.pbounds,
+            random_state=np.random.RandomState(self.random_state.randint(2**31 - 1)),
+            verbose=0,
+            allow_duplicate_points=True,
+        )
+        for res in self.optimizer.res:
+            ghost.register(params=res["params"], target=res["target"])
+        liar = self.liar_value()
+        for params in pending:
+            ghost.register(params=params, target=liar)
+        return ghost.suggest()
+
+    def maximize(self, init_points=5, n_iter=25):
+        queue = list(self.optimizer.random_sample(init_points))
+        budget = init_points + n_iter
+
+        _SHARED["objective"] = self.f
+        try:
+            if self.n_workers == 1 or "fork" not in multiprocessing.get_all_start_methods():
+                for _ in range(budget):
+                    params = queue.pop(0) if queue else self.suggest([])
+                    self.register(params, _evaluate(params, self.context()))
+                return self
+
+            submitted = 0
+            pending = {}
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                while submitted < budget or pending:
+                    while submitted < budget and len(pending) < self.batch_size:
+                        params = queue.pop(0) if queue else self.suggest(list(pending.values()))
+                        future = executor.submit(_evaluate, params, self.context())
+                        pending[future] = params
+                        submitted += 1
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.register(pending.pop(future), future.result())
+            return self
+        finally:
+            _SHARED.clear()
@@ -7,19 +7,17 @@
 
 
 # 📦 General libraries
+import gc
 import os
-import shutil
 import numpy as np
 import pandas as pd
 
 # 📊 Visualization
-import matplotlib.pyplot as plt
-import seaborn as sns
-get_ipython().run_line_magic('matplotlib', 'inline')
+from diabetes import figures
+from diabetes.plots import PlotRenderer
 
 # ⚙️ Sklearn - Data Preprocessing & Model Selection
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler
+from sklearn.model_selection import train_test_split
 
 # 🧪 Sklearn - Metrics & Evaluation
 from sklearn.metrics import (
@@ -29,22 +27,21 @@ from sklearn.metrics import (
     f1_score
 )
 
-# 🤖 Sklearn - Classifiers
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import (
-    IsolationForest
-)
-from sklearn.neighbors import KNeighborsClassifier
-
-# 🌟 Boosting Libraries
-from xgboost import XGBClassifier
+# 🤖 Model, ruang pencarian, dan tuning (dipakai bersama `diabetes.pipeline`)
+from diabetes import modeling
 
-# 🔧 Sampling & Optimization
-from imblearn.over_sampling import SMOTE
-from bayes_opt import BayesianOptimization
-
-# 🌐 External Tools
-import kagglehub
+# 🩺 Project Modules
+from diabetes import preprocessing
+from diabetes.cache import ArtifactCache
+from diabetes.datasets import DatasetStore
+from diabetes.bundle import load_bundle, save_bundle
+from diabetes.dedup import deduplicate
+from diabetes.folding import fold_linear
+from diabetes.loader import load_brfss
+from diabetes.memory import MemoryReport, lean_mode
+from diabetes.profiling import profiler_from_env
+from diabetes.stats import iqr_summary
+from diabetes.training import train_models
 
 
 # Penjelasan:
@@ -52,72 +49,76 @@ import kagglehub
 # Mengimpor berbagai pustaka yang dibutuhkan untuk proses analisis data, visualisasi, preprocessing, modeling, evaluasi, hingga optimasi model.
 #
 # - **pandas** dan **numpy**: Manipulasi data numerik dan tabular.
-# - **matplotlib** dan **seaborn**: Untuk eksplorasi dan visualisasi data.
+# - **matplotlib** dan **seaborn**: Untuk eksplorasi dan visualisasi data. Setiap figur didefinisikan di `diabetes.figures` dan dirender oleh `PlotRenderer` di proses terpisah (backend Agg, tanpa tampilan).
 # - **scikit-learn**: Menyediakan alat bantu untuk preprocessing, pemodelan, evaluasi, dan seleksi model.
 # - **xgboost**: Pustaka boosting yang umum digunakan untuk klasifikasi dengan performa tinggi.
 # - **SMOTE**: Teknik penyeimbangan kelas dengan oversampling sintetis.
 # - **bayes_opt**: Untuk tuning hyperparameter model.
-# - **kagglehub**: Mengunduh dataset dari Kaggle langsung ke lingkungan kerja.
+# - **kagglehub**: Mengunduh dataset dari Kaggle langsung ke lingkungan kerja (dipanggil oleh `DatasetStore` hanya bila diperlukan).
+# - **diabetes**: Modul internal proyek (penyimpanan dan loader dataset, serta utilitas pipeline lainnya). Definisi model baseline, ruang pencarian `pbounds`, konfigurasi tuning, dan model akhir berada di `diabetes.modeling` sehingga skrip ini dan `python -m diabetes.pipeline` selalu menjalankan eksperimen yang sama.
 #
 
-# # Memuat Dataset
 
-
-# Download latest version
-path = kagglehub.dataset_download("alexteboul/diabetes-health-indicators-dataset")
-print("Path to dataset files:", path)
+LEAN = lean_mode()
+FLOAT_DTYPE = np.float32 if LEAN else np.float64
+memory = MemoryReport()
+profiler = profiler_from_env()
 
 
 # Penjelasan:
 #
-# - Mengunduh dataset **"Diabetes Health Indicators"** dari repository Kaggle menggunakan `kagglehub`.
-# - Menyimpan path folder hasil download ke dalam variabel `path` agar bisa digunakan pada langkah selanjutnya.
-# - Mencetak lokasi folder tempat dataset disimpan.
+# - `DIABETES_LEAN=1` mengaktifkan mode hemat memori: data yang sudah diskalakan disimpan sebagai float32 (data mentah tetap uint8 dari loader), dan data antara (`df`, `X_train`, `X_train_clean`, `X_train_scaled`, dst.) dilepas dengan `del` + `gc.collect()` segera setelah tahap berikutnya tidak lagi membutuhkannya.
+# - `memory.checkpoint(...)` dipanggil di akhir setiap tahap dan mencetak RSS saat ini serta **puncak RSS selama tahap tersebut**, sehingga tahap yang paling boros memori dapat langsung dikenali. Bandingkan keluaran `python main.py` dengan `DIABETES_LEAN=1 python main.py`.
+# - `DIABETES_PROFILE=1` mengaktifkan `profiler` (`diabetes.profiling`): setiap tahap utama diapit `profiler.start(...)`/`profiler.stop(...)` yang mencatat waktu dinding, waktu CPU, puncak RSS, dan jumlah baris. Di akhir skrip `profiler.report()` mencetak tabel ringkasan dan menulis `profiles/trace.json` (Chrome trace, dapat dibuka di `chrome://tracing` atau Perfetto) serta `profiles/speedscope.json` (flame graph di speedscope.app). Tanpa variabel tersebut `profiler` berupa objek kosong sehingga tidak ada pengukuran sama sekali.
+# - Untuk mengukur skala pipeline tanpa dataset Kaggle maupun internet, `python -m diabetes.benchmark --rows 250k 1M 10M` menjalankan tahap-tahap yang sama pada data sintetis berbentuk BRFSS (`diabetes.synthetic`: 21 fitur dengan domain yang sama dan ~13.9% kelas positif), mencatat waktu serta puncak RSS setiap tahap ke `benchmarks/history.json`, dan menandai tahap yang melambat dibandingkan run sebelumnya.
 #
 
+# # Memuat Dataset
+
 
+# Download latest version (hanya jika belum tersedia di penyimpanan lokal)
 new_dir = "diabetes_dataset"
-plot_dir = "plots"
-if os.path.exists(new_dir):
-    shutil.rmtree(new_dir)
-if os.path.exists(plot_dir):
-    shutil.rmtree(plot_dir)
-os.makedirs(new_dir, exist_ok=True)
-os.makedirs(plot_dir, exist_ok=True)
+store = DatasetStore(new_dir)
+path = store.ensure()
+print("Path to dataset files:", path)
 
 
 # Penjelasan:
 #
-# - Mendefinisikan variabel `new_dir` sebagai nama folder lokal untuk menyimpan dataset (`diabetes_dataset`).
-# - Mendefinisikan variabel `plot_dir` sebagai nama folder lokal untuk menyimpan hasil visualisasi (`plots`).
-# - Jika folder `new_dir` atau `plot_dir` sudah ada, maka folder tersebut akan dihapus menggunakan `shutil.rmtree(...)`.
-# - Membuat ulang folder `new_dir` dan `plot_dir` menggunakan `os.makedirs(..., exist_ok=True)` untuk memastikan folder tersedia tanpa error jika sudah ada sebelumnya.
+# - `DatasetStore` mengelola folder lokal `diabetes_dataset` sebagai penyimpanan dataset yang dialamatkan berdasarkan hash konten (sha256) dan dicatat di `diabetes_dataset/manifest.json`.
+# - `store.ensure()` hanya mengunduh dataset **"Diabetes Health Indicators"** dari Kaggle menggunakan `kagglehub` apabila salah satu dari tiga varian CSV belum tersedia atau checksum-nya tidak cocok. Jika semua file valid, unduhan dilewati sepenuhnya.
+# - Untuk host tanpa akses internet, dataset dapat diimpor sekali dengan `python -m diabetes.datasets --import <folder>` lalu pipeline dijalankan dengan `DIABETES_OFFLINE=1`.
+# - Mencetak lokasi folder tempat dataset disimpan.
+#
+# - Seluruh skrip ini juga tersedia sebagai DAG tahap lewat `python -m diabetes.pipeline [target ...]` (target: `data`, `dedup`, `eda`, `split`, `outliers`, `scale`, `smote`, `train`, `tune`, `final`, `score`). Cabang EDA dan cabang modeling dijalankan paralel setelah `dedup`, hanya tahap yang dibutuhkan target yang dijalankan (mis. `python -m diabetes.pipeline tune`), dan tahap yang kode, parameter, maupun masukannya tidak berubah langsung dimuat dari cache. Parameter dapat diubah dengan `--set outliers.contamination=0.05`, dan status cache setiap tahap dapat dilihat dengan `--list`.
+#
 
 
-# move the files to a new directory
-os.makedirs(new_dir, exist_ok=True)
-for file_name in os.listdir(path):
-    shutil.move(os.path.join(path, file_name), os.path.join(new_dir, file_name))
+plot_dir = "plots"
+os.makedirs(plot_dir, exist_ok=True)
+plots = PlotRenderer(plot_dir)
 
 
 # Penjelasan:
 #
-# - `os.makedirs(..., exist_ok=True)` digunakan untuk membuat folder bernama `diabetes_dataset` jika belum ada.
-# - `os.listdir(path)` mengambil daftar semua file dari direktori tempat dataset diunduh.
-# - `shutil.move(...)` memindahkan setiap file dari folder unduhan ke folder lokal yang telah dibuat.
+# - Mendefinisikan variabel `plot_dir` sebagai nama folder lokal untuk menyimpan hasil visualisasi (`plots`).
+# - Folder dibuat dengan `os.makedirs(..., exist_ok=True)` tanpa menghapus isinya terlebih dahulu; file plot yang lama akan ditimpa saat visualisasi dibuat ulang.
+# - `PlotRenderer` merender setiap figur secara paralel di *process pool* dan langsung menyimpannya ke `plot_dir`. Figur yang data masukan dan parameternya tidak berubah sejak render terakhir (dicatat di `plots/.render_cache.json`) akan dilewati.
 #
 
 
 # Load the dataset
-df = pd.read_csv(
-    os.path.join(new_dir, "diabetes_binary_health_indicators_BRFSS2015.csv")
-)
+profiler.start("memuat dataset")
+df = load_brfss(store.path("binary"))
+profiler.stop(rows=len(df))
+memory.checkpoint("memuat dataset")
 
 
 # Penjelasan:
 #
-# - `pd.read_csv(...)` digunakan untuk membaca file CSV dan memuatnya ke dalam bentuk DataFrame.
-# - `os.path.join(...)` menyusun path lengkap menuju file dataset yang telah dipindahkan ke folder `diabetes_dataset`.
+# - `load_brfss(...)` membaca file CSV dan memuatnya ke dalam bentuk DataFrame dengan tipe data ringkas: setiap kolom berupa kode integer kecil sehingga disimpan sebagai `uint8` (bukan `float64`), sekitar 8x lebih hemat memori.
+# - Pada pembacaan pertama, hasil konversi disimpan sebagai cache `.npy` per kolom di `diabetes_dataset/objects/.cache/`. Pembacaan berikutnya langsung membuka cache tersebut secara *memory-mapped* tanpa parsing CSV ulang.
+# - `store.path("binary")` mengembalikan path file `diabetes_binary_health_indicators_BRFSS2015.csv` di penyimpanan lokal. Varian lain tersedia sebagai `"binary_5050"` dan `"012"`.
 # - Hasil pembacaan disimpan dalam variabel `df` yang akan digunakan untuk proses analisis data berikutnya.
 #
 
@@ -127,6 +128,7 @@ df = pd.read_csv(
 
 
 # Type your code here
+profiler.start("eda & plot", rows=len(df))
 data_info = {
     "Jumlah Baris": df.shape[0],
     "Jumlah Kolom": df.shape[1],
@@ -140,7 +142,7 @@ print(data_info)
 #
 # - `df.shape[0]` menghitung jumlah baris (data observasi).
 # - `df.shape[1]` menghitung jumlah kolom (fitur).
-# - `df.dtypes.value_counts()` menghitung berapa banyak kolom berdasarkan tipe datanya (seperti float64, int64, dll).
+# - `df.dtypes.value_counts()` menghitung berapa banyak kolom berdasarkan tipe datanya (seperti uint8, float64, dll).
 # - Semua informasi dirangkum dalam dictionary `data_info` dan ditampilkan dengan `print(...)`.
 #
 
@@ -165,37 +167,19 @@ df.describe().T
 #
 
 
-num_cols = 3
-num_rows = int(np.ceil(len(df.columns) / num_cols))
+iqr_stats = iqr_summary(df)
+iqr_stats
 
-fig, axes = plt.subplots(nrows=num_rows, ncols=num_cols, figsize=(20, 5 * num_rows))
-axes = axes.flatten()
 
-for i, col in enumerate(df.columns):
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-
-    outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-    outlier_count = len(outliers)
-
-    sns.histplot(data=df, x=col, ax=axes[i], kde=True)
-    axes[i].set_title(f"Histogram {col}\nOutliers: {outlier_count}")
-    axes[i].set_xlabel("")
-    axes[i].set_ylabel("")
-    axes[i].set_xlim(df[col].min(), df[col].max())
-    axes[i].set_ylim(0, df[col].value_counts().max() * 1.1)
-
-# Hapus subplot kosong jika ada
-for j in range(i + 1, len(axes)):
-    fig.delaxes(axes[j])
+# Penjelasan:
+#
+# - `iqr_summary(df)` menghitung Q1, Q2 (median), Q3, IQR, batas bawah/atas (`Q1 − 1.5 × IQR` dan `Q3 + 1.5 × IQR`), nilai min/max, serta jumlah outlier untuk **seluruh kolom sekaligus**.
+# - Kuartil dihitung dengan satu pemanggilan `df.quantile([0.25, 0.5, 0.75])`, dan jumlah outlier diperoleh dari satu reduksi boolean pada seluruh matriks data, tanpa membuat salinan DataFrame per kolom.
+# - Tabel ringkasan `iqr_stats` ini digunakan kembali oleh visualisasi histogram di bawah ini.
+#
 
-plt.tight_layout()
-plt.show()
 
-plt.savefig(os.path.join(plot_dir, "1.univariate_analysis_histogram.png"), dpi=300, bbox_inches="tight")
+plots.submit("1.univariate_analysis_histogram.png", figures.univariate_histograms, df, iqr_stats)
 
 
 # Penjelasan:
@@ -216,23 +200,8 @@ plt.savefig(os.path.join(plot_dir, "1.univariate_analysis_histogram.png"), dpi=3
 #
 
 
-df_diabetes = df[df["Diabetes_binary"] == 1].copy()
-df_no_diabetes = df[df["Diabetes_binary"] == 0].copy()
-
-
 # Gender Distribution with Diabetes
-
-fig, (ax1, ax2) = plt.subplots(1, 2, sharey=True, figsize=(20, 10))
-ax1 = sns.countplot(data=df_no_diabetes, x="Sex", ax=ax1, palette="pastel")
-ax1.set(title="Gender distribution for no-diabetes")
-ax1.set_xticklabels(["Female", "Male"])
-
-ax2 = sns.countplot(data=df_diabetes, x="Sex", ax=ax2, palette="pastel")
-ax2.set(title="Gender distribution for diabetics")
-ax2.set_xticklabels(["Female", "Male"])
-plt.show()
-
-plt.savefig(os.path.join(plot_dir, "2.bivariate_analysis_gender_diabetes_distribution.png"), dpi=300, bbox_inches="tight")
+plots.submit("2.bivariate_analysis_gender_diabetes_distribution.png", figures.gender_distribution, df)
 
 
 # Penjelasan:
@@ -242,58 +211,7 @@ plt.savefig(os.path.join(plot_dir, "2.bivariate_analysis_gender_diabetes_distrib
 # - Kesimpulannya, **faktor gender tidak menunjukkan pengaruh besar terhadap kemungkinan terkena diabetes dalam data ini**, karena proporsi pria dan wanita hampir seimbang di kedua kategori.
 
 
-df_age = df[["Diabetes_binary", "Age"]].copy()
-
-columnMappingValues = {
-    "Age": {
-        1: "18-24",
-        2: "25-29",
-        3: "30-34",
-        4: "35-39",
-        5: "40-44",
-        6: "45-49",
-        7: "50-54",
-        8: "55-59",
-        9: "60-64",
-        10: "65-69",
-        11: "70-74",
-        12: "75-79",
-        13: "80 or older",
-    }
-}
-
-df_age["Age_Category"] = df_age["Age"].map(columnMappingValues["Age"])
-fig, ax = plt.subplots(figsize=(14, 6))
-sns.countplot(
-    data=df_age,
-    x="Age_Category",
-    hue="Diabetes_binary",  # 1: diabetes, 0: tidak
-    order=list(columnMappingValues["Age"].values()),
-    palette="Set2",
-    ax=ax,
-)
-ax.set_title("Distribusi Kategori Usia Berdasarkan Status Diabetes")
-ax.set_xlabel("Kategori Usia")
-ax.set_ylabel("Jumlah")
-plt.xticks(rotation=45)
-ax.legend(title="Diabetes", labels=["Tidak", "Ya"])
-
-for p in ax.patches:
-    height = p.get_height()
-    if height > 0:
-        ax.text(
-            p.get_x() + p.get_width() / 2,
-            height + 1,
-            int(height),
-            ha="center",
-            va="bottom",
-            fontsize=9,
-        )
-
-plt.tight_layout()
-plt.show()
-
-plt.savefig(os.path.join(plot_dir, "3.bivariate_analysis_age_diabetes_distribution.png"), dpi=300, bbox_inches="tight")
+plots.submit("3.bivariate_analysis_age_diabetes_distribution.png", figures.age_distribution, df)
 
 
 #
@@ -306,109 +224,7 @@ plt.savefig(os.path.join(plot_dir, "3.bivariate_analysis_age_diabetes_distributi
 
 
 # BMI Distribution for people without diabetes vs. with diabetes
-fig, ax = plt.subplots(figsize=(12, 10))
-
-sns.boxplot(
-    data=df,
-    x="Diabetes_binary",
-    y="BMI",
-    hue="Diabetes_binary",
-    palette="pastel",
-    ax=ax,
-    legend=False,
-)
-
-quartiles = df.groupby("Diabetes_binary")["BMI"].quantile([0.25, 0.5, 0.75]).unstack()
-for xtick in quartiles.index:
-    for q, label in zip([0.25, 0.5, 0.75], ["Q1", "Median (Q2)", "Q3"]):
-        value = quartiles.loc[xtick, q]
-        ax.text(
-            xtick,
-            value,
-            f"{label}: {value:.1f}",
-            ha="center",
-            va="center",
-            fontweight="bold",
-            color="black",
-            bbox=dict(facecolor="white", edgecolor="black", boxstyle="round,pad=0.3"),
-        )
-
-for xtick in quartiles.index:
-    Q1, Q3 = quartiles.loc[xtick, [0.25, 0.75]]
-    IQR = Q3 - Q1
-    lower_limit = Q1 - 1.5 * IQR
-    upper_limit = Q3 + 1.5 * IQR
-
-    ax.text(
-        xtick,
-        lower_limit,
-        f"Lower: {lower_limit:.1f}",
-        ha="center",
-        va="center",
-        fontweight="bold",
-        color="blue",
-        bbox=dict(facecolor="white", edgecolor="blue", boxstyle="round,pad=0.3"),
-    )
-    ax.text(
-        xtick,
-        upper_limit,
-        f"Upper: {upper_limit:.1f}",
-        ha="center",
-        va="center",
-        fontweight="bold",
-        color="blue",
-        bbox=dict(facecolor="white", edgecolor="blue", boxstyle="round,pad=0.3"),
-    )
-
-max_bmi = df.groupby("Diabetes_binary")["BMI"].max()
-min_bmi = df.groupby("Diabetes_binary")["BMI"].min()
-
-if not max_bmi.empty and not min_bmi.empty:
-    ax.plot(
-        [0, 1],
-        [max_bmi[0], max_bmi[1]],
-        color="orange",
-        linestyle="--",
-        label="Max BMI",
-    )
-    ax.plot(
-        [0, 1],
-        [min_bmi[0], min_bmi[1]],
-        color="purple",
-        linestyle="--",
-        label="Min BMI",
-    )
-
-    for xtick in max_bmi.index:
-        ax.text(
-            xtick,
-            max_bmi[xtick],
-            f"Max: {max_bmi[xtick]:.1f}",
-            ha="center",
-            va="bottom",
-            fontweight="bold",
-            color="orange",
-            bbox=dict(facecolor="white", edgecolor="orange", boxstyle="round,pad=0.3"),
-        )
-        ax.text(
-            xtick,
-            min_bmi[xtick],
-            f"Min: {min_bmi[xtick]:.1f}",
-            ha="center",
-            va="top",
-            fontweight="bold",
-            color="purple",
-            bbox=dict(facecolor="white", edgecolor="purple", boxstyle="round,pad=0.3"),
-        )
-
-ax.set_title("BMI Distribution for Diabetics vs. Non-Diabetics")
-ax.set_xlabel("Diabetes Binary")
-ax.set_ylabel("BMI")
-plt.xticks([0, 1], ["Non-Diabetic", "Diabetic"])
-ax.legend()
-plt.show()
-
-plt.savefig(os.path.join(plot_dir, "4.bivariate_analysis_bmi_diabetes_distribution.png"), dpi=300, bbox_inches="tight")
+plots.submit("4.bivariate_analysis_bmi_diabetes_distribution.png", figures.bmi_distribution, df)
 
 
 # Penjelasan:
@@ -422,13 +238,8 @@ plt.savefig(os.path.join(plot_dir, "4.bivariate_analysis_bmi_diabetes_distributi
 # ## EDA : Multivariate Analysis
 
 
-plt.figure(figsize=(20, 20))
-correlation = df.corr(numeric_only=True)
-sns.heatmap(correlation, annot=True, fmt=".2f", cmap="coolwarm", square=True)
-plt.title("Heatmap Korelasi antar Variabel")
-plt.show()
-
-plt.savefig(os.path.join(plot_dir, "5.multivariate_analysis_correlation_heatmap.png"), dpi=300, bbox_inches="tight")
+plots.submit("5.multivariate_analysis_correlation_heatmap.png", figures.correlation_heatmap, df)
+profiler.stop()
 
 
 # Penjelasan:
@@ -479,81 +290,45 @@ else:
 
 
 # Delete Duplicate Rows
-df.duplicated().sum()
+profiler.start("hapus duplikat", rows=len(df))
+dedup = deduplicate(df, target="Diabetes_binary")
+dedup.n_duplicates
 
 
 # Penjelasan:
-# - Dilakukan pemeriksaan terhadap baris yang memiliki data duplikat secara keseluruhan.
+# - Dilakukan pemeriksaan terhadap baris yang memiliki data duplikat secara keseluruhan menggunakan `deduplicate(...)`. Karena setiap kolom berupa integer kecil, satu baris dikodekan menjadi satu kunci `uint64` (packing mixed-radix) sehingga duplikat ditemukan dengan satu kali `np.unique`.
 # - Hasilnya menunjukkan terdapat **24.206 baris duplikat** dari total 253.680 baris data.
 # - Keberadaan data duplikat dapat menyebabkan **bias dalam pelatihan model**, terutama jika duplikasi terjadi secara tidak seimbang antara kelas mayoritas dan minoritas.
 # - Oleh karena itu, semua baris duplikat akan dihapus untuk memastikan keunikan data yang akan digunakan dalam proses modeling.
 
 
-df.drop_duplicates(inplace=True)
+df = dedup.frame
+profiler.stop()
+memory.checkpoint("hapus duplikat")
 
 
 print(df.shape)
 
 
-# # Mengatasi Outlier
-
-
-num_cols = 3
-num_rows = (len(df.columns) + num_cols - 1) // num_cols
-
-fig, axes = plt.subplots(nrows=num_rows, ncols=num_cols, figsize=(20, 5 * num_rows))
-axes = axes.flatten()
-outlier_dict = {}
-
-for i, col in enumerate(df.columns):
-    sns.boxplot(data=df, x=col, ax=axes[i])
-    axes[i].set_title(f"Boxplot {col}")
-    axes[i].set_xlabel("")
-
-    Q1 = df[col].quantile(0.25)
-    Q2 = df[col].quantile(0.50)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
+# Penjelasan:
+# - `dedup.frame` berisi baris unik dalam urutan kemunculan pertama, identik dengan hasil `df.drop_duplicates()`.
+# - `dedup.counts` mencatat berapa kali setiap baris unik muncul pada data asli. Model di notebook ini dilatih tanpa bobot, sesuai dengan membuang duplikat; multiplisitas ini hanya dipakai untuk analisis.
+# - `dedup.class_counts` mencatat, untuk setiap baris unik, jumlah baris asli dengan nilai fitur yang sama pada masing-masing kelas `Diabetes_binary`.
 
-    outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-    outlier_count = len(outliers)
-    outlier_dict[col] = outliers[col]
-
-    axes[i].annotate(
-        f"Q1: {Q1:.2f}",
-        xy=(Q1, 0.25),
-        xytext=(Q1, 0.35),
-        arrowprops=dict(facecolor="black", shrink=0.05),
-    )
-    axes[i].annotate(
-        f"Q2: {Q2:.2f}",
-        xy=(Q2, 0.25),
-        xytext=(Q2, 0.35),
-        arrowprops=dict(facecolor="black", shrink=0.05),
-    )
-    axes[i].annotate(
-        f"Q3: {Q3:.2f}",
-        xy=(Q3, 0.25),
-        xytext=(Q3, 0.35),
-        arrowprops=dict(facecolor="black", shrink=0.05),
-    )
 
+# # Mengatasi Outlier
 
-for j in range(i + 1, len(axes)):
-    fig.delaxes(axes[j])
 
-plt.tight_layout()
-plt.show()
+iqr_stats = iqr_summary(df)
 
-plt.savefig(os.path.join(plot_dir, "6.Outlier_analysis_boxplot.png"), dpi=300, bbox_inches="tight")
+plots.submit("6.Outlier_analysis_boxplot.png", figures.outlier_boxplots, df, iqr_stats)
 
-for col, outliers in outlier_dict.items():
-    print(f"\nOutliers pada fitur '{col}' ({len(outliers)} data):")
+for col, outlier_count in iqr_stats["outliers"].items():
+    print(f"\nOutliers pada fitur '{col}' ({outlier_count} data):")
 
 
 # Penjelasan:
+# - Statistik IQR dihitung ulang dengan `iqr_summary(df)` karena data telah berubah setelah penghapusan duplikat; tabel yang sama dipakai untuk anotasi kuartil pada boxplot dan untuk mencetak jumlah outlier per fitur.
 # - Boxplot dan perhitungan IQR menunjukkan bahwa beberapa fitur dalam dataset memiliki **jumlah outlier yang sangat signifikan**, khususnya pada fitur-fitur numerik kontinu dan ordinal.
 # - Fitur-fitur seperti **MentHlth (36.162 outlier)**, **PhysHlth (34.346)**, **DiffWalk (42.625)**, dan **BMI (9.047)** menampilkan distribusi yang sangat condong ke nilai rendah, tetapi dengan nilai maksimum yang jauh lebih tinggi dari Q3, menciptakan outlier ekstrem di bagian atas.
 # - Fitur seperti **GenHlth**, **HeartDiseaseorAttack**, **Veggies**, **HvyAlcoholConsump**, dan **NoDocbcCost** juga menunjukkan outlier dalam jumlah puluhan ribu, yang bisa mendistorsi pola pembelajaran model jika tidak ditangani dengan tepat.
@@ -568,6 +343,11 @@ y = df["Diabetes_binary"]
 
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 print(X_train.shape, y_train.shape, X_test.shape, y_test.shape)
+feature_names = list(X.columns)
+if LEAN:
+    del df, dedup, X, y
+    gc.collect()
+memory.checkpoint("split data")
 
 
 # Interpretasi:
@@ -589,24 +369,46 @@ print(X_train.shape, y_train.shape, X_test.shape, y_test.shape)
 #
 
 
-IF = IsolationForest(contamination=0.075, random_state=42)
+artifacts = ArtifactCache()
+
+profiler.start("isolation forest", rows=len(X_train))
+score_stage = artifacts.run(
+    "isolation_forest", preprocessing.score_outliers, X_train, random_state=42
+)
+IF = score_stage["isolation_forest"]
+anomaly_scores = score_stage["anomaly_scores"]
+
+for level in (0.025, 0.05, 0.075, 0.1, 0.15):
+    n_level = np.sum(preprocessing.outlier_labels(anomaly_scores, level) == -1)
+    print(f"contamination={level:<6} -> {n_level} outlier")
 
-outlier_labels = IF.fit_predict(X_train)
+outlier_stage = preprocessing.remove_outliers(
+    X_train, y_train, anomaly_scores, contamination=0.075
+)
+outlier_labels = outlier_stage["outlier_labels"]
 
 n_outliers = np.sum(outlier_labels == -1)
 print(f"Jumlah outlier yang terdeteksi: {n_outliers}")
 print(f"Jumlah data yang tidak terdeteksi sebagai outlier: {len(X_train) - n_outliers}")
+profiler.stop()
+memory.checkpoint("isolation forest")
 
 
 # Interpretasi:
 # - Menggunakan Isolation Forest untuk mendeteksi outlier pada data latih.
+# - Tahap ini dijalankan melalui `ArtifactCache`: keluaran (model yang sudah di-fit dan skor anomali `score_samples` setiap baris latih) disimpan di `.cache/artifacts/` dengan kunci hash dari data masukan dan parameter. Jika data dan parameter tidak berubah, hasilnya langsung dimuat ulang (memory-mapped) tanpa fit ulang.
+# - Pohon dibangun paralel (`n_jobs`) dan skor dihitung per potongan baris di thread pool. Skor ini tidak bergantung pada `contamination`, sehingga model cukup di-fit sekali.
+# - `contamination` diterapkan belakangan sebagai potongan kuantil atas skor yang sudah tersimpan (`preprocessing.outlier_labels`), hasilnya identik dengan `IsolationForest(contamination=...).fit_predict(...)`. Mencoba beberapa nilai `contamination` (seperti tabel di atas) hanya membutuhkan satu `np.percentile`; tahap-tahap berikutnya di-cache per data latih bersih, sehingga pengaruh setiap nilai terhadap F1 dapat dibandingkan tanpa menghitung ulang Isolation Forest.
 # - Parameter contamination=0.075 berarti diasumsikan sekitar 7.5% data adalah outlier.
 # - Ditemukan 13.769 sampel dianggap outlier dari 183.579 data latih.
 # - Outlier ini akan dibuang agar model hanya belajar dari pola data "normal".
 
 
-X_train_clean = X_train[outlier_labels != -1]
-y_train_clean = y_train[outlier_labels != -1]
+X_train_clean = outlier_stage["X_train_clean"]
+y_train_clean = outlier_stage["y_train_clean"]
+if LEAN:
+    del X_train, y_train, outlier_stage, score_stage
+    gc.collect()
 
 
 # Interpretasi:
@@ -632,13 +434,22 @@ y_train_clean = y_train[outlier_labels != -1]
 # # Normalisasi Fitur
 
 
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train_clean)
-X_test_scaled = scaler.transform(X_test)
+profiler.start("normalisasi", rows=len(X_train_clean))
+scale_stage = artifacts.run(
+    "standard_scaler", preprocessing.scale_features, X_train_clean, X_test, dtype=FLOAT_DTYPE
+)
+scaler = scale_stage["scaler"]
+X_train_scaled = scale_stage["X_train_scaled"]
+X_test_scaled = scale_stage["X_test_scaled"]
 
 df_train_scaled = pd.DataFrame(X_train_scaled, columns=X_train_clean.columns)
 
 print(df_train_scaled.sample(5).T)
+profiler.stop()
+if LEAN:
+    del X_train_clean, df_train_scaled, scale_stage
+    gc.collect()
+memory.checkpoint("normalisasi")
 
 
 # Penjelasan:
@@ -655,8 +466,17 @@ print(
     y_train_clean[y_train_clean == 0].shape[0],
 )
 
-smote = SMOTE(random_state=42)
-X_train_final, y_train_final = smote.fit_resample(X_train_scaled, y_train_clean)
+profiler.start("smote", rows=len(X_train_scaled))
+smote_stage = artifacts.run(
+    "smote", preprocessing.oversample, X_train_scaled, y_train_clean, random_state=42
+)
+X_train_final = smote_stage["X_train_final"]
+y_train_final = smote_stage["y_train_final"]
+profiler.stop()
+if LEAN:
+    del X_train_scaled, smote_stage
+    gc.collect()
+memory.checkpoint("smote")
 
 print(
     y_train_final[y_train_final == 1].shape[0],
@@ -671,22 +491,18 @@ print(X_train_final.shape, y_train_final.shape, X_test_scaled.shape, y_test.shap
 # - Untuk mengatasi hal ini digunakan teknik **SMOTE (Synthetic Minority Over-sampling Technique)**, yaitu metode yang menciptakan data sintetis baru pada kelas minoritas untuk menyeimbangkan distribusi.
 # - SMOTE hanya diterapkan pada data latih yang telah dibersihkan dan diskalakan (`X_train_scaled`, `y_train_clean`), untuk menjaga integritas data uji.
 # - Setelah SMOTE, distribusi kelas menjadi **seimbang**, memungkinkan model untuk belajar secara adil dari kedua kelas.
+# - SMOTE dijalankan oleh `ChunkedSMOTE` (`diabetes.oversampling`) yang mengikuti algoritma dan urutan bilangan acak `imblearn.SMOTE` (tetangga yang jaraknya seri diurutkan menurut indeks baris, jadi baris sintetis bisa berbeda dari `imblearn` pada baris kembar), tetapi mencari tetangga kelas minoritas per blok secara paralel dan menulis baris sintetis per potongan langsung ke buffer yang sudah dialokasikan (atau file `.npy` memory-mapped). Tipe data hasil sama dengan `X_train_scaled`: float64 seperti `imblearn.SMOTE`, atau float32 pada mode hemat memori sehingga matriks latih hasil oversampling berukuran setengah. Untuk data yang jauh lebih besar tersedia `iter_resample(...)` yang menghasilkan batch secara malas tanpa membentuk matriks hasil utuh.
+# - Seperti Isolation Forest, tahap normalisasi dan SMOTE juga di-cache oleh `ArtifactCache`, sehingga iterasi pemodelan berikutnya tidak perlu mengulang preprocessing selama data dan parameternya sama. Cache dapat dinonaktifkan dengan `DIABETES_CACHE=0`.
 #
 
 # # Pembangunan Model Klasifikasi
 
 
-models = {
-    "Logistic_Regression": LogisticRegression(C=1, solver="liblinear", max_iter=200),
-    "K-Nearest_Neighbour": KNeighborsClassifier(
-        n_neighbors=10, weights="distance", algorithm="auto"
-    ),
-    "XGBoost": XGBClassifier(eval_metric="mlogloss"),
-}
+models = modeling.baseline_models()
 
 
 # Penjelasan:
-# - Untuk mengevaluasi performa berbagai algoritma klasifikasi, didefinisikan 3 model yang akan dibandingkan:
+# - Untuk mengevaluasi performa berbagai algoritma klasifikasi, didefinisikan 3 model yang akan dibandingkan (`modeling.baseline_models()`):
 #
 # 1. **Logistic Regression**
 #    - Merupakan model dasar yang digunakan untuk klasifikasi biner.
@@ -698,7 +514,8 @@ models = {
 #    - Merupakan model berbasis instance (lazy learner) yang memprediksi label berdasarkan tetangga terdekat.
 #    - `n_neighbors=10` artinya prediksi akan didasarkan pada 10 tetangga terdekat.
 #    - `weights="distance"` memberi bobot lebih besar pada tetangga yang lebih dekat.
-#    - `algorithm="auto"` membuat sklearn otomatis memilih algoritma pencarian tetangga terbaik (brute force, KDTree, atau BallTree).
+#    - Pencarian tetangga memakai `FastKNeighborsClassifier` (`diabetes.neighbors`), pengganti `KNeighborsClassifier` dengan jarak Euclidean yang sama: titik latih maupun baris uji yang kembar hanya dihitung sekali (dengan multiplisitasnya), jarak dihitung per blok dalam float32 lalu kandidat terdekat dihitung ulang secara eksak, dan blok kueri dijalankan paralel dengan memori per blok yang dibatasi.
+#    - Untuk eksperimen cepat tersedia indeks aproksimasi berbasis k-means (`n_cells`, `n_probe`); secara default pencarian tetap eksak.
 #
 # 3. **XGBoost (Extreme Gradient Boosting)**
 #    - Algoritma boosting yang kuat dan populer untuk berbagai kompetisi klasifikasi.
@@ -711,11 +528,14 @@ models = {
 
 
 results = {}
-
-for model_name, model in models.items():
-    model.fit(X_train_final, y_train_final)
-
-    y_test_pred = model.predict(X_test_scaled)
+profiler.start("training 3 model", rows=len(X_train_final))
+trained = train_models(models, X_train_final, y_train_final, X_test_scaled)
+profiler.stop()
+memory.checkpoint("training 3 model")
+
+for model_name, run in trained.items():
+    models[model_name] = run["model"]
+    y_test_pred = run["y_pred"]
     print('y_test_pred[:10]:', y_test_pred[:10])
 
     results[model_name] = {
@@ -725,50 +545,36 @@ for model_name, model in models.items():
             y_test, y_test_pred, output_dict=True
         ),
         "confusion_matrix_test": confusion_matrix(y_test, y_test_pred),
+        "fit_time": run["fit_time"],
+        "predict_time": run["predict_time"],
     }
 
     # ==== Cetak metrik ====
     print(f"🔍 Model: {model_name}")
+    print(f"CPU Cores         : {run['n_jobs']}")
+    print(f"Fit Time          : {run['fit_time']:.2f} s")
+    print(f"Predict Time      : {run['predict_time']:.2f} s")
     print(f"Test Accuracy     : {results[model_name]['test_accuracy']:.4f}")
     print(f"Test F1 Score     : {results[model_name]['test_f1']:.4f}")
     print("=" * 40)
 
     # ==== Buat plot ====
-    fig, axes = plt.subplots(1, 2, figsize=(16, 5))
-
-    # === Heatmap Classification Report (Test) ===
     cr_test_df = pd.DataFrame(results[model_name]["classification_report_test"]).T
     print('Classification Report:\n', cr_test_df)
-    cr_test_df = cr_test_df.iloc[:-1, :] 
-    sns.heatmap(
-        cr_test_df,
-        annot=True,
-        fmt=".2f",
-        cmap="coolwarm",
-        linewidths=0.5,
-        ax=axes[0],
-        cbar=False,
-    )
-    axes[0].set_title(f"Classification Report (Test) - {model_name}", fontsize=12)
-    axes[0].set_ylabel("Classes", fontsize=10)
-    axes[0].set_xlabel("Metrics", fontsize=10)
-
-    # === Heatmap Confusion Matrix (Test) ===
-    cm_test = results[model_name]["confusion_matrix_test"]
-    sns.heatmap(cm_test, annot=True, fmt="d", cmap="Blues", linewidths=0.5, ax=axes[1])
-    axes[1].set_title(f"Confusion Matrix (Test) - {model_name}", fontsize=12)
-    axes[1].set_xlabel("Predicted Label", fontsize=10)
-    axes[1].set_ylabel("True Label", fontsize=10)
-
-    plt.tight_layout()
-    plt.show()
-    plt.savefig(
-        os.path.join(plot_dir, f"7.{model_name}_classification_report_confusion_matrix.png"),
-        dpi=300,
-        bbox_inches="tight",
+    plots.submit(
+        f"7.{model_name}_classification_report_confusion_matrix.png",
+        figures.classification_report_confusion_matrix,
+        results[model_name]["classification_report_test"],
+        results[model_name]["confusion_matrix_test"],
+        model_name,
     )
 
 
+# Penjelasan:
+# - `train_models(...)` melatih ketiga model **secara bersamaan** di *process pool*, bukan satu per satu. Bila core lebih sedikit dari jumlah model, hanya sebanyak jumlah core yang berjalan bersamaan (dengan satu core, berurutan) agar CPU tidak dipakai berlebihan.
+# - Core CPU dibagi antar model: Logistic Regression (`liblinear`, hanya memakai satu core) mendapat 1 core, sedangkan sisa core dibagi antara XGBoost (`n_jobs`) dan KNN (paralelisme query). Dengan begitu total waktu mendekati waktu model paling lambat, bukan jumlah waktu ketiganya.
+# - Waktu fit dan predict setiap model dicatat di `results` dan dicetak bersama metrik evaluasinya.
+
 # ## 📊 Evaluasi dan Perbandingan Model
 #
 # ### 🔍 Metode Evaluasi
@@ -837,40 +643,35 @@ for model_name, model in models.items():
 # # Hyperparameter Tuning Model Terbaik (XGBoost)
 
 
-def xgb_cv(n_estimators, max_depth, learning_rate, subsample, colsample_bytree):
-    # Example function body
-    model = XGBClassifier(
-        n_estimators=int(n_estimators),
-        max_depth=int(max_depth),
-        learning_rate=learning_rate,
-        subsample=subsample,
-        colsample_bytree=colsample_bytree,
-        eval_metric="logloss",
-        random_state=42,
-    )
-    scores = cross_val_score(
-        model, X_train_final, y_train_final, cv=3, scoring="f1_weighted"
-    )
-    return scores.mean()
-
+TUNING_WORKERS = modeling.tuning_workers()
+XGB_THREADS = modeling.xgb_threads(TUNING_WORKERS)
+print(modeling.TUNING_CONFIG)
+print(modeling.PBOUNDS)
 
-pbounds = {
-    "n_estimators": (100, 300),
-    "max_depth": (3, 10),
-    "learning_rate": (0.01, 0.2),
-    "subsample": (0.6, 1.0),
-    "colsample_bytree": (0.6, 1.0),
-}
 
-optimizer = BayesianOptimization(f=xgb_cv, pbounds=pbounds, random_state=42)
+profiler.start("bayesian optimization", rows=len(X_train_final))
+optimizer = modeling.tune_xgboost(
+    X_train_final, y_train_final, init_points=5, n_iter=25, random_state=42, workers=TUNING_WORKERS
+)
 
-optimizer.maximize(init_points=5, n_iter=25)
+tuning_report = optimizer.report()
+print(tuning_report[["score", "target", "folds", "boosting_rounds", "best_n_estimators", "pruned"]])
+print(f"Trial di-prune        : {tuning_report['pruned'].sum()} dari {len(tuning_report)}")
+print(f"Total boosting rounds : {tuning_report['boosting_rounds'].sum()}")
+profiler.stop()
+memory.checkpoint("tuning")
 
 
 # Penjelasan:
 # - Setelah diketahui bahwa **XGBoost merupakan model terbaik**, dilakukan tuning hyperparameter untuk meningkatkan performa lebih lanjut.
 # - Digunakan pendekatan **Bayesian Optimization**, yang lebih efisien dibanding grid/random search karena memperhitungkan hasil sebelumnya untuk menentukan kombinasi selanjutnya.
 # - Proses tuning dilakukan menggunakan **3-fold cross-validation** dengan metrik evaluasi `f1_weighted`.
+# - Fungsi objektif (`XGBoostCVObjective` dengan konfigurasi `modeling.TUNING_CONFIG`) menerapkan **early stopping** di setiap fold: 10% data latih fold disisihkan sebagai validasi, dan pelatihan berhenti jika `logloss` validasi tidak membaik selama 20 round. Dengan demikian `n_estimators` menjadi batas atas jumlah pohon.
+# - Pembagian 3 fold beserta matriks `QuantileDMatrix` (data yang sudah dikuantisasi ke histogram XGBoost) dibangun **sekali** di setiap worker dan dipakai ulang oleh seluruh trial melalui `xgb.train`, sehingga sketsa kuantil dan penyalinan data `X_train_final` tidak diulang pada setiap fit.
+# - Trial juga dapat **di-prune** setelah fold pertama: jika skor fold pertamanya di bawah median skor fold pertama trial-trial sebelumnya, dua fold sisanya tidak dijalankan. Ruang pencarian `modeling.PBOUNDS` tidak berubah.
+# - `tuning_report` mencatat skor, jumlah fold yang dijalankan, jumlah boosting round yang benar-benar dilatih, serta status pruning setiap trial.
+# - Evaluasi kandidat dijalankan secara paralel oleh `BatchBayesianOptimization`: hingga `TUNING_WORKERS` kandidat (default `min(4, jumlah core)`, dapat diatur lewat `DIABETES_TUNING_WORKERS`) dievaluasi bersamaan, masing-masing dengan `XGB_THREADS` thread XGBoost.
+# - Kandidat baru diusulkan dengan strategi *constant liar*: kandidat yang masih berjalan dianggap bernilai F1 terendah sejauh ini, sehingga GP tidak mengusulkan titik yang sama. Hasil sebenarnya didaftarkan ke optimizer segera setelah evaluasi selesai.
 #
 # ### 🎯 Parameter yang Dituning:
 # | Parameter            | Rentang                        | Fungsi                                           |
@@ -883,23 +684,12 @@ optimizer.maximize(init_points=5, n_iter=25)
 #
 
 
-iterations = list(range(1, len(optimizer.res) + 1))
 scores = [res["target"] for res in optimizer.res]
 
-plt.figure(figsize=(10, 5))
-plt.plot(iterations, scores, marker="o", linestyle="--", color="blue")
-plt.title("Bayesian Optimization: F1 Score vs Iterasi")
-plt.xlabel("Iterasi")
-plt.ylabel("F1 Score (Weighted)")
-plt.grid(True)
-plt.xticks(iterations)
-plt.tight_layout()
-plt.show()
-
-plt.savefig(
-    os.path.join(plot_dir, "8.bayesian_optimization_f1_score_vs_iterations.png"),
-    dpi=300,
-    bbox_inches="tight",
+plots.submit(
+    "8.bayesian_optimization_f1_score_vs_iterations.png",
+    figures.optimization_history,
+    scores,
 )
 
 
@@ -919,15 +709,14 @@ print("🔍 Best Result:")
 print(optimizer.max)
 
 # Ambil parameter terbaik
-best_params = optimizer.max["params"]
-best_params["n_estimators"] = int(best_params["n_estimators"])
-best_params["max_depth"] = int(best_params["max_depth"])
+best_params = modeling.best_params(optimizer)
 
 # Train final model
-best_model = XGBClassifier(
-    **best_params, use_label_encoder=False, eval_metric="logloss"
-)
+best_model = modeling.final_model(best_params)
+profiler.start("model akhir", rows=len(X_train_final))
 best_model.fit(X_train_final, y_train_final)
+profiler.stop()
+memory.checkpoint("model akhir")
 
 
 # Penjelasan:
@@ -942,8 +731,10 @@ best_model.fit(X_train_final, y_train_final)
 # | `colsample_bytree`   | 0.8456                                   |
 #
 # Proses Implementasi
-# - Parameter hasil dari `optimizer.max["params"]` diambil, kemudian `n_estimators` dan `max_depth` dikonversi ke integer.
-# - Model XGBoost akhir dibuat dengan `use_label_encoder=False` dan `eval_metric="logloss"` untuk kompatibilitas versi XGBoost modern.
+# - Parameter trial terbaik diambil oleh `modeling.best_params(optimizer)`, dengan `max_depth` dikonversi ke integer.
+# - Skor CV setiap trial dihasilkan oleh booster yang dihentikan early stopping di `best_iteration`, sehingga `n_estimators` model akhir diisi rata-rata `best_iteration + 1` dari fold-fold trial terbaik (kolom `best_n_estimators` di `tuning_report`), bukan batas atas yang diusulkan optimizer. Dengan begitu F1 hasil tuning benar-benar menggambarkan model yang disimpan.
+# - Trial yang di-prune hanya punya skor fold pertama; skor ini didaftarkan ke GP dengan penalti (paling tinggi sama dengan skor terburuk sejauh ini) sehingga tidak dianggap setara rata-rata CV penuh dan tidak pernah terpilih sebagai parameter terbaik.
+# - Model XGBoost akhir dibuat oleh `modeling.final_model(...)` dengan `eval_metric="logloss"`.
 # - Model kemudian dilatih ulang menggunakan seluruh data latih bersih dan seimbang (`X_train_final`, `y_train_final`).
 #
 # Tujuan utama pelatihan ulang ini adalah untuk:
@@ -951,6 +742,50 @@ best_model.fit(X_train_final, y_train_final)
 # - Memastikan model benar-benar belajar dari data dengan parameter yang memberikan generalisasi terbaik.
 
 
+bundle_path = os.path.join("models", "diabetes_xgb.bundle")
+save_bundle(
+    bundle_path, best_model.get_booster(), scaler, feature_names, threshold=0.5, params=best_params
+)
+
+
+# Penjelasan:
+# - Model akhir disimpan sebagai **satu file bundle** berversi (`models/diabetes_xgb.bundle`) yang berisi booster XGBoost (format UBJSON), vektor mean/scale `StandardScaler`, urutan fitur dari `X.columns`, threshold keputusan, serta checksum sha256.
+# - Bundle dimuat dalam hitungan milidetik: array numerik dibuka secara memory-mapped dan booster dimuat langsung dari buffer. Verifikasi checksum dan waktu muat dapat diperiksa dengan `python -m diabetes.bundle models/diabetes_xgb.bundle`.
+# - Dengan begitu data survei baru dapat diskor tanpa menjalankan ulang seluruh skrip, misalnya:
+#   `python -m diabetes.score models/diabetes_xgb.bundle data_baru.csv hasil.csv --chunk-size 100000`
+# - Untuk prediksi per pasien dari layanan lain, bundle yang sama dapat dilayani lewat server HTTP dengan micro-batching, lalu diuji dengan generator beban lokal:
+#   `python -m diabetes.server models/diabetes_xgb.bundle --port 8000 --max-wait-ms 2`
+#   `python -m diabetes.loadgen --url http://127.0.0.1:8000 --concurrency 64 --requests 20000`
+# - Server tersebut mengevaluasi pohon-pohon XGBoost yang sudah diratakan ke array NumPy (`diabetes.forest`), sehingga proses skoring ringan tidak memerlukan xgboost. Kecocokan prediksi dan latensinya terhadap booster asli dapat diperiksa dengan `python -m diabetes.forest models/diabetes_xgb.bundle`.
+# - Skoring dilakukan secara streaming: file dibaca per potongan oleh thread terpisah sementara potongan sebelumnya diprediksi, dan probabilitas ditulis bertahap sehingga penggunaan memori tetap datar.
+# - Karena fitur BRFSS berupa kode integer berdomain kecil dan profil pasien banyak berulang, setiap baris di-pack menjadi satu kunci `uint64` dan probabilitasnya dimemoisasi di cache berukuran tetap (`diabetes.memo`, eviksi LRU). Hanya profil yang belum pernah dilihat yang dievaluasi model, dan hit rate cache dicetak di akhir skoring.
+# - Saat data survei BRFSS tahun berikutnya tersedia, model tidak perlu dituning dan dilatih ulang dari nol. `python -m diabetes.incremental models/diabetes_xgb.bundle data_baru.csv --base <csv lama> --rounds 50 --output models/diabetes_xgb_baru.bundle` memperbarui statistik `StandardScaler` dengan `partial_fit`, memindahkan threshold pohon lama ke skala yang baru, lalu melanjutkan boosting (`xgb_model=`) pada baris baru saja. Dengan `--base`, hasilnya dibandingkan dengan latih ulang penuh dan selisih accuracy/F1 dicetak sebagai dasar keputusan kapan rebuild penuh diperlukan.
+# - Untuk menggabungkan survei BRFSS beberapa tahun (jutaan baris) yang tidak muat di RAM, `python -m diabetes.external shard shards/ --csv <csv>` memecah data menjadi shard Parquet/NPY, lalu `python -m diabetes.external train shards/ --params '<best_params JSON>' --output models/diabetes_xgb_external.bundle` melatih model yang setara `best_model` lewat `xgboost.DataIter`: normalisasi dan SMOTE diterapkan per batch saat dibaca, dan halaman data XGBoost disimpan di disk sehingga puncak memori ditentukan oleh `--batch-rows`, bukan oleh jumlah baris. `python -m diabetes.external benchmark shards/` membandingkan waktu, puncak RSS, dan metriknya dengan jalur in-memory seperti di notebook ini.
+
+
+X_test_raw = X_test.to_numpy()
+raw_forest = load_bundle(bundle_path).forest
+raw_proba = raw_forest.inplace_predict(X_test_raw)
+print(
+    "Selisih maks probabilitas XGBoost (fitur mentah vs ter-normalisasi):",
+    np.abs(raw_proba - best_model.predict_proba(X_test_scaled)[:, 1]).max(),
+)
+
+raw_logreg = fold_linear(models["Logistic_Regression"], scaler.mean_, scaler.scale_)
+print(
+    "Kesamaan prediksi Logistic Regression (fitur mentah vs ter-normalisasi):",
+    np.mean(raw_logreg.predict(X_test_raw) == models["Logistic_Regression"].predict(X_test_scaled)),
+)
+
+
+# Penjelasan:
+# - `StandardScaler` **dilipat ke dalam model** sehingga inferensi dapat langsung memakai kode fitur mentah (uint8) tanpa `scaler.transform`.
+# - Pada XGBoost, split pohon tidak berubah oleh transformasi monoton per fitur: setiap threshold diubah ke ruang mentah menjadi `k - 0.5`, dengan `k` kode integer terkecil yang nilai terskalanya melewati threshold asal. Karena itu setiap kode dalam domain skema mengikuti cabang yang persis sama. Pohon yang sudah dilipat ini disimpan di dalam bundle (`bundle.forest`).
+# - Pada Logistic Regression, koefisien dan intercept menyerap transformasi afine: `w_mentah = w / scale` dan `b_mentah = b - w_mentah · mean`.
+# - Kedua pemeriksaan di atas menunjukkan prediksi pada fitur mentah identik dengan prediksi pada fitur ter-normalisasi, sementara salinan float64 setiap batch pada jalur inferensi hilang.
+
+
+profiler.start("evaluasi akhir", rows=len(X_test_scaled))
 y_test_pred = best_model.predict(X_test_scaled)
 print('y_test_pred[:10]:', y_test_pred[:10])
 
@@ -964,38 +799,14 @@ print("🔍 Model: XGBoost_BayesianOpt")
 print(f"Test Accuracy     : {test_accuracy:.4f}")
 print(f"Test F1 Score     : {test_f1:.4f}")
 print("=" * 40)
-
-fig, axes = plt.subplots(1, 2, figsize=(16, 5))
-
-cr_test_df = pd.DataFrame(cr_test).T
-cr_test_df = cr_test_df.iloc[:-1, :]
-sns.heatmap(
-    cr_test_df,
-    annot=True,
-    fmt=".2f",
-    cmap="coolwarm",
-    linewidths=0.5,
-    ax=axes[0],
-    cbar=False,
-)
-axes[0].set_title("Classification Report (Test) - XGBoost_BayesianOpt", fontsize=12)
-axes[0].set_ylabel("Classes", fontsize=10)
-axes[0].set_xlabel("Metrics", fontsize=10)
-
-sns.heatmap(cm_test, annot=True, fmt="d", cmap="Blues", linewidths=0.5, ax=axes[1])
-axes[1].set_title("Confusion Matrix (Test) - XGBoost_BayesianOpt", fontsize=12)
-axes[1].set_xlabel("Predicted Label", fontsize=10)
-axes[1].set_ylabel("True Label", fontsize=10)
-
-plt.tight_layout()
-plt.show()
-
-plt.savefig(
-    os.path.join(
-        plot_dir, "9.XGBoost_BayesianOpt_classification_report_confusion_matrix.png"
-    ),
-    dpi=300,
-    bbox_inches="tight",
+profiler.stop()
+
+plots.submit(
+    "9.XGBoost_BayesianOpt_classification_report_confusion_matrix.png",
+    figures.classification_report_confusion_matrix,
+    cr_test,
+    cm_test,
+    "XGBoost_BayesianOpt",
 )
 
 
@@ -1030,29 +841,26 @@ plt.savefig(
 # - **True Negatives (TN)**: 37.728 → non-diabetes yang diprediksi dengan benar (sangat tinggi).
 
 importances = best_model.feature_importances_
-feature_names = X.columns
 
 importance_df = pd.DataFrame(
     {"Feature": feature_names, "Importance": importances}
 ).sort_values(by="Importance", ascending=False)
 
-plt.figure(figsize=(10, 6))
-sns.barplot(
-    data=importance_df.head(15),
-    x="Importance",
-    y="Feature",
-    hue="Feature",
-    palette="viridis",
-    dodge=False,
-    legend=False,
+plots.submit(
+    "10.XGBoost_BayesianOpt_feature_importance.png",
+    figures.feature_importance,
+    importance_df,
+    "XGBoost_BayesianOpt",
 )
-plt.title("Top 15 Feature Importance - XGBoost_BayesianOpt", fontsize=14)
-plt.xlabel("Importance Score")
-plt.ylabel("Feature")
-plt.tight_layout()
-plt.savefig(
-    os.path.join(plot_dir, "10.XGBoost_BayesianOpt_feature_importance.png"),
-    dpi=300,
-    bbox_inches="tight",
-)
-plt.show()
+
+profiler.start("render plot")
+plots.wait()
+plots.display()
+profiler.stop()
+
+profiler.report()
+
+
+# Penjelasan:
+# - `plots.wait()` menunggu seluruh figur yang dijadwalkan selesai dirender dan disimpan ke folder `plots`, lalu memperbarui cache fingerprint render.
+# - `plots.display()` menampilkan file PNG yang sudah tersimpan apabila skrip dijalankan di Jupyter/IPython; pada eksekusi headless langkah ini tidak melakukan apa-apa.
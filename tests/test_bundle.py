@@ -0,0 +1,56 @@
+"""Round-trip dan waktu muat dingin `diabetes.bundle`."""
+
+import numpy as np
+import pytest
+import xgboost as xgb
+from sklearn.preprocessing import StandardScaler
+
+from diabetes.bundle import BundleError, load_bundle, measure_load_time, save_bundle
+from diabetes.synthetic import TARGET, synthetic_brfss
+
+# Batas longgar agar tidak rapuh di mesin CI yang lambat; nilai sebenarnya
+# (umumnya beberapa milidetik) dilaporkan di output pytest (`-s`).
+MAX_COLD_LOAD_MS = 500
+
+
+@pytest.fixture(scope="module")
+def trained(tmp_path_factory):
+    frame = synthetic_brfss(5_000, random_state=0)
+    features = [col for col in frame.columns if col != TARGET]
+    X_raw = frame[features].to_numpy()
+    scaler = StandardScaler().fit(X_raw)
+    X = scaler.transform(X_raw)
+    model = xgb.XGBClassifier(n_estimators=20, max_depth=4, eval_metric="logloss")
+    model.fit(X, frame[TARGET].to_numpy())
+    path = str(tmp_path_factory.mktemp("bundle") / "model.bundle")
+    save_bundle(path, model.get_booster(), scaler, features, threshold=0.4, params={"n_estimators": 20})
+    return {"path": path, "model": model, "scaler": scaler, "features": features, "X": X, "X_raw": X_raw}
+
+
+def test_round_trip_predictions(trained):
+    bundle = load_bundle(trained["path"], verify=True)
+    assert bundle.features == trained["features"]
+    assert bundle.threshold == 0.4
+    assert bundle.meta["params"] == {"n_estimators": 20}
+    np.testing.assert_array_equal(bundle.mean, trained["scaler"].mean_)
+    np.testing.assert_array_equal(bundle.scale, trained["scaler"].scale_)
+
+    expected = trained["model"].predict_proba(trained["X"])[:, 1]
+    np.testing.assert_array_equal(bundle.booster.inplace_predict(trained["X"]), expected)
+    # Pohon yang diratakan menerima fitur mentah tanpa normalisasi.
+    np.testing.assert_allclose(bundle.forest.inplace_predict(trained["X_raw"]), expected, atol=1e-6)
+
+
+def test_corrupted_payload_fails_verification(trained, tmp_path):
+    data = bytearray(open(trained["path"], "rb").read())
+    data[-1] ^= 0xFF
+    corrupted = tmp_path / "corrupted.bundle"
+    corrupted.write_bytes(bytes(data))
+    with pytest.raises(BundleError):
+        load_bundle(str(corrupted), verify=True)
+
+
+def test_cold_load_time(trained):
+    timings = measure_load_time(trained["path"], repeat=10, verify=True)
+    print(f"\nwaktu muat dingin bundle: median {timings['median_ms']:.2f} ms, maks {timings['max_ms']:.2f} ms")
+    assert timings["median_ms"] < MAX_COLD_LOAD_MS
@@ -0,0 +1,52 @@
+"""`ChunkedSMOTE` dibandingkan dengan `imblearn.over_sampling.SMOTE`."""
+
+import numpy as np
+import pytest
+from imblearn.over_sampling import SMOTE
+
+from diabetes.oversampling import ChunkedSMOTE
+from diabetes.synthetic import TARGET, synthetic_brfss
+
+
+@pytest.fixture(scope="module")
+def tied():
+    """Kode BRFSS mentah: banyak baris kembar sehingga jarak tetangga sering seri."""
+    frame = synthetic_brfss(2_000, random_state=0)
+    X = frame.drop(columns=TARGET).to_numpy(dtype=np.float64)
+    return X, frame[TARGET].to_numpy()
+
+
+def test_deterministic_across_chunks_and_jobs(tied):
+    X, y = tied
+    X_ref, y_ref = ChunkedSMOTE(random_state=0).fit_resample(X, y)
+    X_alt, y_alt = ChunkedSMOTE(random_state=0, chunk_size=97, n_jobs=3, block_bytes=2**16).fit_resample(X, y)
+    np.testing.assert_array_equal(X_alt, X_ref)
+    np.testing.assert_array_equal(y_alt, y_ref)
+
+
+def test_matches_imblearn_without_ties():
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((600, 8))
+    y = (rng.random(600) < 0.2).astype(int)
+    X_ref, y_ref = SMOTE(random_state=0).fit_resample(X, y)
+    X_out, y_out = ChunkedSMOTE(random_state=0).fit_resample(X, y)
+    np.testing.assert_array_equal(X_out, X_ref)
+    np.testing.assert_array_equal(y_out, y_ref)
+
+
+def test_matches_imblearn_up_to_tied_neighbours(tied):
+    X, y = tied
+    smote = SMOTE(random_state=0)
+    X_ref, y_ref = smote.fit_resample(X, y)
+    X_out, y_out = ChunkedSMOTE(random_state=0).fit_resample(X, y)
+    assert X_out.shape == X_ref.shape
+    np.testing.assert_array_equal(y_out, y_ref)
+    np.testing.assert_array_equal(X_out[: len(X)], X)
+
+    # Urutan tetangga berjarak sama boleh berbeda, tetapi jarak ke-k tetangga
+    # setiap baris minoritas harus sama dengan pencarian tetangga imblearn.
+    (plan,) = ChunkedSMOTE(random_state=0).plan(X, y)
+    X_class = X[plan["indices"]]
+    expected, _ = smote.nn_k_.kneighbors(X_class)
+    chosen = np.linalg.norm(X_class[plan["neighbors"]] - X_class[:, None], axis=2)
+    np.testing.assert_allclose(chosen, expected[:, 1:], rtol=1e-12)